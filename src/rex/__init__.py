@@ -1,6 +1,6 @@
 """rex - Remote execution tool for Python and shell commands."""
 
-from importlib.metadata import version, PackageNotFoundError
+from typing import Any
 
 from rex.exceptions import (
     RexError,
@@ -12,11 +12,6 @@ from rex.exceptions import (
     SlurmError,
 )
 
-try:
-    __version__ = version("rex")
-except PackageNotFoundError:
-    __version__ = "0.0.0.dev0"  # Fallback for editable installs without scm
-
 __all__ = [
     "__version__",
     "RexError",
@@ -27,3 +22,28 @@ __all__ = [
     "ExecutionError",
     "SlurmError",
 ]
+
+
+def _load_version() -> str:
+    """Return the installed rex version."""
+    # Prefer the version file setuptools-scm writes at build time; reading
+    # installed-dist metadata costs more than the rest of `rex -V` combined.
+    try:
+        from rex._version import __version__
+    except ImportError:
+        from importlib.metadata import version, PackageNotFoundError
+
+        try:
+            return version("rex")
+        except PackageNotFoundError:
+            return "0.0.0.dev0"  # Fallback for editable installs without scm
+    return __version__
+
+
+def __getattr__(name: str) -> Any:
+    # __version__ is resolved on first access; most commands never print it
+    if name == "__version__":
+        value = _load_version()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,42 +2,101 @@
 
 from __future__ import annotations
 
-import argparse
+import functools
+import importlib
+import operator
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
-from rex import __version__
-from rex.config import GlobalConfig, HostConfig, ProjectConfig, ResolvedConfig
+from rex import fastargs
 from rex.exceptions import RexError, ValidationError, ConfigError
-from rex.execution import (
-    DirectExecutor,
-    ExecutionContext,
-    Executor,
-    SlurmExecutor,
-    SlurmOptions,
-)
-from rex.output import error, setup_logging
-from rex.ssh import SSHExecutor, FileTransfer
-from rex.utils import (
-    validate_job_name,
-    validate_slurm_time,
-    validate_memory,
-    validate_gres,
-    validate_cpus,
-)
+
+if TYPE_CHECKING:
+    import argparse
+    from types import ModuleType, SimpleNamespace
+
+    from rex.config import HostConfig, ProjectConfig, ResolvedConfig
+    from rex.execution import ExecutionContext, Executor, JobInfo
+    from rex.ssh import FileTransfer, SSHExecutor
+
+    # Parsed arguments, from fastargs or the argparse fallback
+    Args = argparse.Namespace | SimpleNamespace
 
 # Global debug flag
 DEBUG = False
 
+# Command handlers as (module, function), imported only when dispatched so
+# that --help, --version and validation errors never load SSH/SLURM/config.
+_HANDLERS: dict[str, tuple[str, str]] = {
+    "connect": ("rex.commands.connection", "connect"),
+    "disconnect": ("rex.commands.connection", "disconnect"),
+    "connection_status": ("rex.commands.connection", "connection_status"),
+    "manual_ssh": ("rex.commands.connection", "manual_ssh"),
+    "list_jobs": ("rex.commands.jobs", "list_jobs"),
+    "list_all_jobs": ("rex.commands.jobs", "list_all_jobs"),
+    "get_status": ("rex.commands.jobs", "get_status"),
+    "kill_job": ("rex.commands.jobs", "kill_job"),
+    "watch_jobs": ("rex.commands.jobs", "watch_jobs"),
+    "show_info": ("rex.commands.info", "show_info"),
+    "show_slurm_info": ("rex.commands.info", "show_slurm_info"),
+    "push": ("rex.commands.transfer", "push"),
+    "pull": ("rex.commands.transfer", "pull"),
+    "sync": ("rex.commands.transfer", "sync"),
+    "build": ("rex.commands.build", "build"),
+    "exec_command": ("rex.commands.exec", "exec_command"),
+    "read_remote": ("rex.commands.read", "read_remote"),
+}
+
+
+# Command flags as (args attribute, display name); at most one may be set
+_CMD_FLAGS: tuple[tuple[str, str], ...] = (
+    ("jobs", "--jobs"),
+    ("status", "--status"),
+    ("log", "--log"),
+    ("kill", "--kill"),
+    ("watch", "--watch"),
+    ("info", "--info"),
+    ("push", "--push"),
+    ("pull", "--pull"),
+    ("sync", "--sync"),
+    ("build", "--build"),
+    ("exec_cmd", "--exec"),
+    ("read_path", "--read"),
+    ("connect", "--connect"),
+    ("disconnect", "--disconnect"),
+    ("connection", "--connection"),
+    ("manual", "--manual"),
+)
+_CMD_GET = operator.attrgetter(*(attr for attr, _ in _CMD_FLAGS))
+# Commands selected even by an empty value (--watch, --read with no argument);
+# any other command needs a truthy value
+_EMPTY_OK = frozenset({"watch", "sync", "read_path"})
+_EMPTY_OK_BITS = tuple(attr in _EMPTY_OK for attr, _ in _CMD_FLAGS)
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="rex",
-        description="Remote execution tool for Python and shell commands",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=True,
-        epilog="""
+
+@functools.cache
+def _handler_module(module: str) -> ModuleType:
+    """Import a command module once; later dispatches skip the import lock."""
+    return importlib.import_module(module)
+
+
+def _handler(name: str) -> Callable[..., Any]:
+    """Import and return a command handler from the dispatch table."""
+    module, attr = _HANDLERS[name]
+    return getattr(_handler_module(module), attr)
+
+
+def _last_job_id(executor: Executor, target: str) -> str:
+    """Resolve --last to the most recent job ID (briefly cached per target)."""
+    from rex import jobcache
+
+    job_id = jobcache.last_job_id(executor, target)
+    if not job_id:
+        raise ValidationError("No jobs found")
+    return job_id
+
+
+_EPILOG = """
 Examples:
   rex HOST --exec "python train.py"    # run command
   rex HOST -d --exec "python train.py" # run detached (background)
@@ -54,12 +113,29 @@ Examples:
   rex HOST --connect                   # open persistent connection
   rex HOST --disconnect                # close connection when done
   rex HOST --manual                    # open interactive SSH session
-""",
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build argument parser.
+
+    Cached: parsing keeps its state on the returned Namespace, so one
+    parser can serve every call in a long-lived process.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="rex",
+        description="Remote execution tool for Python and shell commands",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=True,
+        epilog=_EPILOG,
     )
 
     # Version
     parser.add_argument(
-        "-V", "--version", action="version", version=f"%(prog)s {__version__}"
+        "-V", "--version", action="version", version=f"%(prog)s {_version()}"
     )
 
     # Target
@@ -164,8 +240,22 @@ Examples:
     return parser
 
 
+# SLURM options merged CLI > project > host, as (name, gpu_only).
+# Host-level gres/constraint/prefer are typically GPU-specific (e.g.,
+# GPU_SKU:H100), so only apply them on GPU jobs. CLI and project-level
+# values always apply.
+_MERGE_FIELDS: tuple[tuple[str, bool], ...] = (
+    ("gres", True),
+    ("time", False),
+    ("cpus", False),
+    ("mem", False),
+    ("constraint", True),
+    ("prefer", True),
+)
+
+
 def merge_configs(
-    args: argparse.Namespace,
+    args: Args,
     project: ProjectConfig | None,
     host_config: HostConfig | None,
 ) -> tuple[
@@ -184,6 +274,8 @@ def merge_configs(
 
     Returns (partition, gres, time, cpus, mem, constraint, prefer, modules, use_gpu, env).
     """
+    from rex.config import HostConfig
+
     # Get host config values or defaults
     hc = host_config or HostConfig()
 
@@ -221,33 +313,14 @@ def merge_configs(
             partition = cpu_partition
 
     # Merge other SLURM options (CLI > project > host)
-    def pick(
-        cli_val: str | int | None,
-        proj_val: str | int | None,
-        host_val: str | int | None,
-    ) -> str | int | None:
-        if cli_val is not None:
-            return cli_val
-        if proj_val is not None:
-            return proj_val
-        return host_val
-
-    gres = pick(
-        args.gres, project.gres if project else None, hc.gres if use_gpu else None
-    )
-    time = pick(args.time, project.time if project else None, hc.time)
-    cpus = pick(args.cpus, project.cpus if project else None, hc.cpus)
-    mem = pick(args.mem, project.mem if project else None, hc.mem)
-    # Host-level constraint/prefer are typically GPU-specific (e.g., GPU_SKU:H100),
-    # so only apply them on GPU jobs. CLI and project-level values always apply.
-    constraint = pick(
-        args.constraint,
-        project.constraint if project else None,
-        hc.constraint if use_gpu else None,
-    )
-    prefer = pick(
-        args.prefer, project.prefer if project else None, hc.prefer if use_gpu else None
-    )
+    merged: dict[str, Any] = {}
+    for name, gpu_only in _MERGE_FIELDS:
+        value = getattr(args, name)
+        if value is None and project is not None:
+            value = getattr(project, name)
+        if value is None and (use_gpu or not gpu_only):
+            value = getattr(hc, name)
+        merged[name] = value or None
 
     # Merge modules (CLI > project > host)
     if args.modules:
@@ -255,7 +328,7 @@ def merge_configs(
     elif project and project.modules is not None:
         modules = project.modules
     else:
-        modules = hc.modules
+        modules = list(hc.modules)
 
     # Merge env (host < project, combined)
     env: dict[str, str] = {}
@@ -263,15 +336,14 @@ def merge_configs(
     if project:
         env.update(project.env)
 
-    # Cast to proper types for return (pick returns str | int | None but we know the actual types)
     return (
-        str(partition) if partition else None,
-        str(gres) if gres else None,
-        str(time) if time else None,
-        int(cpus) if cpus else None,
-        str(mem) if mem else None,
-        str(constraint) if constraint else None,
-        str(prefer) if prefer else None,
+        partition or None,
+        merged["gres"],
+        merged["time"],
+        merged["cpus"],
+        merged["mem"],
+        merged["constraint"],
+        merged["prefer"],
         modules,
         use_gpu,
         env,
@@ -292,6 +364,8 @@ def resolve_paths(
     if not project:
         return None, None
 
+    from rex.config import HostConfig
+
     hc = host_config or HostConfig()
 
     # Resolve code_dir
@@ -314,7 +388,7 @@ def resolve_paths(
 
 
 def resolve_config(
-    args: argparse.Namespace,
+    args: Args,
     project: ProjectConfig | None,
     host_config: HostConfig | None,
 ) -> ResolvedConfig:
@@ -322,6 +396,9 @@ def resolve_config(
 
     Combines merge_configs() and resolve_paths() into a single ResolvedConfig.
     """
+    from rex.config import ResolvedConfig
+    from rex.execution import ExecutionContext, SlurmOptions
+
     partition, gres, time, cpus, mem, constraint, prefer, modules, _, env = (
         merge_configs(args, project, host_config)
     )
@@ -331,7 +408,7 @@ def resolve_config(
         modules=modules,
         code_dir=code_dir,
         run_dir=run_dir,
-        env=env if env else None,
+        env=env,
     )
 
     use_slurm = bool(host_config and host_config.slurm)
@@ -366,103 +443,284 @@ def main(argv: list[str] | None = None) -> int:
     try:
         return _main(argv)
     except RexError as e:
+        from rex.output import error
+
         error(e.message, exit_now=False)
         return e.exit_code
     except KeyboardInterrupt:
         return 130
 
 
-def _validate_flag_conflicts(args: argparse.Namespace) -> None:
-    """Validate that conflicting flags are not used together."""
+def _cmd_mask(*attrs: str) -> int:
+    """Return the _CMD_FLAGS bitmask for the given command attributes."""
+    bits = {attr: 1 << i for i, (attr, _) in enumerate(_CMD_FLAGS)}
+    return sum(bits[attr] for attr in attrs)
+
+
+# Modifier flags as (args attribute, display name, bitmask of the commands
+# it is valid with). Checked only when the modifier is actually set.
+_MODIFIER_FLAGS: tuple[tuple[str, str, int], ...] = (
+    ("follow", "--follow", _cmd_mask("log", "watch")),
+    ("clean", "--clean", _cmd_mask("build")),
+    ("last", "--last", _cmd_mask("status", "log", "kill", "watch")),
+    ("since", "--since", _cmd_mask("jobs")),
+    ("login_node", "--login-node", _cmd_mask("exec_cmd")),
+    ("code_dir", "--code-dir", _cmd_mask("exec_cmd")),
+)
+
+
+def _requires_text(required: int) -> str:
+    """Join a bitmask's command names ('--a or --b', '--a, --b, or --c')."""
+    names = [name for i, (_, name) in enumerate(_CMD_FLAGS) if required >> i & 1]
+    if len(names) <= 2:
+        return " or ".join(names)
+    return f"{', '.join(names[:-1])}, or {names[-1]}"
+
+
+def _validate_flag_conflicts(args: Args) -> str | None:
+    """Validate that conflicting flags are not used together.
+
+    Returns the args attribute of the selected command, or None.
+    """
     # Command flags - only one allowed
-    commands = []
-    if args.jobs:
-        commands.append("--jobs")
-    if args.status:
-        commands.append("--status")
-    if args.log:
-        commands.append("--log")
-    if args.kill:
-        commands.append("--kill")
-    if args.watch is not None:
-        commands.append("--watch")
-    if args.info:
-        commands.append("--info")
-    if args.push:
-        commands.append("--push")
-    if args.pull:
-        commands.append("--pull")
-    if args.sync is not None:
-        commands.append("--sync")
-    if args.build:
-        commands.append("--build")
-    if args.exec_cmd:
-        commands.append("--exec")
-    if args.read_path is not None:
-        commands.append("--read")
-    if args.connect:
-        commands.append("--connect")
-    if args.disconnect:
-        commands.append("--disconnect")
-    if args.connection:
-        commands.append("--connection")
-    if args.manual:
-        commands.append("--manual")
+    mask = 0
+    for i, (value, empty_ok) in enumerate(zip(_CMD_GET(args), _EMPTY_OK_BITS)):
+        mask |= (value is not None if empty_ok else bool(value)) << i
 
-    if len(commands) > 1:
+    if mask.bit_count() > 1:
+        commands = [name for i, (_, name) in enumerate(_CMD_FLAGS) if mask >> i & 1]
         raise ValidationError(f"Conflicting commands: {', '.join(commands)}")
 
     # --gpu and --cpu are mutually exclusive
     if args.gpu and args.cpu:
         raise ValidationError("--gpu and --cpu are mutually exclusive")
 
-    # --follow only valid with --log
-    if args.follow and not args.log:
-        raise ValidationError("--follow requires --log")
+    # Modifiers: each needs one of its commands in mask
+    for attr, name, required in _MODIFIER_FLAGS:
+        if getattr(args, attr) and not mask & required:
+            raise ValidationError(f"{name} requires {_requires_text(required)}")
+
+    if not mask:
+        return None  # e.g. --exec "" does not select a command
+    return _CMD_FLAGS[mask.bit_length() - 1][0]
+
+
+def _version() -> str:
+    """Return the rex version, loading it only when asked for."""
+    import rex
+
+    return rex.__version__
+
+
+def _argparse(argv: list[str]) -> argparse.Namespace:
+    """Parse argv with argparse (for whatever fastargs declines).
+
+    rex has one positional, so a single parse_known_args pass gives the
+    same result as parse_intermixed_args whenever it consumes every token.
+    Leftovers and "--" take the intermixed path, which also produces the
+    usual error messages.
+    """
+    parser = build_parser()
+    if "--" not in argv:
+        args, extras = parser.parse_known_args(argv)
+        if not extras:
+            return args
+    return parser.parse_intermixed_args(argv)
+
+
+def _wants_version(argv: list[str]) -> bool:
+    """Return True if argv asks for --version (argparse would print and exit)."""
+    for arg in argv:
+        if arg == "--":
+            return False
+        if arg in ("-V", "--version"):
+            return True
+    return False
+
+
+class _Invocation(NamedTuple):
+    """Resolved state handed to a command runner."""
+
+    args: Args
+    target: str
+    ssh: SSHExecutor
+    executor: Executor
+    ctx: ExecutionContext
+    config: ResolvedConfig
+    project: ProjectConfig | None
+
+
+def _job_id(inv: _Invocation, value: str) -> str:
+    """Resolve a job ID argument, honouring --last."""
+    if inv.args.last or value == "--last":
+        return _last_job_id(inv.executor, inv.target)
+    return value
+
+
+def _submitted(inv: _Invocation, result: int | JobInfo) -> int:
+    """Return the exit code for a possibly detached run.
+
+    Foreground runs write job metadata too, so either way the cached
+    --last answer is dropped.
+    """
+    from rex import jobcache
+
+    jobcache.invalidate(inv.target)
+    return result if isinstance(result, int) else 0
 
-    # --clean only valid with --build
-    if args.clean and not args.build:
-        raise ValidationError("--clean requires --build")
 
-    # --last only valid with job commands
-    job_commands = args.status or args.log or args.kill or args.watch is not None
-    if args.last and not job_commands:
-        raise ValidationError("--last requires --status, --log, --kill, or --watch")
+def _file_transfer(inv: _Invocation) -> FileTransfer:
+    """Create a FileTransfer for the target."""
+    from rex.ssh import FileTransfer
 
-    # --since only valid with --jobs
-    if args.since and not args.jobs:
-        raise ValidationError("--since requires --jobs")
+    return FileTransfer(inv.target, inv.ssh)
 
-    # --login-node and --code-dir only valid with --exec
-    if args.login_node and not args.exec_cmd:
-        raise ValidationError("--login-node requires --exec")
-    if args.code_dir and not args.exec_cmd:
-        raise ValidationError("--code-dir requires --exec")
+
+def _run_connect(inv: _Invocation) -> int:
+    return _handler("connect")(inv.target)
+
+
+def _run_disconnect(inv: _Invocation) -> int:
+    return _handler("disconnect")(inv.target)
+
+
+def _run_manual(inv: _Invocation) -> int:
+    return _handler("manual_ssh")(inv.ssh)
+
+
+def _run_jobs(inv: _Invocation) -> int:
+    return _handler("list_jobs")(inv.executor, inv.args.json, inv.args.since or 0)
+
+
+def _run_status(inv: _Invocation) -> int:
+    job_id = _job_id(inv, inv.args.status)
+    return _handler("get_status")(inv.executor, job_id, inv.args.json)
+
+
+def _run_log(inv: _Invocation) -> int:
+    if inv.args.last or inv.args.log == "--last":
+        return inv.executor.show_last_log(inv.args.follow)
+    return inv.executor.show_log(inv.args.log, inv.args.follow)
+
+
+def _run_kill(inv: _Invocation) -> int:
+    from rex import jobcache
+
+    job_id = _job_id(inv, inv.args.kill)
+    jobcache.invalidate(inv.target)
+    return _handler("kill_job")(inv.executor, job_id)
+
+
+def _run_watch(inv: _Invocation) -> int:
+    job_ids = inv.args.watch
+    if not job_ids or inv.args.last:
+        job_ids = [_last_job_id(inv.executor, inv.target)]
+    return _handler("watch_jobs")(inv.executor, job_ids, inv.args.json, inv.args.follow)
+
+
+def _run_info(inv: _Invocation) -> int:
+    if inv.config.slurm:
+        return _handler("show_slurm_info")(inv.ssh, inv.config.slurm.partition)
+    return _handler("show_info")(inv.ssh, inv.target, inv.args.json)
+
+
+def _run_push(inv: _Invocation) -> int:
+    push = inv.args.push
+    remote = push[1] if len(push) > 1 else None
+    return _handler("push")(_file_transfer(inv), push[0], remote)
+
+
+def _run_pull(inv: _Invocation) -> int:
+    pull = inv.args.pull
+    local = pull[1] if len(pull) > 1 else None
+    return _handler("pull")(_file_transfer(inv), pull[0], local)
+
+
+def _run_sync(inv: _Invocation) -> int:
+    local_path = inv.args.sync if inv.args.sync != "." else None
+    return _handler("sync")(_file_transfer(inv), inv.config, local_path)
+
+
+def _run_build(inv: _Invocation) -> int:
+    if not inv.project:
+        raise ConfigError("No .rex.toml found")
+    return _submitted(inv, _handler("build")(inv.executor, inv.ctx, inv.args.clean))
+
+
+def _run_exec(inv: _Invocation) -> int:
+    args = inv.args
+    executor = inv.executor
+    ctx = inv.ctx
+
+    # --login-node: bypass SLURM, run directly on login node
+    if args.login_node:
+        from rex.execution import DirectExecutor
+
+        executor = DirectExecutor(inv.ssh)
+
+    # --code-dir: use code_dir as working directory
+    if args.code_dir:
+        from dataclasses import replace
+
+        ctx = replace(ctx, run_dir=ctx.code_dir)
+
+    result = _handler("exec_command")(
+        executor, ctx, args.exec_cmd, args.detach, args.name
+    )
+    return _submitted(inv, result)
+
+
+def _run_read(inv: _Invocation) -> int:
+    # Always run on login node
+    path = inv.args.read_path or inv.ctx.code_dir
+    if not path:
+        raise ConfigError("No path specified and code_dir not configured")
+    return _handler("read_remote")(inv.ssh, path)
+
+
+# Command runners keyed by _CMD_FLAGS attribute (--connection is handled
+# before an executor exists). Those in _NO_CHECK skip the connection check.
+_RUNNERS: dict[str, Callable[[_Invocation], int]] = {
+    "connect": _run_connect,
+    "disconnect": _run_disconnect,
+    "manual": _run_manual,
+    "jobs": _run_jobs,
+    "status": _run_status,
+    "log": _run_log,
+    "kill": _run_kill,
+    "watch": _run_watch,
+    "info": _run_info,
+    "push": _run_push,
+    "pull": _run_pull,
+    "sync": _run_sync,
+    "build": _run_build,
+    "exec_cmd": _run_exec,
+    "read_path": _run_read,
+}
+_NO_CHECK = frozenset({"connect", "disconnect", "manual"})
 
 
 def _main(argv: list[str] | None = None) -> int:
     """Internal main function that may raise RexError."""
-    parser = build_parser()
-    args = parser.parse_intermixed_args(argv)
+    # Fast path for plain invocations; argparse handles help, version,
+    # and anything the fast parser rejects (including error messages).
+    raw = sys.argv[1:] if argv is None else argv
+    if _wants_version(raw):
+        print(f"rex {_version()}")
+        return 0
+
+    args = fastargs.parse(raw) or _argparse(raw)
 
     # Validate flag conflicts early
-    _validate_flag_conflicts(args)
+    command = _validate_flag_conflicts(args)
 
-    # Special case: --connection without target lists all
-    if args.connection and not args.target:
-        from rex.commands.connection import connection_status
+    from rex.config import GlobalConfig
 
-        return connection_status(None)
+    global_config = GlobalConfig.load()
 
     # Special case: --jobs without target lists all
     if args.jobs and not args.target:
-        from rex.commands.jobs import list_all_jobs
-
-        return list_all_jobs(GlobalConfig.load(), args.json, args.since or 0)
-
-    # Load configs
-    global_config = GlobalConfig.load()
-    project = ProjectConfig.find_and_load()
+        return _handler("list_all_jobs")(global_config, args.json, args.since or 0)
 
     # Resolve target
     target = args.target
@@ -475,23 +733,32 @@ def _main(argv: list[str] | None = None) -> int:
             alias_name = target
             target = expanded
 
-    if not target:
-        # Check if this is a command that doesn't need target
-        if args.connection:
-            from rex.commands.connection import connection_status
+    # --connection needs no executor; without a target it lists all
+    if args.connection:
+        return _handler("connection_status")(target)
 
-            return connection_status(None)
-        parser.print_help()
+    if not target:
+        build_parser().print_help()
         return 1
 
+    from rex.config import ProjectConfig
+
+    project = ProjectConfig.find_and_load()
+
+    from rex.execution import DirectExecutor
+    from rex.output import setup_logging
+    from rex.ssh import SSHExecutor
+    from rex.utils import (
+        validate_job_name,
+        validate_slurm_time,
+        validate_memory,
+        validate_gres,
+        validate_cpus,
+    )
+
     # Get host config for the alias
     host_config = global_config.get_host_config(alias_name) if alias_name else None
 
-    # Set debug mode
-    global DEBUG
-    DEBUG = args.debug
-    setup_logging(debug=args.debug)
-
     # Create SSH executor
     ssh = SSHExecutor(target, verbose=args.debug)
 
@@ -499,17 +766,19 @@ def _main(argv: list[str] | None = None) -> int:
     config = resolve_config(args, project, host_config)
 
     # Use execution context from resolved config
-    ctx = config.execution or ExecutionContext()
+    ctx = config.execution
 
     # Create executor
     executor: Executor
     if config.slurm:
+        from rex.execution import SlurmExecutor
+
         executor = SlurmExecutor(ssh, config.slurm)
     else:
         executor = DirectExecutor(ssh)
 
-    # Validate job name if provided
-    if args.name:
+    # Validate job name when --exec will use it (before any SSH round-trip)
+    if args.name and args.exec_cmd:
         try:
             validate_job_name(args.name)
         except ValueError as e:
@@ -534,165 +803,41 @@ def _main(argv: list[str] | None = None) -> int:
                 f"SLURM options {', '.join(used)} require a SLURM host"
             )
 
-    # Validate SLURM options
-    try:
-        slurm_opts = config.slurm
-        if slurm_opts:
-            if slurm_opts.time:
-                validate_slurm_time(slurm_opts.time)
-            if slurm_opts.mem:
-                validate_memory(slurm_opts.mem)
-            if slurm_opts.gres:
-                validate_gres(slurm_opts.gres)
-            if slurm_opts.cpus:
-                validate_cpus(slurm_opts.cpus)
-    except ValueError as e:
-        raise ValidationError(str(e))
-
-    # Dispatch commands
-    if args.connect:
-        from rex.commands.connection import connect
-
-        return connect(target)
-
-    if args.disconnect:
-        from rex.commands.connection import disconnect
-
-        return disconnect(target)
-
-    if args.connection:
-        from rex.commands.connection import connection_status
-
-        return connection_status(target)
-
-    if args.manual:
-        from rex.commands.connection import manual_ssh
+    # Validate SLURM options, reporting every problem at once
+    slurm_opts = config.slurm
+    if slurm_opts:
+        problems: list[str] = []
+        for check, value in (
+            (validate_slurm_time, slurm_opts.time),
+            (validate_memory, slurm_opts.mem),
+            (validate_gres, slurm_opts.gres),
+            (validate_cpus, slurm_opts.cpus),
+        ):
+            if value:
+                try:
+                    check(value)
+                except ValueError as e:
+                    problems.append(str(e))
+        if problems:
+            raise ValidationError("; ".join(problems))
+
+    # Set debug mode. rex only logs at DEBUG level, so without --debug the
+    # handler would never emit and is not installed.
+    global DEBUG
+    DEBUG = args.debug
+    if args.debug:
+        setup_logging(debug=True)
 
-        return manual_ssh(ssh)
+    if command is None:
+        build_parser().print_help()
+        return 1
 
     # Verify SSH connection works before running any commands
-    ssh.check_connection()
-
-    if args.jobs:
-        from rex.commands.jobs import list_jobs
-
-        return list_jobs(executor, args.json, args.since or 0)
-
-    if args.status:
-        from rex.commands.jobs import get_status
-
-        job_id = args.status
-        if args.last or job_id == "--last":
-            job_id = executor.last_job_id()
-            if not job_id:
-                raise ValidationError("No jobs found")
-        return get_status(executor, job_id, args.json)
-
-    if args.log:
-        job_id = args.log
-        if args.last or job_id == "--last":
-            job_id = executor.last_job_id()
-            if not job_id:
-                raise ValidationError("No jobs found")
-        return executor.show_log(job_id, args.follow)
-
-    if args.kill:
-        from rex.commands.jobs import kill_job
-
-        job_id = args.kill
-        if args.last or job_id == "--last":
-            job_id = executor.last_job_id()
-            if not job_id:
-                raise ValidationError("No jobs found")
-        return kill_job(executor, job_id)
-
-    if args.watch is not None:
-        from rex.commands.jobs import watch_jobs
-
-        job_ids = args.watch
-        if not job_ids or args.last:
-            job_id = executor.last_job_id()
-            if not job_id:
-                raise ValidationError("No jobs found")
-            job_ids = [job_id]
-        return watch_jobs(executor, job_ids, args.json)
-
-    if args.info:
-        from rex.commands.info import show_info, show_slurm_info
-
-        if config.slurm:
-            partition = config.slurm.partition
-            return show_slurm_info(ssh, partition)
-        return show_info(ssh, target, args.json)
-
-    if args.push:
-        transfer = FileTransfer(target, ssh)
-        push_local = Path(args.push[0])
-        push_remote = args.push[1] if len(args.push) > 1 else None
-        from rex.commands.transfer import push
-
-        return push(transfer, push_local, push_remote)
-
-    if args.pull:
-        transfer = FileTransfer(target, ssh)
-        pull_remote = args.pull[0]
-        pull_local = Path(args.pull[1]) if len(args.pull) > 1 else None
-        from rex.commands.transfer import pull
-
-        return pull(transfer, pull_remote, pull_local)
-
-    if args.sync is not None:
-        transfer = FileTransfer(target, ssh)
-        local_path = Path(args.sync) if args.sync != "." else None
-        from rex.commands.transfer import sync
-
-        return sync(transfer, config, local_path)
-
-    if args.build:
-        if not project:
-            raise ConfigError("No .rex.toml found")
-        from rex.commands.build import build
-
-        result = build(executor, ctx, args.clean)
-        if isinstance(result, int):
-            return result
-        return 0
-
-    if args.exec_cmd:
-        from rex.commands.exec import exec_command
-
-        exec_executor = executor
-        exec_ctx = ctx
-
-        # --login-node: bypass SLURM, run directly on login node
-        if args.login_node:
-            exec_executor = DirectExecutor(ssh)
-
-        # --code-dir: use code_dir as working directory
-        if args.code_dir:
-            from dataclasses import replace
-
-            exec_ctx = replace(ctx, run_dir=ctx.code_dir)
-
-        result = exec_command(
-            exec_executor, exec_ctx, args.exec_cmd, args.detach, args.name
-        )
-        if isinstance(result, int):
-            return result
-        return 0
-
-    if args.read_path is not None:
-        # Always run on login node
-        from rex.commands.read import read_remote
-
-        path = args.read_path or ctx.code_dir
-        if not path:
-            raise ConfigError("No path specified and code_dir not configured")
-        return read_remote(ssh, path)
+    if command not in _NO_CHECK:
+        ssh.check_connection()
 
-    # No command specified
-    parser.print_help()
-    return 1
+    inv = _Invocation(args, target, ssh, executor, ctx, config, project)
+    return _RUNNERS[command](inv)
 
 
 if __name__ == "__main__":
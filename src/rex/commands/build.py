@@ -2,28 +2,19 @@
 
 from __future__ import annotations
 
+import shlex
+
 from rex.exceptions import ConfigError
 from rex.execution.base import ExecutionContext, Executor, JobInfo
 from rex.output import info
 from rex.utils import generate_job_name
 
 
-def _build_script(ctx: ExecutionContext, clean: bool = False) -> str:
-    """Generate the build script content."""
-    module_cmds = ""
-    if ctx.modules:
-        module_cmds = f"module load {' '.join(ctx.modules)}"
-
-    clean_cmd = "rm -rf .venv" if clean else ""
-
-    return f"""set -e
+_BUILD_SCRIPT_TEMPLATE = """set -e
 echo "=== Rex Build ==="
 echo "Started: $(date)"
 
-{module_cmds}
-
-cd {ctx.code_dir}
-{clean_cmd}
+{setup}
 
 if [[ ! -d .venv ]]; then
     echo "=== Creating venv ==="
@@ -39,6 +30,18 @@ echo "Finished: $(date)"
 """
 
 
+def _build_script(ctx: ExecutionContext, clean: bool = False) -> str:
+    """Generate the build script content."""
+    setup: list[str] = []
+    if ctx.modules:
+        setup.append(f"module load {' '.join(shlex.quote(m) for m in ctx.modules)}")
+    setup.append(f"cd {shlex.quote(ctx.code_dir or '')}")
+    if clean:
+        setup.append("rm -rf .venv")
+
+    return _BUILD_SCRIPT_TEMPLATE.format(setup="\n".join(setup))
+
+
 def build(
     executor: Executor,
     ctx: ExecutionContext,
@@ -9,11 +9,13 @@ Architecture:
 
 from __future__ import annotations
 
-import json
+import csv
+import io
 import re
 from dataclasses import dataclass, field
 from typing import Any
 
+from rex.output import print_json
 from rex.ssh.executor import SSHExecutor
 
 # ANSI colors
@@ -118,35 +120,31 @@ def fetch_cpu_mem(ssh: SSHExecutor) -> str:
     return out
 
 
-def fetch_gpu_info(ssh: SSHExecutor) -> str:
-    """Return raw nvidia-smi CSV output, or empty string if no GPUs."""
-    _, out, _ = ssh.exec(
-        "nvidia-smi --query-gpu=index,name,memory.used,memory.total,utilization.gpu "
-        "--format=csv,noheader,nounits 2>/dev/null"
-    )
-    return out
+# Separates the GPU table from the process lines in fetch_gpus output
+GPU_PROCS_MARKER = "--rex-gpu-procs--"
 
+# Runs under ssh.exec's bash; processes are joined to GPU index and user in awk
+_GPUS_SCRIPT = """
+gpus=$(nvidia-smi --query-gpu=index,name,memory.used,memory.total,utilization.gpu,uuid --format=csv,noheader,nounits 2>/dev/null)
+[ -n "$gpus" ] || exit 0
+echo "$gpus"
+echo "MARKER"
+awk -F', *' '
+FILENAME == ARGV[1] { idx[$6] = $1; next }
+FILENAME == ARGV[2] { split($0, p, " "); user[p[1]] = p[2]; next }
+($1 in idx) && ($2 in user) { print idx[$1] "," $2 "," $3 "," user[$2] }
+' <(echo "$gpus") <(ps -eo pid=,user=) \\
+  <(nvidia-smi --query-compute-apps=gpu_uuid,pid,used_memory --format=csv,noheader,nounits 2>/dev/null)
+""".replace("MARKER", GPU_PROCS_MARKER)
 
-def fetch_gpu_processes(ssh: SSHExecutor) -> str:
-    """Return per-GPU process info as 'gpu_idx,pid,mem,user' lines."""
-    script = '''
-declare -A uuid_to_idx
-while IFS=, read -r idx uuid; do
-    idx=$(echo "$idx" | tr -d " ")
-    uuid=$(echo "$uuid" | tr -d " ")
-    uuid_to_idx[$uuid]=$idx
-done < <(nvidia-smi --query-gpu=index,uuid --format=csv,noheader 2>/dev/null)
-
-nvidia-smi --query-compute-apps=gpu_uuid,pid,used_memory --format=csv,noheader,nounits 2>/dev/null | while read line; do
-    uuid=$(echo "$line" | cut -d, -f1 | tr -d " ")
-    pid=$(echo "$line" | cut -d, -f2 | tr -d " ")
-    mem=$(echo "$line" | cut -d, -f3 | tr -d " ")
-    gpu_idx=${uuid_to_idx[$uuid]}
-    user=$(ps -o user= -p "$pid" 2>/dev/null | tr -d " ")
-    [ -n "$user" ] && [ -n "$gpu_idx" ] && echo "$gpu_idx,$pid,$mem,$user"
-done
-'''
-    _, out, _ = ssh.exec(f"bash -c '{script}'")
+
+def fetch_gpus(ssh: SSHExecutor) -> str:
+    """Return nvidia-smi GPU CSV and process lines in one round-trip.
+
+    The GPU table comes first, then a GPU_PROCS_MARKER line, then
+    'gpu_idx,pid,mem,user' lines. Empty if the host has no GPUs.
+    """
+    _, out, _ = ssh.exec(_GPUS_SCRIPT)
     return out
 
 
@@ -197,10 +195,7 @@ def parse_cpu_mem(raw: str) -> CpuMemInfo:
 def parse_gpu_processes(raw: str) -> dict[int, list[GpuProcess]]:
     """Parse 'gpu_idx,pid,mem,user' lines into a dict keyed by GPU index."""
     procs: dict[int, list[GpuProcess]] = {}
-    for line in raw.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split(",")
+    for parts in csv.reader(io.StringIO(raw)):
         if len(parts) >= 4:
             idx = int(parts[0])
             procs.setdefault(idx, []).append(
@@ -209,13 +204,16 @@ def parse_gpu_processes(raw: str) -> dict[int, list[GpuProcess]]:
     return procs
 
 
+def parse_gpus(raw: str) -> list[GpuInfo]:
+    """Parse fetch_gpus output into GpuInfo list with processes attached."""
+    gpu_raw, _, proc_raw = raw.partition(GPU_PROCS_MARKER)
+    return parse_gpu_info(gpu_raw, parse_gpu_processes(proc_raw))
+
+
 def parse_gpu_info(raw: str, procs: dict[int, list[GpuProcess]]) -> list[GpuInfo]:
     """Parse nvidia-smi CSV into GpuInfo list."""
     gpus: list[GpuInfo] = []
-    for line in raw.strip().split("\n"):
-        if not line:
-            continue
-        parts = [p.strip() for p in line.split(",")]
+    for parts in csv.reader(io.StringIO(raw), skipinitialspace=True):
         if len(parts) < 5:
             continue
         idx = int(parts[0])
@@ -380,11 +378,7 @@ def show_info(ssh: SSHExecutor, target: str, json_output: bool = False) -> int:
     """Show CPU, memory, and GPU info for a non-SLURM host."""
     cpu_mem = parse_cpu_mem(fetch_cpu_mem(ssh))
 
-    gpu_raw = fetch_gpu_info(ssh)
-    gpus: list[GpuInfo] = []
-    if gpu_raw.strip():
-        procs = parse_gpu_processes(fetch_gpu_processes(ssh))
-        gpus = parse_gpu_info(gpu_raw, procs)
+    gpus = parse_gpus(fetch_gpus(ssh))
 
     if json_output:
         data: dict[str, Any] = {
@@ -406,7 +400,7 @@ def show_info(ssh: SSHExecutor, target: str, json_output: bool = False) -> int:
                 for g in gpus
             ],
         }
-        print(json.dumps(data, indent=2))
+        print_json(data)
         return 0
 
     display_cpu_mem(cpu_mem)
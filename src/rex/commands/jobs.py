@@ -2,54 +2,82 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import subprocess
-from typing import TYPE_CHECKING, Any
+import sys
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from rex.execution.base import (
-    Executor, JobResult, JobStatus,
+    ACTIVE_STATES, Executor, JobResult, JobStatus,
 )
-from rex.output import colorize_status, info, success, warn
+from rex.output import colorize_status, info, print_json, success, warn
 
 if TYPE_CHECKING:
     from rex.config import GlobalConfig
 
 
-def _job_to_row(job: JobStatus) -> tuple[str, str, str, str, str]:
-    """Convert JobStatus to row tuple (job_id, status, info, hostname, description)."""
-    if job.pid:
-        info_str = f"PID {job.pid}"
+class _JobRow(NamedTuple):
+    """One line of the job table."""
+
+    job_id: str
+    status: str
+    info: str
+    host: str
+    description: str
+
+
+def _job_to_row(job: JobStatus) -> _JobRow:
+    """Convert JobStatus to a table row."""
+    pid, slurm_id, status = job.pid, job.slurm_id, job.status
+    if pid:
+        info_str = f"PID {pid}"
         status = "running"
-    elif job.slurm_id:
-        info_str = f"SLURM {job.slurm_id}"
-        status = job.status
+    elif slurm_id:
+        info_str = f"SLURM {slurm_id}"
     else:
         info_str = ""
-        status = job.status
-    return (job.job_id, status, info_str, job.hostname or "", job.description or "")
+    return _JobRow(job.job_id, status, info_str, job.hostname or "", job.description or "")
+
 
+def _job_to_dict(job: JobStatus) -> dict[str, Any]:
+    """Convert JobStatus to its JSON form, omitting unset fields."""
+    fields = (
+        ("job", job.job_id),
+        ("status", job.status),
+        ("pid", job.pid),
+        ("slurm_id", job.slurm_id),
+        ("hostname", job.hostname),
+        ("description", job.description),
+    )
+    return {key: value for key, value in fields if value}
 
-def _print_job_rows(rows: list[tuple[str, str, str, str, str]]) -> None:
+
+def _print_job_rows(rows: list[_JobRow]) -> None:
     """Print job rows with aligned columns."""
     if not rows:
         return
 
-    id_width = max(len(r[0]) for r in rows)
-    status_width = max(len(r[1]) for r in rows)
-    info_width = max(len(r[2]) for r in rows)
-    host_width = max(len(r[3]) for r in rows)
+    id_width = max(len(r.job_id) for r in rows)
+    status_width = max(len(r.status) for r in rows)
+    info_width = max(len(r.info) for r in rows)
+    host_width = max(len(r.host) for r in rows)
+    # Only a handful of distinct statuses, so color each once
+    colored = {s: colorize_status(s.ljust(status_width)) for s in {r.status for r in rows}}
 
+    lines = []
     for job_id, status, info_str, host, desc in rows:
-        padded_status = status.ljust(status_width)
-        colored_status = colorize_status(padded_status)
-        parts = [job_id.ljust(id_width), colored_status]
+        line = f"{job_id:<{id_width}}  {colored[status]}"
         if info_width > 0:
-            parts.append(info_str.ljust(info_width))
+            line += f"  {info_str:<{info_width}}"
         if host_width > 0:
-            parts.append(host.ljust(host_width))
+            line += f"  {host:<{host_width}}"
         if desc:
-            parts.append(desc)
-        print("  ".join(parts))
+            line += f"  {desc}"
+        lines.append(line)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def list_jobs(executor: Executor, json_output: bool = False, since_minutes: int = 0) -> int:
@@ -57,19 +85,7 @@ def list_jobs(executor: Executor, json_output: bool = False, since_minutes: int
     jobs = executor.list_jobs(since_minutes=since_minutes)
 
     if json_output:
-        output: list[dict[str, Any]] = []
-        for job in jobs:
-            item: dict[str, Any] = {"job": job.job_id, "status": job.status}
-            if job.pid:
-                item["pid"] = job.pid
-            if job.slurm_id:
-                item["slurm_id"] = job.slurm_id
-            if job.hostname:
-                item["hostname"] = job.hostname
-            if job.description:
-                item["description"] = job.description
-            output.append(item)
-        print(json.dumps(output, indent=2))
+        print_json([_job_to_dict(job) for job in jobs])
     else:
         rows = [_job_to_row(job) for job in jobs]
         _print_job_rows(rows)
@@ -77,13 +93,44 @@ def list_jobs(executor: Executor, json_output: bool = False, since_minutes: int
     return 0
 
 
+@functools.lru_cache(maxsize=64)
+def _host_executor(target: str, slurm: bool) -> Executor:
+    """Return the executor for a host, built once per process."""
+    from rex.ssh.executor import SSHExecutor
+
+    ssh = SSHExecutor(target, verbose=False)
+    if slurm:
+        from rex.execution.slurm import SlurmExecutor
+
+        return SlurmExecutor(ssh, None)
+
+    from rex.execution.direct import DirectExecutor
+
+    return DirectExecutor(ssh)
+
+
+def _fetch_host_jobs(
+    global_config: "GlobalConfig", target: str, alias: str, since_minutes: int
+) -> list[JobStatus]:
+    """List jobs on one connected host; empty if the host cannot be queried."""
+    try:
+        host_config = global_config.get_host_config(alias) if alias != target else None
+        executor = _host_executor(target, bool(host_config and host_config.slurm))
+        return executor.list_jobs(since_minutes=since_minutes)
+    except Exception:
+        return []
+
+
 def list_all_jobs(
     global_config: "GlobalConfig", json_output: bool = False, since_minutes: int = 0
 ) -> int:
-    """List jobs across all connected hosts."""
-    from rex.execution import DirectExecutor, SlurmExecutor
+    """List jobs across all connected hosts.
+
+    Hosts are queried concurrently; output keeps the connection order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
     from rex.ssh.connection import SSHConnection
-    from rex.ssh.executor import SSHExecutor
 
     active = SSHConnection.list_active()
     if not active:
@@ -92,42 +139,24 @@ def list_all_jobs(
 
     # Build reverse lookup: target -> alias
     target_to_alias = {v: k for k, v in global_config.aliases.items()}
+    hosts = [(target, target_to_alias.get(target, target)) for target, _socket in active]
+
+    with ThreadPoolExecutor(max_workers=min(32, len(hosts))) as pool:
+        host_jobs = list(pool.map(
+            lambda host: _fetch_host_jobs(global_config, *host, since_minutes), hosts
+        ))
 
     all_jobs: list[JobStatus] = []
     all_results: dict[str, list[dict[str, Any]]] = {}  # for JSON output
 
-    for target, _socket in active:
-        alias = target_to_alias.get(target, target)
-        try:
-            ssh = SSHExecutor(target, verbose=False)
-
-            host_config = global_config.get_host_config(alias) if alias != target else None
-            if host_config and host_config.slurm:
-                executor: Executor = SlurmExecutor(ssh, None)
-            else:
-                executor = DirectExecutor(ssh)
-
-            jobs = executor.list_jobs(since_minutes=since_minutes)
-            if jobs:
-                all_jobs.extend(jobs)
-                if json_output:
-                    all_results[alias] = []
-                    for job in jobs:
-                        item: dict[str, Any] = {"job": job.job_id, "status": job.status}
-                        if job.pid:
-                            item["pid"] = job.pid
-                        if job.slurm_id:
-                            item["slurm_id"] = job.slurm_id
-                        if job.hostname:
-                            item["hostname"] = job.hostname
-                        if job.description:
-                            item["description"] = job.description
-                        all_results[alias].append(item)
-        except Exception:
-            pass
+    for (_target, alias), jobs in zip(hosts, host_jobs):
+        if jobs:
+            all_jobs.extend(jobs)
+            if json_output:
+                all_results[alias] = [_job_to_dict(job) for job in jobs]
 
     if json_output:
-        print(json.dumps(all_results, indent=2))
+        print_json(all_results)
     else:
         if not all_jobs:
             print("No jobs found")
@@ -145,12 +174,7 @@ def get_status(
     status = executor.get_status(job_id)
 
     if json_output:
-        out: dict[str, Any] = {"job": status.job_id, "status": status.status}
-        if status.pid:
-            out["pid"] = status.pid
-        if status.slurm_id:
-            out["slurm_id"] = status.slurm_id
-        print(json.dumps(out))
+        print_json(_job_to_dict(status))
     else:
         if status.status == "unknown":
             warn("Could not determine job status")
@@ -166,19 +190,89 @@ def kill_job(executor: Executor, job_id: str) -> int:
     return 1
 
 
+# Growth of the gap between polls, from executor.min_poll up to poll_interval
+_POLL_BACKOFF = 1.5
+
+
+def _watch_many(
+    executor: Executor, job_ids: list[str], max_failures: int = 3
+) -> list[JobResult]:
+    """Wait for several jobs, checking all pending ones in one call per poll.
+
+    Polling starts at the executor's min_poll and backs off while nothing
+    changes, so short jobs are reported promptly and long ones cost one
+    query per poll_interval. Retries after a failed check always wait the
+    full poll_interval.
+    """
+    poll_interval = executor.poll_interval
+    min_poll = min(executor.min_poll, poll_interval)
+    results: dict[str, JobResult] = {}
+    # Pending jobs (in order) mapped to their consecutive failed checks
+    pending = dict.fromkeys(job_ids, 0)
+    last_state: dict[str, str] = {}
+    interval = min_poll
+
+    while True:
+        started = time.monotonic()
+        statuses = executor.get_statuses(list(pending))
+        changed = False
+        for job_id, status in statuses.items():
+            if status.status == "unknown":
+                pending[job_id] += 1
+                if pending[job_id] < max_failures:
+                    continue
+                warn(f"Lost track of job {job_id} after {max_failures} attempts")
+                results[job_id] = JobResult(job_id=job_id, status="unknown", exit_code=1)
+            elif status.status in ACTIVE_STATES:
+                pending[job_id] = 0
+                # e.g. pending -> running
+                changed |= last_state.setdefault(job_id, status.status) != status.status
+                last_state[job_id] = status.status
+                continue
+            elif status.status == "completed":
+                success(f"Job {job_id} completed")
+                results[job_id] = JobResult(job_id=job_id, status="completed", exit_code=0)
+            else:
+                warn(f"Job {job_id} finished: {status.status}")
+                results[job_id] = JobResult(job_id=job_id, status=status.status, exit_code=1)
+            del pending[job_id]
+            changed = True
+
+        if not pending:
+            break
+        if changed:
+            interval = min_poll
+        else:
+            interval = min(interval * _POLL_BACKOFF, poll_interval)
+        # A failed check is retried after a full poll_interval, so a brief
+        # squeue/sacct gap is not counted against the job several times
+        wait = poll_interval if any(pending.values()) else interval
+        time.sleep(max(0.0, wait - (time.monotonic() - started)))
+
+    return [results[job_id] for job_id in job_ids]
+
+
 def watch_jobs(
-    executor: Executor, job_ids: list[str], json_output: bool = False
+    executor: Executor, job_ids: list[str], json_output: bool = False, follow: bool = False
 ) -> int:
-    """Wait for one or more jobs to complete."""
+    """Wait for one or more jobs to complete.
+
+    follow streams a single job's log over the same connection as the wait.
+    """
     info(f"Watching {'job' if len(job_ids) == 1 else f'{len(job_ids)} jobs'}: {', '.join(job_ids)}")
 
-    results = [executor.watch_job(job_id) for job_id in job_ids]
+    if len(job_ids) == 1:
+        results = [executor.watch_job(job_ids[0], follow_log=follow)]
+    else:
+        if follow:
+            warn("--follow applies to a single job; ignoring")
+        results = _watch_many(executor, job_ids)
 
     if json_output:
-        print(json.dumps([
+        print_json([
             {"job": r.job_id, "status": r.status, "exit_code": r.exit_code}
             for r in results
-        ]))
+        ])
 
     return max(r.exit_code for r in results)
 
@@ -16,17 +16,17 @@ def read_remote(ssh: SSHExecutor, path: str) -> int:
 
     Returns exit code.
     """
-    # Check if path exists and determine type
-    code, stdout, stderr = ssh.exec(f'test -e {shell_quote(path)} && echo exists')
-    if code != 0 or stdout.strip() != "exists":
-        error(f"Path not found: {path}", exit_now=False)
-        return 1
-
-    # Check if it's a directory
-    code, stdout, _ = ssh.exec(f'test -d {shell_quote(path)} && echo dir')
-    is_dir = stdout.strip() == "dir"
-
-    if is_dir:
-        return ssh.exec_streaming(f'ls -la {shell_quote(path)}')
-    else:
-        return ssh.exec_streaming(f'cat {shell_quote(path)}')
+    quoted = shell_quote(path)
+    _, stdout, _ = ssh.exec(
+        f"if [ -d {quoted} ]; then echo dir; elif [ -e {quoted} ]; then echo file; "
+        "else echo missing; fi"
+    )
+    kind = stdout.strip()
+
+    if kind == "dir":
+        return ssh.exec_streaming(f'ls -la {quoted}')
+    if kind == "file":
+        return ssh.exec_streaming(f'cat {quoted}')
+
+    error(f"Path not found: {path}", exit_now=False)
+    return 1
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import os
+from collections.abc import Callable
 from pathlib import Path
 
 from rex.config.resolved import ResolvedConfig
@@ -10,39 +13,47 @@ from rex.output import error
 from rex.ssh.transfer import FileTransfer
 
 
+def _transfer_command(fn: Callable[..., None]) -> Callable[..., int]:
+    """Return 0 on success; report a TransferError and return its exit code."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> int:
+        try:
+            fn(*args, **kwargs)
+        except TransferError as e:
+            error(e.message, exit_now=False)
+            return e.exit_code
+        return 0
+
+    return wrapper
+
+
+@_transfer_command
 def push(
     transfer: FileTransfer,
-    local: Path,
+    local: str | os.PathLike[str],
     remote: str | None = None,
-) -> int:
+) -> None:
     """Push file/directory to remote."""
-    try:
-        transfer.push(local, remote)
-        return 0
-    except TransferError as e:
-        error(e.message, exit_now=False)
-        return e.exit_code
+    transfer.push(local, remote)
 
 
+@_transfer_command
 def pull(
     transfer: FileTransfer,
     remote: str,
-    local: Path | None = None,
-) -> int:
+    local: str | os.PathLike[str] | None = None,
+) -> None:
     """Pull file/directory from remote."""
-    try:
-        transfer.pull(remote, local)
-        return 0
-    except TransferError as e:
-        error(e.message, exit_now=False)
-        return e.exit_code
+    transfer.pull(remote, local)
 
 
+@_transfer_command
 def sync(
     transfer: FileTransfer,
     config: ResolvedConfig,
-    local_path: Path | None = None,
-) -> int:
+    local_path: str | os.PathLike[str] | None = None,
+) -> None:
     """Sync project to remote.
 
     Uses code_dir and root from resolved config.
@@ -54,17 +65,7 @@ def sync(
         else:
             local_path = Path.cwd()
 
-    local_path = local_path.resolve()
-
     # Determine remote path from resolved config
-    ctx = config.execution
-    remote_path = ctx.code_dir if ctx else None
-
-    # Sync
-    try:
-        transfer.sync(local_path, remote_path, excludes=config.sync_excludes)
-    except TransferError as e:
-        error(e.message, exit_now=False)
-        return e.exit_code
+    remote_path = config.execution.code_dir
 
-    return 0
+    transfer.sync(local_path, remote_path, excludes=config.sync_excludes)
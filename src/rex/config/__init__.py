@@ -1,7 +1,31 @@
 """Configuration loading."""
 
-from rex.config.global_config import GlobalConfig, HostConfig
-from rex.config.project import ProjectConfig
-from rex.config.resolved import ResolvedConfig
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rex.config.global_config import GlobalConfig, HostConfig
+    from rex.config.project import ProjectConfig
+    from rex.config.resolved import ResolvedConfig
+
+# Exported names are imported on first access, so loading the global
+# config does not also pull in the execution and SSH layers.
+_LAZY = {
+    "GlobalConfig": "rex.config.global_config",
+    "HostConfig": "rex.config.global_config",
+    "ProjectConfig": "rex.config.project",
+    "ResolvedConfig": "rex.config.resolved",
+}
 
 __all__ = ["GlobalConfig", "HostConfig", "ProjectConfig", "ResolvedConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
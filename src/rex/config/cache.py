@@ -0,0 +1,122 @@
+"""On-disk cache of parsed config files.
+
+Each config file gets one pickle under the rex cache directory holding the
+parsed object, the (st_mtime_ns, st_size) it was built from and a digest of
+the file's bytes. Editing the file changes the key, so stale entries are
+never returned; when only the mtime changed (e.g. touch), the digest still
+matches and the entry is reused without parsing. Entries and their file
+names also carry a hash of the config dataclasses' fields, so pickles
+written by a rex with a different layout are never loaded. Any problem
+reading or writing the cache is ignored and the caller parses normally.
+Set REX_NO_CONFIG_CACHE to bypass the cache entirely (e.g. when debugging).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from rex.utils import cache_dir
+
+
+_schema_tag: str | None = None
+
+
+def _schema() -> str:
+    """Return a short hash of the cached dataclasses' field layout."""
+    global _schema_tag
+    if _schema_tag is None:
+        from dataclasses import fields
+
+        from rex.config.global_config import GlobalConfig, HostConfig
+        from rex.config.project import ProjectConfig
+
+        layout = [
+            (cls.__qualname__, *(f.name for f in fields(cls)))
+            for cls in (GlobalConfig, HostConfig, ProjectConfig)
+        ]
+        _schema_tag = hashlib.blake2b(repr(layout).encode(), digest_size=4).hexdigest()
+    return _schema_tag
+
+
+def _entry_path(path: Path) -> Path:
+    """Return the cache file for a config path."""
+    digest = hashlib.sha1(str(path).encode()).hexdigest()
+    return cache_dir() / f"config-{_schema()}-{digest}.pkl"
+
+
+def _disabled() -> bool:
+    """Return True when REX_NO_CONFIG_CACHE is set."""
+    return bool(os.environ.get("REX_NO_CONFIG_CACHE"))
+
+
+def stat_key(st: os.stat_result) -> tuple[int, int]:
+    """Return the cache key for a stat result."""
+    return (st.st_mtime_ns, st.st_size)
+
+
+def digest(data: bytes) -> bytes:
+    """Return the content digest stored alongside a cache entry."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _read_entry(path: Path) -> dict[str, Any] | None:
+    """Return the raw cache entry for path, or None."""
+    if _disabled():
+        return None
+    try:
+        with open(_entry_path(path), "rb") as f:
+            entry = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(entry, dict) or entry.get("schema") != _schema():
+        return None
+    return entry
+
+
+def load(path: Path, key: tuple[int, int]) -> Any | None:
+    """Return the cached object for path if it was built from key."""
+    entry = _read_entry(path)
+    if entry is None or entry.get("key") != key:
+        return None
+    return entry.get("value")
+
+
+def load_by_digest(path: Path, content_digest: bytes) -> Any | None:
+    """Return the cached object for path if it was built from the same bytes."""
+    entry = _read_entry(path)
+    if entry is None or entry.get("digest") != content_digest:
+        return None
+    return entry.get("value")
+
+
+def store(
+    path: Path, key: tuple[int, int], value: Any, content_digest: bytes | None = None
+) -> None:
+    """Cache value for path under key (atomic replace, best effort)."""
+    if _disabled():
+        return
+    import tempfile  # only needed when writing
+
+    entry = _entry_path(path)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, prefix=".config-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {
+                        "schema": _schema(), "key": key,
+                        "digest": content_digest, "value": value,
+                    },
+                    f, pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, entry)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, pickle.PicklingError):
+        pass
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-import tomli
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from rex.config import cache
 from rex.exceptions import ConfigError
 from rex.output import warn
-from rex.utils import validate_slurm_time, validate_memory, validate_gres, validate_cpus
+from rex.utils import toml_parser, validate_slurm_fields
 
-DEFAULT_CONFIG_PATH = Path.home() / ".config" / "rex" / "config.toml"
 
-KNOWN_HOST_FIELDS = {
+def default_config_path() -> Path:
+    """Return the default global config path (~/.config/rex/config.toml)."""
+    return Path.home() / ".config" / "rex" / "config.toml"
+
+
+KNOWN_HOST_FIELDS = frozenset({
     "code_dir",
     "run_dir",
     "modules",
@@ -28,16 +32,19 @@ KNOWN_HOST_FIELDS = {
     "slurm",
     "env",
     "sync_excludes",
-}
+})
 
+# Per-process cache of loaded configs: path -> ((st_mtime_ns, st_size), config)
+_load_cache: dict[Path, tuple[tuple[int, int], "GlobalConfig"]] = {}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class HostConfig:
-    """Per-host configuration defaults."""
+    """Per-host configuration defaults (read-only once loaded)."""
 
     code_dir: str | None = None
     run_dir: str | None = None
-    modules: list[str] = field(default_factory=list)
+    modules: tuple[str, ...] = ()
     cpu_partition: str | None = None
     gpu_partition: str | None = None
     gres: str | None = None
@@ -52,7 +59,7 @@ class HostConfig:
     sync_excludes: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalConfig:
     """Global configuration from ~/.config/rex/config.toml."""
 
@@ -63,67 +70,84 @@ class GlobalConfig:
     def load(cls, path: Path | None = None) -> "GlobalConfig":
         """Load global config from file.
 
-        Returns empty config if file doesn't exist.
+        Returns empty config if file doesn't exist. Results are memoized
+        per process and on disk, and reused while the file's mtime and size
+        (or, on disk, its content) are unchanged. Configs that produce
+        warnings are not cached on disk, so the warnings keep appearing
+        until fixed.
         """
         if path is None:
-            path = DEFAULT_CONFIG_PATH
+            path = default_config_path()
 
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls(aliases={}, hosts={})
 
-        with open(path, "rb") as f:
-            try:
-                data = tomli.load(f)
-            except tomli.TOMLDecodeError as e:
-                msg = str(e)
-                if "Cannot overwrite a value" in msg:
-                    msg = f"Duplicate key in {path}: {msg}"
-                else:
-                    msg = f"Invalid TOML in {path}: {msg}"
-                raise ConfigError(msg) from None
+        key = cache.stat_key(st)
+        cached = _load_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        config = cache.load(path, key)
+        if isinstance(config, cls):
+            _load_cache[path] = (key, config)
+            return config
+
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            raise ConfigError(f"Cannot read {path}: {e}") from None
+
+        # Touched but unedited: reuse the entry built from the same bytes
+        content_digest = cache.digest(raw)
+        config = cache.load_by_digest(path, content_digest)
+        if isinstance(config, cls):
+            _load_cache[path] = (key, config)
+            cache.store(path, key, config, content_digest)
+            return config
+
+        toml = toml_parser()  # only needed on a cache miss
+        text = raw.decode("utf-8")
+        try:
+            data = toml.loads(text)
+        except toml.TOMLDecodeError as e:
+            msg = str(e)
+            if "Cannot overwrite a value" in msg:
+                msg = f"Duplicate key in {path}: {msg}"
+            else:
+                msg = f"Invalid TOML in {path}: {msg}"
+            raise ConfigError(msg) from None
 
         aliases = data.get("aliases", {})
         hosts: dict[str, HostConfig] = {}
+        warned = False
 
         hosts_data = data.get("hosts", {})
         for host_name, host_data in hosts_data.items():
             # Warn about unknown fields
-            unknown = set(host_data.keys()) - KNOWN_HOST_FIELDS
+            unknown = [k for k in host_data if k not in KNOWN_HOST_FIELDS]
             if unknown:
+                warned = True
                 warn(f"config.toml: [hosts.{host_name}] unknown fields: {', '.join(sorted(unknown))}")
 
             # Validate SLURM options
             try:
-                if host_data.get("time"):
-                    validate_slurm_time(host_data["time"])
-                if host_data.get("mem"):
-                    validate_memory(host_data["mem"])
-                if host_data.get("gres"):
-                    validate_gres(host_data["gres"])
-                if host_data.get("cpus") is not None:
-                    validate_cpus(host_data["cpus"])
+                validate_slurm_fields(host_data)
             except ValueError as e:
                 raise ConfigError(f"config.toml: [hosts.{host_name}] {e}")
 
-            hosts[host_name] = HostConfig(
-                code_dir=host_data.get("code_dir"),
-                run_dir=host_data.get("run_dir"),
-                modules=host_data.get("modules", []),
-                cpu_partition=host_data.get("cpu_partition"),
-                gpu_partition=host_data.get("gpu_partition"),
-                gres=host_data.get("gres"),
-                time=host_data.get("time"),
-                cpus=host_data.get("cpus"),
-                mem=host_data.get("mem"),
-                constraint=host_data.get("constraint"),
-                prefer=host_data.get("prefer"),
-                default_gpu=host_data.get("default_gpu", False),
-                slurm=host_data.get("slurm", False),
-                env=host_data.get("env", {}),
-                sync_excludes=host_data.get("sync_excludes"),
-            )
-
-        return cls(aliases=aliases, hosts=hosts)
+            # Missing fields fall back to the dataclass defaults
+            fields = {k: v for k, v in host_data.items() if k in KNOWN_HOST_FIELDS}
+            if "modules" in fields:
+                fields["modules"] = tuple(fields["modules"])
+            hosts[host_name] = HostConfig(**fields)
+
+        config = cls(aliases=aliases, hosts=hosts)
+        _load_cache[path] = (key, config)
+        if not warned:
+            cache.store(path, key, config, content_digest)
+        return config
 
     def get_host_config(self, alias_or_host: str) -> HostConfig | None:
         """Get host config for an alias or host string.
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import tomli
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from rex.config import cache
 from rex.exceptions import ConfigError
 from rex.output import warn
-from rex.utils import validate_slurm_time, validate_memory, validate_gres, validate_cpus
+from rex.utils import toml_parser, validate_slurm_fields
 
-KNOWN_FIELDS = {
+KNOWN_FIELDS = frozenset({
     "name",
     "code_dir",
     "run_dir",
@@ -26,10 +27,15 @@ KNOWN_FIELDS = {
     "default_gpu",
     "env",
     "sync_excludes",
-}
+})
 
+# Per-process caches: resolved start dir -> config path, and
+# config path -> ((st_mtime_ns, st_size), config)
+_found_cache: dict[Path, Path] = {}
+_load_cache: dict[Path, tuple[tuple[int, int], "ProjectConfig"]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration from .rex.toml."""
 
@@ -54,28 +60,77 @@ class ProjectConfig:
     def find_and_load(cls, start_dir: Path | None = None) -> "ProjectConfig | None":
         """Walk up from start_dir to find .rex.toml and load it.
 
+        The walk stops at the filesystem root or after the first directory
+        containing .git (a directory, or a file in worktrees and
+        submodules), which is taken as the project root.
         Returns None if no config file is found.
         """
         if start_dir is None:
             start_dir = Path.cwd()
 
-        current = start_dir.resolve()
+        start = start_dir.resolve()
+        # _load stats the file first, so a missing file costs one stat
+        found = _found_cache.get(start)
+        if found is not None:
+            try:
+                return cls._load(found)
+            except FileNotFoundError:
+                del _found_cache[start]
+
+        current = start
         while current != current.parent:
             config_path = current / ".rex.toml"
-            if config_path.exists():
-                return cls._load(config_path)
-            current = current.parent
+            try:
+                config = cls._load(config_path)
+            except FileNotFoundError:
+                # Only probe for .git on a miss, so a hit costs one stat
+                if os.path.lexists(current / ".git"):
+                    break
+                current = current.parent
+                continue
+            _found_cache[start] = config_path
+            return config
 
         return None
 
     @classmethod
     def _load(cls, path: Path) -> "ProjectConfig":
-        """Load config from a specific path."""
-        with open(path, "rb") as f:
-            data = tomli.load(f)
+        """Load config from a specific path.
+
+        Results are memoized per process and on disk, and reused while the
+        file's mtime and size (or, on disk, its content) are unchanged.
+        Configs that produce warnings are not cached on disk.
+        """
+        st = path.stat()
+        key = cache.stat_key(st)
+        cached = _load_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        config = cache.load(path, key)
+        if isinstance(config, cls):
+            _load_cache[path] = (key, config)
+            return config
+
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            raise ConfigError(f"Cannot read {path}: {e}") from None
+
+        # Touched but unedited: reuse the entry built from the same bytes
+        content_digest = cache.digest(raw)
+        config = cache.load_by_digest(path, content_digest)
+        if isinstance(config, cls):
+            _load_cache[path] = (key, config)
+            cache.store(path, key, config, content_digest)
+            return config
+
+        toml = toml_parser()  # only needed on a cache miss
+        text = raw.decode("utf-8")
+        data = toml.loads(text)
 
         # Warn about unknown fields
-        unknown = set(data.keys()) - KNOWN_FIELDS
+        unknown = [k for k in data if k not in KNOWN_FIELDS]
         if unknown:
             warn(f".rex.toml: unknown fields: {', '.join(sorted(unknown))}")
 
@@ -85,32 +140,16 @@ class ProjectConfig:
 
         # Validate SLURM options
         try:
-            if data.get("time"):
-                validate_slurm_time(data["time"])
-            if data.get("mem"):
-                validate_memory(data["mem"])
-            if data.get("gres"):
-                validate_gres(data["gres"])
-            if data.get("cpus") is not None:
-                validate_cpus(data["cpus"])
+            validate_slurm_fields(data)
         except ValueError as e:
             raise ConfigError(f".rex.toml: {e}")
 
-        return cls(
+        # Missing fields fall back to the dataclass defaults
+        config = cls(
             root=path.parent,
-            name=data["name"],
-            code_dir=data.get("code_dir"),
-            run_dir=data.get("run_dir"),
-            modules=data.get("modules"),
-            cpu_partition=data.get("cpu_partition"),
-            gpu_partition=data.get("gpu_partition"),
-            gres=data.get("gres"),
-            time=data.get("time"),
-            cpus=data.get("cpus"),
-            mem=data.get("mem"),
-            constraint=data.get("constraint"),
-            prefer=data.get("prefer"),
-            default_gpu=data.get("default_gpu"),
-            env=data.get("env", {}),
-            sync_excludes=data.get("sync_excludes"),
+            **{k: v for k, v in data.items() if k in KNOWN_FIELDS},
         )
+        _load_cache[path] = (key, config)
+        if not unknown:
+            cache.store(path, key, config, content_digest)
+        return config
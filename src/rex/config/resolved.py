@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from rex.execution.base import ExecutionContext
-from rex.execution.slurm import SlurmOptions
+from rex.execution.base import ExecutionContext, SlurmOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedConfig:
     """Fully resolved config after CLI > project > host merging."""
 
@@ -18,10 +17,6 @@ class ResolvedConfig:
     root: Path | None = None  # Local project root (for sync)
 
     # Composed configs
-    execution: ExecutionContext | None = None
+    execution: ExecutionContext = field(default_factory=ExecutionContext)
     slurm: SlurmOptions | None = None  # None when host is not SLURM
     sync_excludes: list[str] | None = None
-
-    def __post_init__(self):
-        if self.execution is None:
-            self.execution = ExecutionContext()
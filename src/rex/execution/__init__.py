@@ -1,9 +1,30 @@
 """Execution backends."""
 
-from rex.execution.base import ExecutionContext, Executor, JobInfo, JobResult, JobStatus
-from rex.execution.direct import DirectExecutor
-from rex.execution.script import SbatchBuilder
-from rex.execution.slurm import SlurmExecutor, SlurmOptions
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rex.execution.base import (
+        ExecutionContext, Executor, JobInfo, JobResult, JobStatus, SlurmOptions,
+    )
+    from rex.execution.direct import DirectExecutor
+    from rex.execution.script import SbatchBuilder
+    from rex.execution.slurm import SlurmExecutor
+
+# Exported names are imported on first access (see rex.config)
+_LAZY = {
+    "ExecutionContext": "rex.execution.base",
+    "Executor": "rex.execution.base",
+    "JobInfo": "rex.execution.base",
+    "JobResult": "rex.execution.base",
+    "JobStatus": "rex.execution.base",
+    "DirectExecutor": "rex.execution.direct",
+    "SbatchBuilder": "rex.execution.script",
+    "SlurmExecutor": "rex.execution.slurm",
+    "SlurmOptions": "rex.execution.base",
+}
 
 __all__ = [
     "ExecutionContext",
@@ -15,3 +36,12 @@ __all__ = [
     "SlurmExecutor",
     "SlurmOptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
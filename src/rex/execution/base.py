@@ -3,27 +3,37 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import shlex
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from rex.ssh.executor import SSHExecutor
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Shared context for execution."""
 
-    modules: list[str] | None = None
+    modules: list[str] = field(default_factory=list)
     code_dir: str | None = None  # From project config
     run_dir: str | None = None  # Working directory for execution
-    env: dict[str, str] | None = None  # Environment variables
+    env: dict[str, str] = field(default_factory=dict)  # Environment variables
 
-    def __post_init__(self):
-        if self.modules is None:
-            self.modules = []
-        if self.env is None:
-            self.env = {}
+
+@dataclass(slots=True)
+class SlurmOptions:
+    """SLURM-specific options."""
+
+    partition: str | None = None
+    gres: str | None = None
+    time: str | None = None
+    cpus: int | None = None
+    mem: str | None = None
+    constraint: str | None = None
+    prefer: str | None = None
 
 
 def rex_dir(run_dir: str | None = None) -> str:
@@ -51,8 +61,8 @@ def job_meta_dir() -> str:
 
 
 def job_meta_path(job_name: str) -> str:
-    """Return the metadata file path for a given job name."""
-    return f"{job_meta_dir()}/{job_name}.json"
+    """Return the metadata file path for a given job name (shell-quoted)."""
+    return f"{job_meta_dir()}/{shlex.quote(job_name + '.json')}"
 
 
 def write_job_meta(
@@ -64,16 +74,32 @@ def write_job_meta(
     slurm_id: int | None = None,
 ) -> None:
     """Write job metadata to the remote."""
+    ssh.exec(job_meta_cmd(job_name, log, pid=pid, slurm_id=slurm_id))
+
+
+def job_meta_cmd(
+    job_name: str,
+    log: str,
+    *,
+    pid: int | str | None = None,
+    slurm_id: int | None = None,
+) -> str:
+    """Return the remote command that writes job metadata.
+
+    For folding the write into another SSH call; see write_job_meta.
+    A str pid names a remote shell variable holding the PID (e.g. "$pid").
+    """
     meta: dict[str, Any] = {"log": log}
-    if pid is not None:
+    if isinstance(pid, int):
         meta["pid"] = pid
     if slurm_id is not None:
         meta["slurm_id"] = slurm_id
 
-    meta_dir = job_meta_dir()
-    path = job_meta_path(job_name)
     payload = json.dumps(meta)
-    ssh.exec(f"mkdir -p {meta_dir} && echo '{payload}' > {path}")
+    if isinstance(pid, str):
+        # Close the single quotes so the shell expands the variable
+        payload = f"{payload[:-1]}, \"pid\": '\"{pid}\"'}}"
+    return f"mkdir -p {job_meta_dir()} && echo '{payload}' > {job_meta_path(job_name)}"
 
 
 def read_job_meta(
@@ -90,6 +116,11 @@ def read_job_meta(
         return None
 
 
+# Shell filters pulling fields out of a metadata file without a JSON parser
+META_PID_SED = "sed -n 's/.*\"pid\": *\\([0-9][0-9]*\\).*/\\1/p'"
+META_LOG_SED = "sed -n 's/.*\"log\": *\"\\([^\"]*\\)\".*/\\1/p'"
+
+
 def list_job_meta_names(ssh: "SSHExecutor") -> list[str]:
     """List all job names that have metadata files."""
     meta_d = job_meta_dir()
@@ -101,7 +132,54 @@ def list_job_meta_names(ssh: "SSHExecutor") -> list[str]:
     return [name for name in stdout.strip().split("\n") if name]
 
 
-@dataclass
+# Job states (lowercase) that mean the job has not finished yet
+ACTIVE_STATES = ("running", "pending", "requeued", "configuring")
+
+
+# Seconds a get_status answer is reused within one process
+STATUS_TTL = 2.0
+
+
+# Longest a single remote wait may block before control returns locally
+WAIT_WINDOW = 300
+
+
+def wait_while(
+    ssh: "SSHExecutor", check_cmd: str, poll_interval: int, window: int = WAIT_WINDOW
+) -> None:
+    """Block while check_cmd keeps succeeding on the remote.
+
+    The polling loop runs remotely in one SSH session, so waiting costs one
+    round-trip per window instead of one per poll. Returns when the check
+    fails or after about window seconds; callers re-query the job state.
+    """
+    interval = max(poll_interval, 1)
+    rounds = max(window // interval, 1)
+    ssh.exec(
+        f"for _ in $(seq {rounds}); do {check_cmd} || exit 0; sleep {interval}; done"
+    )
+
+
+def follow_while(
+    ssh: "SSHExecutor", check_cmd: str, log: str, poll_interval: int, from_start: bool = True
+) -> None:
+    """Stream a log while check_cmd keeps succeeding on the remote.
+
+    Like wait_while, but the same session tails the log, so following a
+    job's output costs no extra connection. from_start=False skips lines
+    already shown by an earlier call.
+    """
+    interval = max(poll_interval, 1)
+    lines = "+1" if from_start else "0"
+    ssh.exec_streaming(
+        f"tail -n {lines} -F {log} 2>/dev/null & _t=$!; "
+        f"while {check_cmd}; do sleep {interval}; done; "
+        "sleep 1; kill $_t 2>/dev/null; exit 0",
+        tty=False,
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class JobInfo:
     """Returned after launching a detached job."""
 
@@ -112,7 +190,7 @@ class JobInfo:
     pid: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobStatus:
     """Status of a job."""
 
@@ -124,7 +202,7 @@ class JobStatus:
     hostname: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobResult:
     """Result of waiting for a job."""
 
@@ -136,6 +214,11 @@ class JobResult:
 class Executor(Protocol):
     """Protocol for execution backends."""
 
+    # Status polling bounds in seconds: the longest and shortest gap
+    # between client-side status checks
+    poll_interval: int
+    min_poll: float
+
     def exec_foreground(self, ctx: ExecutionContext, cmd: str) -> int:
         """Execute shell command in foreground."""
         ...
@@ -149,13 +232,20 @@ class Executor(Protocol):
     def list_jobs(self, since_minutes: int = 0) -> list[JobStatus]:
         """List all rex jobs.
 
+        Implementations push the time filter to the remote (find -mmin,
+        sacct --starttime) instead of fetching every job and filtering here.
+
         Args:
             since_minutes: Include finished jobs from the last N minutes (0 = active only).
         """
         ...
 
-    def get_status(self, job_id: str) -> JobStatus:
-        """Get status of specific job."""
+    def get_status(self, job_id: str, force: bool = False) -> JobStatus:
+        """Get status of specific job (force=True skips the short-lived cache)."""
+        ...
+
+    def get_statuses(self, job_ids: list[str]) -> dict[str, JobStatus]:
+        """Get status of several jobs in one remote call."""
         ...
 
     def get_log_path(self, job_id: str) -> str | None:
@@ -166,51 +256,121 @@ class Executor(Protocol):
         """Kill a running job."""
         ...
 
-    def watch_job(self, job_id: str, poll_interval: int = 5) -> JobResult:
-        """Wait for job to complete, return final status."""
+    def watch_job(
+        self, job_id: str, poll_interval: int | None = None, follow_log: bool = False
+    ) -> JobResult:
+        """Wait for job to complete, return final status.
+
+        With follow_log, the job's log is streamed while waiting. poll_interval
+        defaults to the executor's own.
+        """
         ...
 
     def show_log(self, job_id: str, follow: bool = False) -> int:
         """Show job output log. Returns exit code."""
         ...
 
+    def show_last_log(self, follow: bool = False) -> int:
+        """Show the most recent job's log. Returns exit code."""
+        ...
+
     def last_job_id(self) -> str | None:
         """Get the most recent job ID."""
         ...
 
 
-class BaseExecutor:
+# show_log commands; {log} comes from metadata and is left unquoted so ~ expands
+_SHOW_LOG = '[ -f {log} ] || {{ echo "Log not found" >&2; exit 1; }}; cat {log}'
+_FOLLOW_LOG = (
+    '[ -f {log} ] || {{ echo "Log not found" >&2; exit 1; }}; '
+    "if kill -0 {pid} 2>/dev/null; then tail -f --pid={pid} {log}; else cat {log}; fi"
+)
+
+
+class BaseExecutor(ABC):
     """Shared implementation for metadata-based job management."""
 
+    poll_interval: int = 5
+    min_poll: float = 0.5
+
     def __init__(self, ssh: "SSHExecutor"):
         self.ssh = ssh
+        self._status_cache: dict[str, tuple[float, JobStatus]] = {}
+        self._meta_cache: dict[str, dict[str, Any]] = {}
+
+    def _job_meta(self, job_id: str) -> dict[str, Any] | None:
+        """Read a job's metadata, once per executor.
+
+        Metadata is written at launch and never changes, so a hit is kept
+        for the rest of the invocation; misses are not cached.
+        """
+        meta = self._meta_cache.get(job_id)
+        if meta is None:
+            meta = read_job_meta(self.ssh, job_id)
+            if meta is not None:
+                self._meta_cache[job_id] = meta
+        return meta
+
+    def get_status(self, job_id: str, force: bool = False) -> JobStatus:
+        """Get status of specific job.
+
+        An answer is reused for STATUS_TTL seconds, so a status check
+        followed by a watch costs one query. Pass force=True for fresh state.
+        """
+        if not force:
+            hit = self._status_cache.get(job_id)
+            if hit is not None and time.monotonic() - hit[0] < STATUS_TTL:
+                return hit[1]
+        status = self._query_status(job_id)
+        self._status_cache[job_id] = (time.monotonic(), status)
+        return status
+
+    @abstractmethod
+    def _query_status(self, job_id: str) -> JobStatus:
+        """Query the remote for a job's status."""
+
+    def get_statuses(self, job_ids: list[str]) -> dict[str, JobStatus]:
+        """Get status of several jobs (one query per job unless overridden)."""
+        return {job_id: self.get_status(job_id) for job_id in job_ids}
 
     def get_log_path(self, job_id: str) -> str | None:
         """Get log file path for a job."""
-        meta = read_job_meta(self.ssh, job_id)
+        meta = self._job_meta(job_id)
         return meta.get("log") if meta else None
 
     def show_log(self, job_id: str, follow: bool = False) -> int:
         """Show job output log."""
         from rex.output import error
 
-        meta = read_job_meta(self.ssh, job_id)
+        meta = self._job_meta(job_id)
         if not meta or "log" not in meta:
             error("Log not found", exit_now=False)
             return 1
 
-        log = meta["log"]
-        cmd = f'[ -f {log} ] || {{ echo "Log not found" >&2; exit 1; }}'
+        pid = meta.get("pid")
+        template = _FOLLOW_LOG if follow and pid else _SHOW_LOG
+        cmd = template.format(log=meta["log"], pid=pid)
 
-        if follow:
-            pid = meta.get("pid")
-            if pid:
-                cmd += f'; if kill -0 {pid} 2>/dev/null; then tail -f --pid={pid} {log}; else cat {log}; fi'
-            else:
-                cmd += f'; cat {log}'
-        else:
-            cmd += f'; cat {log}'
+        return self.ssh.exec_streaming(cmd, tty=follow)
+
+    def show_last_log(self, follow: bool = False) -> int:
+        """Show the most recent job's log in one remote call.
 
+        Finding the newest metadata file, reading it and streaming the log
+        all happen in the same script.
+        """
+        tail = (
+            'if kill -0 "$pid" 2>/dev/null; then tail -f --pid="$pid" "$log"; else cat "$log"; fi'
+            if follow else 'cat "$log"'
+        )
+        cmd = (
+            f"meta=$(ls -t {job_meta_dir()}/*.json 2>/dev/null | head -1); "
+            '[ -n "$meta" ] || { echo "No jobs found" >&2; exit 1; }; '
+            f'log=$({META_LOG_SED} "$meta"); log="${{log/#\\~/$HOME}}"; '
+            f'pid=$({META_PID_SED} "$meta"); '
+            '[ -n "$log" ] && [ -f "$log" ] || { echo "Log not found" >&2; exit 1; }; '
+            f'if [ -n "$pid" ]; then {tail}; else cat "$log"; fi'
+        )
         return self.ssh.exec_streaming(cmd, tty=follow)
 
     def last_job_id(self) -> str | None:
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import shlex
 import time
 
 from rex.execution.base import (
-    BaseExecutor, ExecutionContext, JobInfo, JobResult, JobStatus,
-    list_job_meta_names, log_path as _log_path, read_job_meta, rex_dir,
-    write_job_meta,
+    META_PID_SED, BaseExecutor, ExecutionContext, JobInfo, JobResult, JobStatus,
+    follow_while, job_meta_cmd, job_meta_dir, log_path as _log_path, rex_dir,
+    wait_while,
 )
 from rex.execution.script import build_script
 from rex.output import success, warn
 from rex.ssh.executor import SSHExecutor
-from rex.utils import generate_job_name
+from rex.utils import generate_job_name, heredoc_marker
 
 
 def _run_detached_nohup(
@@ -20,18 +21,25 @@ def _run_detached_nohup(
     bash_cmd: str,
     remote_log: str,
     job_name: str,
+    setup: str = "",
 ) -> JobInfo:
-    """Run command detached via nohup and return JobInfo."""
+    """Run command detached via nohup and return JobInfo.
+
+    setup runs first in the same SSH call; if it fails nothing is launched.
+    The metadata write shares that call too.
+    """
+    meta = job_meta_cmd(job_name, remote_log, pid="$pid")
     nohup_cmd = (
-        f"nohup bash -c '{bash_cmd}' > {remote_log} 2>&1 & "
-        f"pid=$!; disown $pid 2>/dev/null; sleep 0.5; echo $pid"
+        f"{setup}nohup bash -c '{bash_cmd}' > {remote_log} 2>&1 & "
+        f"pid=$!; disown $pid 2>/dev/null; {meta}; sleep 0.5; echo $pid"
     )
 
-    _, stdout, _ = ssh.exec(nohup_cmd)
+    code, stdout, stderr = ssh.exec(nohup_cmd)
+    if setup and code != 0:
+        from rex.exceptions import ExecutionError
+        raise ExecutionError(f"Failed to write script: {stderr}")
     pid = int(stdout.strip()) if stdout.strip() else None
 
-    write_job_meta(ssh, job_name, remote_log, pid=pid)
-
     target = ssh.target
     success(f"Detached: {job_name} (PID {pid})")
     print(f"Log:    rex {target} --log {job_name}")
@@ -48,19 +56,25 @@ def _run_detached_nohup(
 class DirectExecutor(BaseExecutor):
     """Direct SSH execution (non-SLURM).
 
-    Uses nohup for detached jobs, pgrep/kill for job management.
+    Uses nohup for detached jobs, PIDs from job metadata and kill for job management.
     """
 
     def __init__(self, ssh: SSHExecutor):
         super().__init__(ssh)
 
-    def _write_script(self, remote_path: str, content: str) -> None:
-        """Write a script to the remote host."""
-        write_cmd = f"""cat > {remote_path} << 'REXSCRIPT'
+    @staticmethod
+    def _write_script_cmd(remote_path: str, content: str) -> str:
+        """Return the remote command that writes an executable script."""
+        remote_dir = remote_path.rsplit("/", 1)[0] or "/"
+        eof = heredoc_marker(content, "REXSCRIPT")
+        return f"""mkdir -p {remote_dir} && cat > {remote_path} << '{eof}'
 {content}
-REXSCRIPT
+{eof}
 chmod +x {remote_path}"""
-        code, _, stderr = self.ssh.exec(write_cmd)
+
+    def _write_script(self, remote_path: str, content: str) -> None:
+        """Write a script to the remote host, creating its directory."""
+        code, _, stderr = self.ssh.exec(self._write_script_cmd(remote_path, content))
         if code != 0:
             from rex.exceptions import ExecutionError
             raise ExecutionError(f"Failed to write script: {stderr}")
@@ -70,23 +84,22 @@ chmod +x {remote_path}"""
 
         Runs directly over SSH with output teed to a log file.
         Dies on disconnect — use exec_detached for persistent jobs.
+        Writing the script and metadata shares the one SSH call.
         """
         job_name = generate_job_name()
         remote_dir = rex_dir(ctx.run_dir)
         remote_script = f"{remote_dir}/rex-{job_name}.sh"
         remote_log = _log_path(job_name, ctx.run_dir)
 
-        self.ssh.exec(f"mkdir -p {remote_dir}")
-        self._write_script(remote_script, build_script(ctx, cmd))
-
-        exit_code = self.ssh.exec_streaming(
+        write = self._write_script_cmd(remote_script, build_script(ctx, cmd))
+        return self.ssh.exec_streaming(
+            f"{write} || exit 1\n"
+            # $$ is the remote shell, which lives until the pipeline exits
+            f"{job_meta_cmd(job_name, remote_log, pid='$$')}\n"
             f"{remote_script} 2>&1 | tee {remote_log}; "
             f"_e=${{PIPESTATUS[0]}}; rm -f {remote_script}; exit $_e",
         )
 
-        write_job_meta(self.ssh, job_name, remote_log)
-        return exit_code
-
     def exec_detached(
         self, ctx: ExecutionContext, cmd: str, job_name: str
     ) -> JobInfo:
@@ -95,42 +108,65 @@ chmod +x {remote_path}"""
         remote_script = f"{remote_dir}/rex-{job_name}.sh"
         remote_log = _log_path(job_name, ctx.run_dir)
 
-        self.ssh.exec(f"mkdir -p {remote_dir}")
-        self._write_script(remote_script, build_script(ctx, cmd))
-
+        # Write and launch in one round-trip
+        setup = self._write_script_cmd(remote_script, build_script(ctx, cmd))
         return _run_detached_nohup(
-            self.ssh, remote_script, remote_log, job_name
+            self.ssh, remote_script, remote_log, job_name,
+            setup=f"{setup} || exit 1\n",
         )
 
     def _pid_from_meta(self, job_id: str) -> int | None:
         """Read PID from job metadata."""
-        meta = read_job_meta(self.ssh, job_id)
+        meta = self._job_meta(job_id)
         return meta.get("pid") if meta else None
 
     def list_jobs(self, since_minutes: int = 0) -> list[JobStatus]:
-        """List all rex jobs on remote."""
-        names = list_job_meta_names(self.ssh)
+        """List all rex jobs on remote, newest first.
+
+        One grep pulls every PID and a remote loop probes them with the
+        kill builtin, so the remote fork count does not grow with the
+        number of jobs. Running jobs are always listed; with
+        since_minutes > 0, finished jobs are limited remotely to metadata
+        modified in that window.
+        """
+        if since_minutes > 0:
+            recent = (
+                f'recent=" $(find . -maxdepth 1 -name \'*.json\' -mmin -{since_minutes} '
+                "-printf '%f ' 2>/dev/null) \"; "
+            )
+            finished = 'case "$recent" in *" $f "*) echo "${f%.json} completed";; esac'
+        else:
+            recent = ""
+            finished = 'echo "${f%.json} completed"'
+        code, stdout, _ = self.ssh.exec(
+            f"cd {job_meta_dir()} 2>/dev/null || exit 0; {recent}"
+            "declare -A pids; "
+            'while IFS=: read -r f v; do pids[$f]=${v##*[ :]}; done '
+            """< <(grep -Ho '"pid": *[0-9]*' -- *.json 2>/dev/null); """
+            "for f in $(ls -t -- *.json 2>/dev/null); do "
+            '[ -s "$f" ] || continue; '
+            'pid=${pids[$f]}; '
+            'if [ -n "$pid" ] && kill -0 "$pid" 2>/dev/null; then echo "${f%.json} running $pid"; '
+            f"else {finished}; fi; done"
+        )
+        if code != 0:
+            return []
+
         jobs = []
-        for name in names:
-            meta = read_job_meta(self.ssh, name)
-            if not meta:
+        for line in stdout.splitlines():
+            parts = line.split()
+            if len(parts) < 2:
                 continue
-            pid = meta.get("pid")
-            if pid:
-                code, _, _ = self.ssh.exec(f"kill -0 {pid} 2>/dev/null")
-                status = "running" if code == 0 else "completed"
-            else:
-                status = "completed"
             jobs.append(JobStatus(
-                job_id=name,
-                status=status,
-                pid=pid if status == "running" else None,
+                job_id=parts[0],
+                status=parts[1],
+                pid=int(parts[2]) if len(parts) >= 3 else None,
                 hostname=self.ssh.target,
             ))
         return jobs
 
-    def get_status(self, job_id: str) -> JobStatus:
-        """Get status of specific job."""
+    def _query_status(self, job_id: str) -> JobStatus:
+        """Read the job's PID from metadata and probe it."""
         pid = self._pid_from_meta(job_id)
         if pid is None:
             return JobStatus(job_id=job_id, status="unknown")
@@ -141,6 +177,27 @@ chmod +x {remote_path}"""
             job_id=job_id, status=status, pid=pid if status == "running" else None
         )
 
+    def get_statuses(self, job_ids: list[str]) -> dict[str, JobStatus]:
+        """Get status of several jobs with one remote loop over their metadata."""
+        ids = " ".join(shlex.quote(job_id) for job_id in job_ids)
+        code, stdout, _ = self.ssh.exec(
+            f"for id in {ids}; do "
+            f'pid=$({META_PID_SED} {job_meta_dir()}/"$id".json 2>/dev/null); '
+            'if [ -z "$pid" ]; then echo "$id unknown"; '
+            'elif kill -0 "$pid" 2>/dev/null; then echo "$id running $pid"; '
+            'else echo "$id completed"; fi; done'
+        )
+
+        statuses = {job_id: JobStatus(job_id=job_id, status="unknown") for job_id in job_ids}
+        if code != 0:
+            return statuses
+        for line in stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[0] in statuses:
+                pid = int(parts[2]) if len(parts) >= 3 else None
+                statuses[parts[0]] = JobStatus(job_id=parts[0], status=parts[1], pid=pid)
+        return statuses
+
     def kill_job(self, job_id: str) -> bool:
         """Kill a running job."""
         pid = self._pid_from_meta(job_id)
@@ -155,13 +212,22 @@ chmod +x {remote_path}"""
         warn(f"Failed to kill job {job_id}")
         return False
 
-    def watch_job(self, job_id: str, poll_interval: int = 5) -> JobResult:
-        """Wait for job to complete."""
+    def watch_job(
+        self, job_id: str, poll_interval: int | None = None, follow_log: bool = False
+    ) -> JobResult:
+        """Wait for job to complete, optionally streaming its log."""
+        if poll_interval is None:
+            poll_interval = self.poll_interval
         max_failures = 3
         failures = 0
+        polled = False
+        log = self.get_log_path(job_id) if follow_log else None
+        followed = False
 
         while True:
-            status = self.get_status(job_id)
+            # The first check may reuse a status fetched just before
+            status = self.get_status(job_id, force=polled)
+            polled = True
 
             if status.status == "unknown":
                 failures += 1
@@ -178,5 +244,10 @@ chmod +x {remote_path}"""
                 success(f"Job {job_id} completed")
                 return JobResult(job_id=job_id, status="completed", exit_code=0)
 
-            time.sleep(poll_interval)
+            check = f"kill -0 {status.pid} 2>/dev/null"
+            if log:
+                follow_while(self.ssh, check, log, poll_interval, from_start=not followed)
+                followed = True
+            else:
+                wait_while(self.ssh, check, poll_interval)
 
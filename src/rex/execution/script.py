@@ -11,6 +11,9 @@ if TYPE_CHECKING:
     from rex.ssh.executor import SSHExecutor
     from typing_extensions import Self
 
+# $VAR or ${VAR}, compiled once at import
+_VAR_REF_RE = re.compile(r'\$[A-Za-z_][A-Za-z0-9_]*|\$\{[^}]+\}')
+
 
 def quote_with_expansion(value: str) -> str:
     """Quote a value for shell, allowing $VAR expansion if present.
@@ -19,7 +22,7 @@ def quote_with_expansion(value: str) -> str:
     uses double quotes and escapes dangerous characters while preserving
     variable expansion. Otherwise, uses shlex.quote() for full escaping.
     """
-    if re.search(r'\$[A-Za-z_][A-Za-z0-9_]*|\$\{[^}]+\}', value):
+    if _VAR_REF_RE.search(value):
         escaped = value.replace('\\', '\\\\')
         escaped = escaped.replace('"', '\\"')
         escaped = escaped.replace('`', '\\`')
@@ -2,46 +2,48 @@
 
 from __future__ import annotations
 
+import re
+import shlex
 import time
-from dataclasses import dataclass
+
 from rex.exceptions import SSHError
 from rex.execution.base import (
-    BaseExecutor, ExecutionContext, JobInfo, JobResult, JobStatus,
-    log_path as _log_path, rex_dir, write_job_meta,
+    ACTIVE_STATES, BaseExecutor, ExecutionContext, JobInfo, JobResult, JobStatus, SlurmOptions,
+    follow_while, job_meta_cmd, log_path as _log_path, rex_dir, wait_while,
+    write_job_meta,
 )
 from rex.execution.script import SbatchBuilder, build_context_commands
-from rex.output import debug, error, success, warn
+from rex.output import debug, success, warn
 from rex.ssh.executor import SSHExecutor
-from rex.utils import generate_job_name, generate_script_id
+from rex.utils import generate_job_name, generate_script_id, heredoc_marker, shell_quote
 
+# Final or queued states sacct may report; anything else reads as completed
+_SACCT_STATES = (
+    "FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "OUT_OF_MEMORY",
+    "COMPLETED", "PENDING", "RUNNING", "REQUEUED",
+)
 
-def _ssh_write(ssh: SSHExecutor, content: str, remote_path: str, chmod: str | None = None) -> None:
-    """Write content to remote file via SSH.
+# One squeue/sacct row: "ID|rex-NAME|STATE" (sacct may append "by UID")
+_JOB_LINE_RE = re.compile(r"^(\d+)\|rex-([^|\n]+)\|([A-Za-z_]+)", re.MULTILINE)
 
-    Raises SSHError on failure with user-friendly message.
-    """
-    cmd = f"""cat > {remote_path} << 'REXWRITE'
-{content}
-REXWRITE"""
-    if chmod:
-        cmd += f"\nchmod {chmod} {remote_path}"
 
-    code, _, stderr = ssh.exec(cmd)
-    if code != 0:
-        raise SSHError(f"Failed to write to {remote_path}: {stderr.strip() or 'SSH error'}")
+def _slurm_name(job_id: str) -> str:
+    """Return the shell-quoted SLURM job name for a rex job ID."""
+    return shlex.quote(f"rex-{job_id}")
 
 
-@dataclass
-class SlurmOptions:
-    """SLURM-specific options."""
+def _write_file_cmd(content: str, remote_path: str, chmod: str | None = None) -> str:
+    """Return the remote command that writes content to a file.
 
-    partition: str | None = None
-    gres: str | None = None
-    time: str | None = None
-    cpus: int | None = None
-    mem: str | None = None
-    constraint: str | None = None
-    prefer: str | None = None
+    The command exits the calling shell with status 1 if the write fails.
+    """
+    eof = heredoc_marker(content, "REXWRITE")
+    cmd = f"""cat > {remote_path} << '{eof}' || exit 1
+{content}
+{eof}"""
+    if chmod:
+        cmd += f"\nchmod {chmod} {remote_path} || exit 1"
+    return cmd
 
 
 class SlurmExecutor(BaseExecutor):
@@ -51,6 +53,10 @@ class SlurmExecutor(BaseExecutor):
     Uses squeue/scancel for job management.
     """
 
+    # Each poll is an squeue plus sacct query on the cluster
+    poll_interval = 10
+    min_poll = 5.0
+
     # Single source of truth: (attribute_name, slurm_option_name)
     OPTION_MAPPINGS = [
         ("partition", "partition"),
@@ -96,11 +102,6 @@ class SlurmExecutor(BaseExecutor):
         Uses srun for proper SLURM signal forwarding, but also writes
         a log and metadata so the job is retrievable after completion.
         """
-        # Check for heredoc delimiter collision
-        if "\nREXCMD\n" in f"\n{cmd}\n":
-            error("Command contains 'REXCMD' as a line, which conflicts with internal delimiter", exit_now=False)
-            return 1
-
         debug(f"[slurm] exec_foreground: {cmd[:80]}{'...' if len(cmd) > 80 else ''}")
         job_name = generate_job_name()
         script_id = generate_script_id()
@@ -114,29 +115,19 @@ class SlurmExecutor(BaseExecutor):
         prefix_lines = ["#!/bin/bash -l"] + context_cmds + [f"source {remote_cmd}"]
         script_content = "\n".join(prefix_lines) + "\n"
 
-        # Write command to separate file using heredoc (preserves all quoting)
-        self.ssh.exec(f"mkdir -p {remote_dir}")
-        write_cmd = f"""cat > {remote_cmd} << 'REXCMD'
-{cmd}
-REXCMD"""
-        code, _, stderr = self.ssh.exec(write_cmd)
-        if code != 0:
-            warn(f"Failed to write command: {stderr}")
-            return code
-
-        # Write wrapper script
-        _ssh_write(self.ssh, script_content, remote_script, chmod="+x")
-
-        # Execute via srun, tee output to log for later retrieval
+        # Write the command file (heredoc preserves all quoting) and the
+        # wrapper, record metadata and run via srun, all in one SSH call
         slurm_opts = self._build_slurm_opts()
         exit_code = self.ssh.exec_streaming(
+            f"mkdir -p {remote_dir} || exit 1\n"
+            f"{_write_file_cmd(cmd, remote_cmd)}\n"
+            f"{_write_file_cmd(script_content, remote_script, chmod='+x')}\n"
+            f"{job_meta_cmd(job_name, remote_log)}\n"
             f"srun{slurm_opts} {remote_script} 2>&1 | tee {remote_log}; "
             f"_e=${{PIPESTATUS[0]}}; rm -f {remote_script} {remote_cmd}; exit $_e",
             tty=True,
         )
 
-        write_job_meta(self.ssh, job_name, remote_log)
-
         return exit_code
 
     def exec_detached(
@@ -149,8 +140,6 @@ REXCMD"""
         remote_sbatch = f"{remote_dir}/rex-{job_name}.sbatch"
         remote_log = _log_path(job_name, ctx.run_dir)
 
-        self.ssh.exec(f"mkdir -p {remote_dir}")
-
         # Build sbatch script
         builder = SbatchBuilder().shebang(login=True)
         builder.job_name(f"rex-{job_name}")
@@ -168,10 +157,12 @@ REXCMD"""
 
         sbatch_content = builder.build()
 
-        # Write and submit
-        _ssh_write(self.ssh, sbatch_content, remote_sbatch)
-
-        code, stdout, stderr = self.ssh.exec(f"sbatch --parsable {remote_sbatch}")
+        # Create the directory, write the script and submit in one round-trip
+        eof = heredoc_marker(sbatch_content, "REXWRITE")
+        code, stdout, stderr = self.ssh.exec(
+            f"mkdir -p {remote_dir} && cat > {remote_sbatch} << '{eof}' && "
+            f"sbatch --parsable {remote_sbatch}\n{sbatch_content}\n{eof}"
+        )
         if code != 0 or not stdout.strip():
             err_msg = stderr.strip() or stdout.strip() or "unknown error"
             warn(f"sbatch failed: {err_msg}")
@@ -220,32 +211,9 @@ REXCMD"""
         """List all rex SLURM jobs."""
         # Get active jobs from squeue
         code, stdout, _ = self.ssh.exec(
-            "squeue -u $USER -o '%.10i %.30j %.12T %.10M' 2>/dev/null | grep rex"
+            "squeue -u $USER -h -o '%i|%j|%T' 2>/dev/null | grep '|rex-'"
         )
-
-        jobs = []
-        seen_ids: set[int] = set()
-
-        for line in stdout.strip().split("\n"):
-            if not line or "rex" not in line:
-                continue
-            parts = line.split()
-            if len(parts) >= 3:
-                try:
-                    slurm_id = int(parts[0])
-                except ValueError:
-                    continue  # Skip malformed lines
-                name = parts[1]
-                status = parts[2].lower()
-                # Extract job_id from name (rex-<job_id>)
-                job_id = name.replace("rex-", "") if name.startswith("rex-") else name
-                jobs.append(JobStatus(
-                    job_id=job_id,
-                    status=status,
-                    slurm_id=slurm_id,
-                    hostname=self.ssh.target,
-                ))
-                seen_ids.add(slurm_id)
+        jobs = self._parse_job_lines(stdout, set())
 
         # Get recently finished jobs from sacct
         if since_minutes > 0:
@@ -253,32 +221,26 @@ REXCMD"""
                 f"sacct -u $USER --starttime=now-{since_minutes}minutes "
                 f"-o JobID,JobName,State --parsable2 2>/dev/null | grep -E '^[0-9]+\\|rex-'"
             )
-            for line in stdout.strip().split("\n"):
-                if not line:
-                    continue
-                parts = line.split("|")
-                if len(parts) >= 3:
-                    try:
-                        slurm_id = int(parts[0])
-                    except ValueError:
-                        continue
-                    if slurm_id in seen_ids:
-                        continue  # Skip if already in squeue results
-                    name = parts[1]
-                    status = parts[2].lower()
-                    # Handle "cancelled by ..." status
-                    if status.startswith("cancelled"):
-                        status = "cancelled"
-                    job_id = name.replace("rex-", "") if name.startswith("rex-") else name
-                    jobs.append(JobStatus(
-                        job_id=job_id,
-                        status=status,
-                        slurm_id=slurm_id,
-                        hostname=self.ssh.target,
-                    ))
+            jobs += self._parse_job_lines(stdout, {job.slurm_id for job in jobs})
 
         return jobs
 
+    def _parse_job_lines(self, output: str, seen_ids: set[int | None]) -> list[JobStatus]:
+        """Parse 'ID|rex-NAME|STATE' lines, skipping SLURM IDs already seen."""
+        jobs = []
+        for match in _JOB_LINE_RE.finditer(output):
+            slurm_id = int(match[1])
+            if slurm_id in seen_ids:
+                continue  # Skip if already in squeue results
+            seen_ids.add(slurm_id)
+            jobs.append(JobStatus(
+                job_id=match[2],
+                status=match[3].lower(),
+                slurm_id=slurm_id,
+                hostname=self.ssh.target,
+            ))
+        return jobs
+
     def _query_job_state(self, job_id: str) -> str:
         """Query SLURM for a job's current state.
 
@@ -287,7 +249,7 @@ REXCMD"""
         if neither source has information.
         """
         code, stdout, _ = self.ssh.exec(
-            f"squeue -u $USER -n rex-{job_id} -h -o %T 2>/dev/null"
+            f"squeue -u $USER -n {_slurm_name(job_id)} -h -o %T 2>/dev/null"
         )
         if code != 0:
             raise SSHError("squeue query failed")
@@ -298,43 +260,81 @@ REXCMD"""
 
         # Job not in squeue — check sacct for final status
         code, stdout, _ = self.ssh.exec(
-            f"sacct -n -X --name=rex-{job_id} --format=State 2>/dev/null | head -1 | tr -d ' '"
+            f"sacct -n -X --name={_slurm_name(job_id)} --format=State 2>/dev/null | head -1 | tr -d ' '"
         )
         sacct_status = stdout.strip().upper()
-        if sacct_status in (
-            "FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "OUT_OF_MEMORY",
-            "COMPLETED", "PENDING", "RUNNING", "REQUEUED",
-        ):
+        if sacct_status in _SACCT_STATES:
             return sacct_status.lower()
 
         return "completed"
 
-    def get_status(self, job_id: str) -> JobStatus:
-        """Get status of specific SLURM job."""
+    def _query_status(self, job_id: str) -> JobStatus:
+        """Query squeue/sacct for the job's state."""
         try:
             state = self._query_job_state(job_id)
         except SSHError:
             return JobStatus(job_id=job_id, status="unknown")
         return JobStatus(job_id=job_id, status=state)
 
+    def get_statuses(self, job_ids: list[str]) -> dict[str, JobStatus]:
+        """Get status of several SLURM jobs with one squeue + sacct call.
+
+        Same precedence as _query_job_state: squeue wins, then the first
+        sacct record, then "completed".
+        """
+        names = ",".join(f"rex-{job_id}" for job_id in job_ids)
+        code, stdout, _ = self.ssh.exec(
+            "squeue -u $USER -h -o '%j %T' 2>/dev/null || exit 1; echo ---; "
+            f"sacct -n -X --name={shell_quote(names)} --format=JobName%200,State 2>/dev/null"
+        )
+        if code != 0:
+            return {job_id: JobStatus(job_id=job_id, status="unknown") for job_id in job_ids}
+
+        queued, _, finished = stdout.partition("---")
+        active: dict[str, str] = {}
+        for line in queued.splitlines():
+            parts = line.split()
+            if len(parts) >= 2:
+                active[parts[0]] = parts[1].lower()
+        final: dict[str, str] = {}
+        for line in finished.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].upper() in _SACCT_STATES:
+                final.setdefault(parts[0], parts[1].lower())
+
+        statuses = {}
+        for job_id in job_ids:
+            name = f"rex-{job_id}"
+            state = active.get(name) or final.get(name) or "completed"
+            statuses[job_id] = JobStatus(job_id=job_id, status=state)
+        return statuses
+
     def kill_job(self, job_id: str) -> bool:
         """Cancel SLURM job."""
-        code, _, _ = self.ssh.exec(f"scancel -n rex-{job_id}")
+        code, _, _ = self.ssh.exec(f"scancel -n {_slurm_name(job_id)}")
         if code == 0:
             success(f"Cancelled job {job_id}")
             return True
         warn(f"Failed to cancel job {job_id}")
         return False
 
-    def watch_job(self, job_id: str, poll_interval: int = 10) -> JobResult:
-        """Wait for SLURM job to complete."""
+    def watch_job(
+        self, job_id: str, poll_interval: int | None = None, follow_log: bool = False
+    ) -> JobResult:
+        """Wait for SLURM job to complete, optionally streaming its log."""
+        if poll_interval is None:
+            poll_interval = self.poll_interval
         max_failures = 3
         failures = 0
+        polled = False
+        log = self.get_log_path(job_id) if follow_log else None
+        followed = False
 
         while True:
-            try:
-                state = self._query_job_state(job_id)
-            except SSHError:
+            # The first check may reuse a status fetched just before
+            state = self.get_status(job_id, force=polled).status
+            polled = True
+            if state == "unknown":
                 failures += 1
                 if failures >= max_failures:
                     warn(f"Lost connection after {max_failures} attempts")
@@ -345,8 +345,16 @@ REXCMD"""
 
             failures = 0
 
-            if state in ("running", "pending", "requeued", "configuring"):
-                time.sleep(poll_interval)
+            if state in ACTIVE_STATES:
+                check = (
+                    f"squeue -u $USER -n {_slurm_name(job_id)} -h -o %T 2>/dev/null"
+                    f" | grep -qxiE '{'|'.join(ACTIVE_STATES)}'"
+                )
+                if log:
+                    follow_while(self.ssh, check, log, poll_interval, from_start=not followed)
+                    followed = True
+                else:
+                    wait_while(self.ssh, check, poll_interval)
                 continue
 
             if state == "completed":
@@ -0,0 +1,149 @@
+"""Fast argv parser for the common CLI invocations.
+
+Handles the plain ``rex HOST --flag value`` grammar with a single pass over
+argv and a dict lookup per token. Anything it does not understand exactly
+(help, version, abbreviations, combined short flags, ``--``, malformed
+values) returns None so the caller can fall back to argparse, which then
+produces the usual help text and error messages. argparse itself is not
+imported on the fast path; results are plain SimpleNamespace objects with
+the same attributes.
+
+The option table must stay in sync with ``rex.cli.build_parser``.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+# Option kinds
+_TRUE = "store_true"  # boolean flag
+_VALUE = "value"  # exactly one value
+_INT = "int"  # exactly one integer value
+_APPEND = "append"  # one value, accumulated into a list
+_OPTIONAL = "optional"  # zero or one value (nargs="?"), with a const
+_PLUS = "plus"  # one or more values (nargs="+")
+_STAR = "star"  # zero or more values (nargs="*")
+
+# flag -> (dest, kind, const)
+OPTIONS: dict[str, tuple[str, str, str | None]] = {
+    "-d": ("detach", _TRUE, None),
+    "--detach": ("detach", _TRUE, None),
+    "-n": ("name", _VALUE, None),
+    "--name": ("name", _VALUE, None),
+    "-m": ("modules", _APPEND, None),
+    "--module": ("modules", _APPEND, None),
+    "--partition": ("partition", _VALUE, None),
+    "--gres": ("gres", _VALUE, None),
+    "--time": ("time", _VALUE, None),
+    "--cpus": ("cpus", _INT, None),
+    "--mem": ("mem", _VALUE, None),
+    "--constraint": ("constraint", _VALUE, None),
+    "--prefer": ("prefer", _VALUE, None),
+    "--gpu": ("gpu", _TRUE, None),
+    "--cpu": ("cpu", _TRUE, None),
+    "--jobs": ("jobs", _TRUE, None),
+    "--since": ("since", _INT, None),
+    "--status": ("status", _OPTIONAL, "--last"),
+    "--log": ("log", _OPTIONAL, "--last"),
+    "--kill": ("kill", _OPTIONAL, "--last"),
+    "--watch": ("watch", _STAR, None),
+    "--info": ("info", _TRUE, None),
+    "--push": ("push", _PLUS, None),
+    "--pull": ("pull", _PLUS, None),
+    "--sync": ("sync", _OPTIONAL, "."),
+    "--build": ("build", _TRUE, None),
+    "--exec": ("exec_cmd", _VALUE, None),
+    "--login-node": ("login_node", _TRUE, None),
+    "--code-dir": ("code_dir", _TRUE, None),
+    "--read": ("read_path", _OPTIONAL, ""),
+    "--connect": ("connect", _TRUE, None),
+    "--disconnect": ("disconnect", _TRUE, None),
+    "--connection": ("connection", _TRUE, None),
+    "--manual": ("manual", _TRUE, None),
+    "--last": ("last", _TRUE, None),
+    "--json": ("json", _TRUE, None),
+    "-f": ("follow", _TRUE, None),
+    "--follow": ("follow", _TRUE, None),
+    "--clean": ("clean", _TRUE, None),
+    "--debug": ("debug", _TRUE, None),
+}
+
+_TAKES_VALUE = (_VALUE, _INT, _APPEND, _OPTIONAL, _PLUS)
+
+
+def _defaults() -> dict[str, object]:
+    """Return the default value for every destination."""
+    values: dict[str, object] = {"target": None}
+    for dest, kind, _ in OPTIONS.values():
+        if kind == _TRUE:
+            values[dest] = False
+        elif kind == _APPEND:
+            values[dest] = []
+        else:
+            values[dest] = None
+    return values
+
+
+def parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse argv into a Namespace, or return None to defer to argparse."""
+    values = _defaults()
+    i = 0
+    n = len(argv)
+
+    while i < n:
+        token = argv[i]
+        i += 1
+
+        if not token.startswith("-") or token == "-":
+            if token == "-" or values["target"] is not None:
+                return None
+            values["target"] = token
+            continue
+
+        flag, eq, inline = token.partition("=")
+        spec = OPTIONS.get(flag)
+        if spec is None:
+            return None
+        dest, kind, const = spec
+
+        if eq and kind not in _TAKES_VALUE:
+            return None
+
+        if kind == _TRUE:
+            values[dest] = True
+            continue
+
+        if kind in (_PLUS, _STAR):
+            items = [inline] if eq else []
+            if not eq:
+                while i < n and not argv[i].startswith("-"):
+                    items.append(argv[i])
+                    i += 1
+            if kind == _PLUS and not items:
+                return None
+            values[dest] = items
+            continue
+
+        if eq:
+            value: str | None = inline
+        elif i < n and not argv[i].startswith("-"):
+            value = argv[i]
+            i += 1
+        else:
+            value = None
+
+        if value is None:
+            if kind != _OPTIONAL:
+                return None
+            values[dest] = const
+        elif kind == _INT:
+            try:
+                values[dest] = int(value)
+            except ValueError:
+                return None
+        elif kind == _APPEND:
+            values[dest] = [*values[dest], value]  # type: ignore[misc]
+        else:
+            values[dest] = value
+
+    return SimpleNamespace(**values)
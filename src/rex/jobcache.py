@@ -0,0 +1,84 @@
+"""Short-lived cache of the most recent job ID per target.
+
+Resolving --last lists the remote job metadata directory over SSH. Chained
+invocations (``rex HOST --status --last && rex HOST --log --last``) would
+repeat that round-trip, so the answer is kept for a few seconds in a small
+JSON file under the rex cache directory. Submitting or killing a job drops
+the entry. Any problem reading or writing the cache is ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rex.utils import cache_dir
+
+if TYPE_CHECKING:
+    from rex.execution.base import Executor
+
+LAST_JOB_TTL = 30  # seconds
+
+
+def _entry_path(target: str) -> Path:
+    """Return the cache file for a target."""
+    digest = hashlib.sha1(target.encode()).hexdigest()
+    return cache_dir() / "lastjob" / digest
+
+
+def _read(target: str, ttl: float) -> str | None:
+    """Return the cached job ID if it is younger than ttl seconds."""
+    try:
+        with open(_entry_path(target)) as f:
+            entry = json.load(f)
+        job_id = entry["job_id"]
+        age = time.time() - float(entry["ts"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(job_id, str) or not 0 <= age < ttl:
+        return None
+    return job_id
+
+
+def _write(target: str, job_id: str) -> None:
+    """Cache job_id for target (atomic replace, best effort)."""
+    import tempfile  # only needed when writing
+
+    entry = _entry_path(target)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, prefix=".lastjob-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"job_id": job_id, "ts": time.time()}, f)
+            os.replace(tmp, entry)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def last_job_id(
+    executor: Executor, target: str, ttl: float = LAST_JOB_TTL
+) -> str | None:
+    """Return executor.last_job_id(), reusing a recent answer for target."""
+    job_id = _read(target, ttl)
+    if job_id is not None:
+        return job_id
+    job_id = executor.last_job_id()
+    if job_id:
+        _write(target, job_id)
+    return job_id
+
+
+def invalidate(target: str) -> None:
+    """Drop the cached last job for target."""
+    try:
+        _entry_path(target).unlink()
+    except OSError:
+        pass
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import logging
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import logging
 
 # ANSI color codes
 RED = "\033[31m"
@@ -14,24 +17,25 @@ DIM = "\033[2m"
 BOLD = "\033[1m"
 NC = "\033[0m"  # No color / reset
 
-# Module logger
-_logger = logging.getLogger("rex")
-
-
-class ColoredFormatter(logging.Formatter):
-    """Formatter that adds colors to log levels."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        msg = super().format(record)
-        if not _supports_color():
+def _colored_formatter() -> "logging.Formatter":
+    """Return a formatter that adds colors to log levels."""
+    import logging
+
+    class ColoredFormatter(logging.Formatter):
+        def format(self, record: logging.LogRecord) -> str:
+            msg = super().format(record)
+            if not _supports_color():
+                return msg
+            if record.levelno >= logging.ERROR:
+                return f"{RED}{msg}{NC}"
+            elif record.levelno >= logging.WARNING:
+                return f"{YELLOW}{msg}{NC}"
+            elif record.levelno <= logging.DEBUG:
+                return f"{DIM}{msg}{NC}"
             return msg
-        if record.levelno >= logging.ERROR:
-            return f"{RED}{msg}{NC}"
-        elif record.levelno >= logging.WARNING:
-            return f"{YELLOW}{msg}{NC}"
-        elif record.levelno <= logging.DEBUG:
-            return f"{DIM}{msg}{NC}"
-        return msg
+
+    return ColoredFormatter("%(message)s")
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -40,28 +44,38 @@ def setup_logging(debug: bool = False) -> None:
     Args:
         debug: If True, set log level to DEBUG. Otherwise, WARNING.
     """
+    import logging
+
+    logger = get_logger()
     level = logging.DEBUG if debug else logging.WARNING
-    _logger.setLevel(level)
+    logger.setLevel(level)
 
     # Only add handler if none exist
-    if not _logger.handlers:
+    if not logger.handlers:
         stream_handler = logging.StreamHandler(sys.stderr)
-        stream_handler.setFormatter(ColoredFormatter("%(message)s"))
-        _logger.addHandler(stream_handler)
+        stream_handler.setFormatter(_colored_formatter())
+        logger.addHandler(stream_handler)
     else:
         # Update existing handler level
-        for h in _logger.handlers:
+        for h in logger.handlers:
             h.setLevel(level)
 
 
-def get_logger() -> logging.Logger:
+def get_logger() -> "logging.Logger":
     """Get the rex logger for use in other modules."""
-    return _logger
+    import logging
+
+    return logging.getLogger("rex")
 
 
 def debug(msg: str) -> None:
-    """Log debug message (only shown with --debug flag)."""
-    _logger.debug(msg)
+    """Log debug message (only shown with --debug flag).
+
+    logging is imported lazily; if nothing has imported it, nothing can
+    have configured a handler, so the message is dropped without loading it.
+    """
+    if "logging" in sys.modules:
+        get_logger().debug(msg)
 
 
 def _supports_color(stream: object = None) -> bool:
@@ -108,6 +122,17 @@ def success(msg: str) -> None:
     print(_colorize(GREEN, msg), file=sys.stderr)
 
 
+def print_json(data: object) -> None:
+    """Print JSON to stdout, indented for a terminal and compact when piped."""
+    import json
+
+    if sys.stdout.isatty():
+        text = json.dumps(data, indent=2)
+    else:
+        text = json.dumps(data, separators=(",", ":"))
+    sys.stdout.write(text + "\n")
+
+
 def colorize_status(status: str) -> str:
     """Colorize job status string (for stdout)."""
     lower = status.lower().strip()
@@ -1,7 +1,29 @@
 """SSH operations."""
 
-from rex.ssh.connection import SSHConnection
-from rex.ssh.executor import SSHExecutor
-from rex.ssh.transfer import FileTransfer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rex.ssh.connection import SSHConnection
+    from rex.ssh.executor import SSHExecutor
+    from rex.ssh.transfer import FileTransfer
+
+# Exported names are imported on first access (see rex.config)
+_LAZY = {
+    "SSHConnection": "rex.ssh.connection",
+    "SSHExecutor": "rex.ssh.executor",
+    "FileTransfer": "rex.ssh.transfer",
+}
 
 __all__ = ["SSHConnection", "SSHExecutor", "FileTransfer"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
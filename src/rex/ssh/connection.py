@@ -106,20 +106,24 @@ class SSHConnection:
         if not SOCKET_DIR.exists():
             return active
 
+        # Start every liveness check before waiting on any, so listing
+        # takes about one check's time however many sockets there are
+        checks: list[tuple[Path, str, subprocess.Popen[bytes]]] = []
         for socket in SOCKET_DIR.iterdir():
             if not socket.is_socket():
                 continue
 
             # Reconstruct target: -- becomes @
             target = socket.name.replace("--", "@")
-
-            # Verify connection is alive
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 ["ssh", "-O", "check", "-o", f"ControlPath={socket}", target],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
+            checks.append((socket, target, proc))
 
-            if result.returncode == 0:
+        for socket, target, proc in checks:
+            if proc.wait() == 0:
                 active.append((target, str(socket)))
             else:
                 # Stale socket, remove it
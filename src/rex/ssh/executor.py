@@ -9,14 +9,27 @@ from pathlib import Path
 
 from rex.exceptions import SSHError
 from rex.output import debug
-from rex.utils import shell_quote
+from rex.utils import cache_dir, shell_quote
 
 SOCKET_DIR = Path.home() / ".ssh" / "controlmasters"
 
+# How long an implicitly opened master stays up after its last session, so
+# back-to-back rex invocations reuse one authenticated connection.
+CONTROL_PERSIST = "60s"
 
-def _ensure_socket_dir() -> None:
-    """Ensure SSH control socket directory exists."""
-    SOCKET_DIR.mkdir(parents=True, exist_ok=True)
+
+def pool_dir() -> Path:
+    """Return the directory for implicitly opened ControlMaster sockets.
+
+    Kept apart from SOCKET_DIR so that short-lived masters are not
+    reported as --connect connections.
+    """
+    return cache_dir() / "cm"
+
+
+def _ensure_dir(path: Path) -> None:
+    """Ensure a control socket directory exists."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
 
 
 class SSHExecutor:
@@ -47,9 +60,23 @@ class SSHExecutor:
             if check_result.returncode == 0:
                 return  # Connection is good
 
-            # Socket exists but is stale - remove it
+            # Socket exists but is stale - remove it and switch to the pool
             debug(f"[ssh] Stale socket at {socket}, removing")
             socket.unlink()
+            self._opts = self._build_opts()
+
+        # A pooled master left by a recent invocation is just as good
+        # (verbose runs don't use the pool; see _build_opts)
+        pooled = self._pool_socket_path()
+        if not self.verbose and pooled.exists():
+            check_result = subprocess.run(
+                ["ssh", "-O", "check", "-o", f"ControlPath={pooled}", self.target],
+                capture_output=True,
+            )
+            if check_result.returncode == 0:
+                return
+            debug(f"[ssh] Stale socket at {pooled}, removing")
+            pooled.unlink()
 
         # Try a quick connection test
         result = subprocess.run(
@@ -76,10 +103,35 @@ class SSHExecutor:
             else:
                 raise SSHError(f"SSH connection to {self.target} failed: {stderr or 'Unknown error'}")
 
+    def close(self) -> None:
+        """Shut down the pooled master for this target, if one is running.
+
+        A persistent --connect master is left alone. Without close(), the
+        pooled master exits on its own CONTROL_PERSIST after the last session.
+        """
+        pooled = self._pool_socket_path()
+        if not pooled.exists():
+            return
+        debug(f"[ssh] Closing pooled master at {pooled}")
+        subprocess.run(
+            ["ssh", "-O", "exit", "-o", f"ControlPath={pooled}", self.target],
+            capture_output=True,
+        )
+
+    def __enter__(self) -> "SSHExecutor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
     def _socket_path(self) -> Path:
         """Get socket path for this target."""
         return SOCKET_DIR / self.target.replace("@", "--")
 
+    def _pool_socket_path(self) -> Path:
+        """Get the pooled (implicit, short-lived) socket path for this target."""
+        return pool_dir() / self.target.replace("@", "--")
+
     def _build_opts(self) -> list[str]:
         """Build SSH options list."""
         opts = []
@@ -96,12 +148,24 @@ class SSHExecutor:
             "-o", "ServerAliveCountMax=3",
         ])
 
-        _ensure_socket_dir()
+        # Prefer a persistent --connect master; otherwise share a pooled
+        # master that lingers for CONTROL_PERSIST after the last session.
+        # Not with -v: the backgrounded master keeps the caller's stderr
+        # open, so captured calls would hang until it exits.
         socket = self._socket_path()
-        opts.extend([
-            "-o", f"ControlPath={socket}",
-            "-o", "ControlMaster=auto",
-        ])
+        if socket.exists():
+            opts.extend([
+                "-o", f"ControlPath={socket}",
+                "-o", "ControlMaster=auto",
+            ])
+        elif not self.verbose:
+            socket = self._pool_socket_path()
+            _ensure_dir(socket.parent)
+            opts.extend([
+                "-o", f"ControlPath={socket}",
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPersist={CONTROL_PERSIST}",
+            ])
 
         return opts
 
@@ -1,14 +1,15 @@
-"""File transfer operations (rsync, scp)."""
+"""File transfer operations (rsync, tar over ssh)."""
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 
 from rex.exceptions import TransferError
 from rex.output import info, success
 from rex.ssh.executor import SSHExecutor
-from rex.utils import map_to_remote, shell_quote
+from rex.utils import home_relative, shell_quote
 
 # Default rsync exclusions for Python projects
 DEFAULT_SYNC_EXCLUDES = [
@@ -32,6 +33,44 @@ DEFAULT_SYNC_EXCLUDES = [
 # Backwards compatibility alias
 PYTHON_EXCLUDES = DEFAULT_SYNC_EXCLUDES
 
+# Printed by the remote mkdir step when the push destination does not exist
+_NEW_DEST = "rex-new-dest"
+
+
+def sync_jobs() -> int:
+    """Return the number of concurrent rsyncs for sync ($REX_SYNC_JOBS, default 1)."""
+    try:
+        return max(1, int(os.environ.get("REX_SYNC_JOBS", "1")))
+    except ValueError:
+        return 1
+
+
+def _shard_entries(local: Path, jobs: int) -> list[list[str]]:
+    """Split a directory's top-level entries into at most jobs groups."""
+    if jobs <= 1:
+        return []
+    entries = sorted(entry.path for entry in os.scandir(local))
+    return [entries[i::jobs] for i in range(min(jobs, len(entries)))]
+
+
+def _tar_exclude_args(excludes: list[str]) -> list[str]:
+    """Translate rsync exclude patterns into tar options.
+
+    tar matches "dir/" against nothing (members have no trailing slash) and
+    has no notion of rsync's "/" anchor, so the slash is dropped and
+    anchored patterns are matched from the archive root ("./").
+    """
+    floating: list[str] = []
+    anchored: list[str] = []
+    for pattern in excludes:
+        pattern = pattern.rstrip("/") or pattern
+        if pattern.startswith("/"):
+            anchored.append(f"--exclude=.{pattern}")
+        else:
+            floating.append(f"--exclude={pattern}")
+    # --anchored only affects the --exclude options that follow it
+    return floating + (["--anchored", *anchored] if anchored else [])
+
 
 class FileTransfer:
     """File transfer operations via rsync/scp."""
@@ -42,16 +81,111 @@ class FileTransfer:
 
     def _rsync_ssh_arg(self) -> list[str]:
         """Build rsync -e flag to reuse the SSH multiplexed socket."""
-        opts = self.executor._build_opts()
+        opts = self.executor._opts
         ssh_cmd = "ssh " + " ".join(shell_quote(o) for o in opts)
         return ["-e", ssh_cmd]
 
+    def _ssh_args(self, cmd: str) -> list[str]:
+        """Build an ssh argv running cmd over the executor's connection.
+
+        Used for bulk tar streams, so ask for throughput-oriented QoS (only
+        takes effect when this call opens the connection).
+        """
+        return ["ssh", *self.executor._opts, "-o", "IPQoS=throughput", self.target, cmd]
+
+    @staticmethod
+    def _pipe(reader: list[str], writer: list[str]) -> int:
+        """Run reader | writer; return the first non-zero exit code."""
+        src = subprocess.Popen(reader, stdout=subprocess.PIPE)
+        try:
+            result = subprocess.run(writer, stdin=src.stdout)
+        finally:
+            if src.stdout is not None:
+                src.stdout.close()
+            src_code = src.wait()
+        return src_code or result.returncode
+
+    def bulk_push(
+        self,
+        local_dir: str | os.PathLike[str],
+        remote_dir: str,
+        excludes: list[str] | None = None,
+    ) -> None:
+        """Stream a directory's contents into remote_dir as one tar archive.
+
+        Used for fresh destinations, where rsync has nothing to compare
+        against and its per-file exchange is pure overhead.
+
+        Raises:
+            TransferError: If the transfer fails.
+        """
+        remote = shell_quote(remote_dir)
+        exclude_args = _tar_exclude_args(excludes or [])
+        code = self._pipe(
+            ["tar", "-czf", "-", *exclude_args, "-C", str(local_dir), "."],
+            self._ssh_args(f"mkdir -p {remote} && tar -xzf - -C {remote}"),
+        )
+        if code != 0:
+            raise TransferError(f"Push failed (tar exit {code})", code)
+
+    def bulk_pull(self, remote_dir: str, local_dir: str | os.PathLike[str]) -> None:
+        """Stream remote_dir's contents into local_dir as one tar archive.
+
+        Raises:
+            TransferError: If the transfer fails.
+        """
+        Path(local_dir).mkdir(parents=True, exist_ok=True)
+        code = self._pipe(
+            self._ssh_args(f"tar -czf - -C {shell_quote(remote_dir)} ."),
+            ["tar", "-xzf", "-", "-C", str(local_dir)],
+        )
+        if code != 0:
+            raise TransferError(f"Pull failed (tar exit {code})", code)
+
     def _remote_is_dir(self, remote: str) -> bool:
         """Check if a remote path is a directory."""
         code, _, _ = self.executor.exec(f"test -d {shell_quote(remote)}")
         return code == 0
 
-    def push(self, local: Path, remote: str | None = None) -> None:
+    def _prepare_dest(
+        self, local: Path, remote: str | None, check_new: bool
+    ) -> tuple[str, bool]:
+        """Create the destination's parent directory in one remote call.
+
+        If remote is None the local path is mirrored under remote $HOME,
+        which is read in the same call. With check_new, also reports whether
+        the destination is missing (tilde paths are left to rsync to expand).
+        Returns (remote, is_new).
+
+        Raises:
+            TransferError: If the remote home or directory cannot be set up.
+        """
+        rel = home_relative(local) if remote is None else None
+        if remote is None and rel is None:
+            remote = str(local)
+
+        if rel is not None:
+            dest = '"$HOME"' + (shell_quote(f"/{rel}") if rel else "")
+            cmd = f'[ -n "$HOME" ] || exit 1; echo "$HOME"; mkdir -p "$(dirname {dest})"'
+        else:
+            dest = shell_quote(remote)
+            cmd = f"mkdir -p {shell_quote(str(Path(remote).parent))}"
+            check_new = check_new and remote.startswith("/")
+        if check_new:
+            cmd += f" && {{ test -e {dest} || echo {_NEW_DEST}; }}"
+
+        code, stdout, _ = self.executor.exec(cmd)
+        lines = stdout.splitlines()
+        if rel is not None:
+            home = lines[0].strip() if lines else ""
+            if not home:
+                raise TransferError("Failed to get remote home directory")
+            remote = f"{home}/{rel}" if rel else home
+        if code != 0:
+            raise TransferError("Failed to create remote directory")
+        return remote, check_new and _NEW_DEST in lines
+
+    def push(self, local: str | os.PathLike[str], remote: str | None = None) -> None:
         """Upload file/directory to remote.
 
         If remote is None, mirrors local path structure under remote $HOME.
@@ -59,25 +193,21 @@ class FileTransfer:
         Raises:
             TransferError: If the transfer fails.
         """
-        local = local.resolve()
+        local = Path(local).resolve()
         if not local.exists():
             raise TransferError(f"Path not found: {local}")
 
-        if remote is None:
-            # Get remote home and map path
-            code, stdout, _ = self.executor.exec("echo $HOME")
-            if code != 0 or not stdout.strip():
-                raise TransferError("Failed to get remote home directory")
-            remote = map_to_remote(local, stdout.strip())
-
-        # Create remote parent directory
-        remote_parent = str(Path(remote).parent)
-        code, _, _ = self.executor.exec(f"mkdir -p {shell_quote(remote_parent)}")
-        if code != 0:
-            raise TransferError("Failed to create remote directory")
+        # Create the remote parent, noting whether a directory push lands
+        # somewhere new
+        remote, is_new = self._prepare_dest(local, remote, check_new=local.is_dir())
 
         info(f"Pushing to {self.target}:{remote}")
 
+        if is_new:
+            self.bulk_push(local, remote)
+            success(f"Pushed {local.name}")
+            return
+
         ssh_arg = self._rsync_ssh_arg()
         if local.is_dir():
             args = ["rsync", "-avz", "--progress"] + ssh_arg + [f"{local}/", f"{self.target}:{remote}/"]
@@ -90,7 +220,7 @@ class FileTransfer:
 
         success(f"Pushed {local.name}")
 
-    def pull(self, remote: str, local: Path | None = None) -> None:
+    def pull(self, remote: str, local: str | os.PathLike[str] | None = None) -> None:
         """Download file/directory from remote (supports globs).
 
         If local is None, downloads to current directory.
@@ -98,9 +228,7 @@ class FileTransfer:
         Raises:
             TransferError: If the transfer fails.
         """
-        if local is None:
-            local = Path.cwd()
-        local = local.resolve()
+        local = Path.cwd() if local is None else Path(local).resolve()
 
         # Check whether the remote path is a file or directory
         remote_is_dir = self._remote_is_dir(remote)
@@ -117,6 +245,14 @@ class FileTransfer:
         else:
             # Local doesn't exist: create based on what the remote is
             if remote_is_dir:
+                if remote.startswith("/"):
+                    info(f"Pulling from {self.target}:{remote}")
+                    # Same layout as rsync: without a trailing slash the
+                    # directory itself lands inside local
+                    dest = local if remote.endswith("/") else local / remote.rsplit("/", 1)[1]
+                    self.bulk_pull(remote, dest)
+                    success(f"Pulled to {local}")
+                    return
                 local.mkdir(parents=True, exist_ok=True)
                 args_dest = f"{local}/"
             else:
@@ -135,49 +271,58 @@ class FileTransfer:
 
     def sync(
         self,
-        local: Path,
+        local: str | os.PathLike[str],
         remote: str | None = None,
         *,
         excludes: list[str] | None = None,
         delete: bool = False,
+        jobs: int | None = None,
     ) -> None:
         """Rsync project to remote with Python project defaults.
 
+        With jobs > 1 (default: $REX_SYNC_JOBS), the project's top-level
+        entries are split across that many concurrent rsyncs. --delete
+        needs the whole tree in one rsync, so it always runs serially.
+
         Raises:
             TransferError: If the sync fails.
         """
-        local = local.resolve()
+        local = Path(local).resolve()
         if not local.is_dir():
             raise TransferError(f"Directory not found: {local}")
 
-        if remote is None:
-            # Get remote home and map path
-            code, stdout, _ = self.executor.exec("echo $HOME")
-            if code != 0 or not stdout.strip():
-                raise TransferError("Failed to get remote home directory")
-            remote = map_to_remote(local, stdout.strip())
-
-        # Create remote parent directory
-        remote_parent = str(Path(remote).parent)
-        code, _, _ = self.executor.exec(f"mkdir -p {shell_quote(remote_parent)}")
-        if code != 0:
-            raise TransferError("Failed to create remote directory")
+        # Create remote parent directory, noting whether the sync lands
+        # somewhere new
+        remote, is_new = self._prepare_dest(local, remote, check_new=True)
 
         info(f"Syncing to {self.target}:{remote}")
 
-        # Build rsync args
         if excludes is None:
             excludes = DEFAULT_SYNC_EXCLUDES
 
+        # First sync of a project: nothing to compare, so stream one archive
+        if is_new:
+            self.bulk_push(local, remote, excludes=excludes)
+            success(f"Synced {local.name}")
+            return
+
+        # Build rsync args
         args = ["rsync", "-avz"] + self._rsync_ssh_arg()
         if delete:
             args.append("--delete")
         for ex in excludes:
             args.extend(["--exclude", ex])
-        args.extend([f"{local}/", f"{self.target}:{remote}/"])
-
-        result = subprocess.run(args)
-        if result.returncode != 0:
-            raise TransferError(f"Sync failed (rsync exit {result.returncode})", result.returncode)
+        dest = f"{self.target}:{remote}/"
+
+        shards = [] if delete else _shard_entries(local, sync_jobs() if jobs is None else jobs)
+        if len(shards) > 1:
+            # Disjoint top-level entries, one rsync each over the shared master
+            procs = [subprocess.Popen([*args, *shard, dest]) for shard in shards]
+            codes = [proc.wait() for proc in procs]
+            code = next((c for c in codes if c != 0), 0)
+        else:
+            code = subprocess.run([*args, f"{local}/", dest]).returncode
+        if code != 0:
+            raise TransferError(f"Sync failed (rsync exit {code})", code)
 
         success(f"Synced {local.name}")
@@ -4,7 +4,19 @@ from __future__ import annotations
 
 import os
 import re
+import time
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from typing import Any
+
+# Validation patterns, compiled once at import
+_JOB_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+# D-HH:MM:SS or D-HH:MM or D-HH
+_DAYS_TIME_RE = re.compile(r"^\d+-\d{1,2}(:\d{2}(:\d{2})?)?$")
+# HH:MM:SS or MM:SS or MM
+_TIME_RE = re.compile(r"^\d+(:\d{2}(:\d{2})?)?$")
+_MEMORY_RE = re.compile(r"^(\d+)[KMGT]?$", re.IGNORECASE)
+_GRES_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(:[a-zA-Z0-9_]+)*(:\d+)?$")
 
 
 def validate_job_name(name: str) -> None:
@@ -12,7 +24,7 @@ def validate_job_name(name: str) -> None:
 
     Raises ValueError if invalid.
     """
-    if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+    if not _JOB_NAME_RE.match(name):
         raise ValueError(
             f"Invalid job name: '{name}' (use only alphanumeric, dash, underscore)"
         )
@@ -31,12 +43,7 @@ def validate_slurm_time(time_str: str) -> None:
 
     Raises ValueError if invalid.
     """
-    # Pattern for D-HH:MM:SS or D-HH:MM or D-HH
-    days_pattern = r"^\d+-\d{1,2}(:\d{2}(:\d{2})?)?$"
-    # Pattern for HH:MM:SS or MM:SS or MM
-    time_pattern = r"^\d+(:\d{2}(:\d{2})?)?$"
-
-    if re.match(days_pattern, time_str) or re.match(time_pattern, time_str):
+    if _DAYS_TIME_RE.match(time_str) or _TIME_RE.match(time_str):
         # Validate numeric ranges
         if "-" in time_str:
             days_part, time_part = time_str.split("-", 1)
@@ -80,14 +87,14 @@ def validate_memory(mem_str: str) -> None:
 
     Raises ValueError if invalid.
     """
-    if not re.match(r"^\d+[KMGT]?$", mem_str, re.IGNORECASE):
+    match = _MEMORY_RE.match(mem_str)
+    if not match:
         raise ValueError(
             f"Invalid memory format: '{mem_str}' (use e.g., 4G, 16000M, 512K)"
         )
 
-    # Extract numeric part and check it's positive
-    num_match = re.match(r"^(\d+)", mem_str)
-    if num_match and int(num_match.group(1)) == 0:
+    # Numeric part must be positive
+    if int(match.group(1)) == 0:
         raise ValueError(f"Invalid memory format: '{mem_str}' (must be greater than 0)")
 
 
@@ -103,7 +110,7 @@ def validate_gres(gres_str: str) -> None:
     """
     # Basic pattern: resource:count or resource:type:count
     # Common: gpu:1, gpu:a100:2, gpu:v100
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*(:[a-zA-Z0-9_]+)*(:\d+)?$", gres_str):
+    if not _GRES_RE.match(gres_str):
         raise ValueError(
             f"Invalid GRES format: '{gres_str}' (use e.g., gpu:1, gpu:a100:2)"
         )
@@ -118,29 +125,73 @@ def validate_cpus(cpus: int) -> None:
         raise ValueError(f"Invalid CPU count: {cpus} (must be at least 1)")
 
 
+# SLURM config fields checked on load, in reporting order
+_SLURM_FIELD_VALIDATORS: tuple[tuple[str, Callable[[Any], None]], ...] = (
+    ("time", validate_slurm_time),
+    ("mem", validate_memory),
+    ("gres", validate_gres),
+    ("cpus", validate_cpus),
+)
+
+
+def validate_slurm_fields(data: Mapping[str, Any]) -> None:
+    """Validate the SLURM options set in a config table.
+
+    Empty strings are skipped; cpus is checked whenever present.
+    Raises ValueError on the first invalid field.
+    """
+    for key, validator in _SLURM_FIELD_VALIDATORS:
+        value = data.get(key)
+        if value or (key == "cpus" and value is not None):
+            validator(value)
+
+
+def home_relative(local_path: Path) -> str | None:
+    """Return local_path relative to the local home, or None if outside it.
+
+    The home is /Users/<user> (macOS) or /home/<user> (Linux); the home
+    itself maps to "".
+    """
+    path_str = str(local_path.resolve())
+    if path_str.startswith(("/Users/", "/home/")):
+        parts = path_str.split("/")
+        if len(parts) >= 3:
+            # Skip /Users/<user> or /home/<user>
+            return "/".join(parts[3:])
+    return None
+
+
 def map_to_remote(local_path: Path, remote_home: str) -> str:
     """Map local path to remote path under remote $HOME.
 
     Strips /Users/<user> or /home/<user> and prepends remote home.
     """
-    path_str = str(local_path.resolve())
+    remainder = home_relative(local_path)
+    if remainder is None:
+        # No transformation
+        return str(local_path.resolve())
+    return f"{remote_home}/{remainder}" if remainder else remote_home
 
-    if path_str.startswith("/Users/"):
-        # macOS: /Users/<user>/... -> $HOME/...
-        parts = path_str.split("/")
-        if len(parts) >= 3:
-            # Skip /Users/<user>
-            remainder = "/".join(parts[3:])
-            return f"{remote_home}/{remainder}" if remainder else remote_home
-    elif path_str.startswith("/home/"):
-        # Linux: /home/<user>/... -> $HOME/...
-        parts = path_str.split("/")
-        if len(parts) >= 3:
-            remainder = "/".join(parts[3:])
-            return f"{remote_home}/{remainder}" if remainder else remote_home
 
-    # No transformation
-    return path_str
+def cache_dir() -> Path:
+    """Return the local rex cache directory ($XDG_CACHE_HOME/rex)."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "rex"
+
+
+def toml_parser() -> Any:
+    """Return the TOML parser module: stdlib tomllib on 3.11+, else tomli.
+
+    Both expose loads() and TOMLDecodeError. Imported on first call so a
+    config cache hit never loads a parser.
+    """
+    import sys
+
+    if sys.version_info >= (3, 11):
+        import tomllib
+        return tomllib
+    import tomli
+    return tomli
 
 
 def generate_job_name() -> str:
@@ -153,11 +204,20 @@ def generate_job_name() -> str:
 
 def generate_script_id() -> str:
     """Generate unique script ID for temp files."""
-    import time
-
     return f"{os.getpid()}-{int(time.time())}"
 
 
+def heredoc_marker(content: str, base: str = "REX") -> str:
+    """Return a heredoc delimiter that cannot appear as a line of content.
+
+    The suffix is a hash of the content, so content would have to contain
+    its own digest to collide.
+    """
+    import hashlib
+
+    return f"{base}_{hashlib.blake2b(content.encode(), digest_size=6).hexdigest().upper()}"
+
+
 def shell_quote(s: str) -> str:
     """Quote string for shell, escaping single quotes."""
     escaped = s.replace("'", "'\\''")
@@ -133,6 +133,21 @@ class TestBuild:
         script = mock_executor.exec_detached.call_args[0][1]
         assert "rm -rf .venv" not in script
 
+    def test_build_script_quotes_code_dir(self, mocker):
+        """Build script quotes a code_dir containing spaces."""
+        ctx = make_ctx(code_dir="/remote/my project")
+        mock_executor = mocker.Mock()
+        mock_executor.exec_detached.return_value = JobInfo(
+            job_id="build-abc123", log_path="", is_slurm=True, slurm_id=12345
+        )
+
+        from rex.commands.build import build
+
+        build(mock_executor, ctx)
+
+        script = mock_executor.exec_detached.call_args[0][1]
+        assert "cd '/remote/my project'" in script
+
     def test_build_script_uses_code_dir(self, mocker):
         """Build script cds to code_dir."""
         ctx = make_ctx(code_dir="/remote/my-project")
@@ -0,0 +1,93 @@
+"""Tests for host info commands."""
+
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from rex.commands.info import _GPUS_SCRIPT, GPU_PROCS_MARKER, parse_gpus, show_info
+from rex.utils import shell_quote
+
+
+GPU_OUTPUT = (
+    "0, NVIDIA A100, 1024, 40960, 85, GPU-aaa\n"
+    "1, NVIDIA A100, 0, 40960, 0, GPU-bbb\n"
+    f"{GPU_PROCS_MARKER}\n"
+    "0,4242,1000,alice\n"
+)
+
+
+class TestParseGpus:
+    """Tests for parse_gpus."""
+
+    def test_attaches_processes(self):
+        """Process lines after the marker attach to their GPU."""
+        gpus = parse_gpus(GPU_OUTPUT)
+
+        assert [g.index for g in gpus] == [0, 1]
+        assert gpus[0].processes[0].user == "alice"
+        assert gpus[0].processes[0].pid == 4242
+        assert gpus[1].processes == []
+
+    def test_unavailable_utilization(self):
+        """A non-numeric utilization reads as 0."""
+        gpus = parse_gpus("0, Tesla T4, 0, 15360, [N/A]\n")
+
+        assert gpus[0].name == "Tesla T4"
+        assert gpus[0].utilization == 0
+
+    def test_empty_output(self):
+        """No output means no GPUs."""
+        assert parse_gpus("") == []
+
+
+class TestShowInfo:
+    """Tests for show_info."""
+
+    def test_gpus_fetched_in_one_call(self, mocker, capsys):
+        """GPU table and processes come from a single SSH call."""
+        mock_ssh = mocker.Mock()
+        mock_ssh.exec.side_effect = [
+            (0, "8\n64000 32000 30000\n", ""),
+            (0, GPU_OUTPUT, ""),
+        ]
+
+        assert show_info(mock_ssh, "host", json_output=True) == 0
+
+        assert mock_ssh.exec.call_count == 2
+        data = json.loads(capsys.readouterr().out)
+        assert data["cpus"] == 8
+        assert data["gpus"][0]["processes"][0]["user"] == "alice"
+        assert data["gpus"][1]["status"] == "free"
+
+
+@pytest.mark.skipif(not shutil.which("bash") or not shutil.which("awk"), reason="needs bash and awk")
+class TestGpusScript:
+    """Run the remote GPU script against a stub nvidia-smi."""
+
+    def test_joins_processes_to_gpus(self, tmp_path):
+        """Processes map to their GPU index and owner; dead PIDs are dropped."""
+        stub = tmp_path / "nvidia-smi"
+        stub.write_text(
+            "#!/bin/bash\n"
+            'case "$1" in\n'
+            "  --query-gpu=*) printf '0, A100, 1024, 40960, 85, GPU-aaa\\n"
+            "1, A100, 0, 40960, 0, GPU-bbb\\n';;\n"
+            f"  --query-compute-apps=*) printf 'GPU-bbb, {os.getpid()}, 500\\n"
+            "GPU-aaa, 999999999, 5\\n';;\n"
+            "esac\n"
+        )
+        stub.chmod(0o755)
+        env = {**os.environ, "PATH": f"{tmp_path}:{os.environ['PATH']}"}
+
+        result = subprocess.run(
+            f"bash --norc --noprofile -c {shell_quote(_GPUS_SCRIPT)}",
+            shell=True, capture_output=True, text=True, env=env,
+        )
+
+        gpus = parse_gpus(result.stdout)
+        assert [g.index for g in gpus] == [0, 1]
+        assert gpus[0].processes == []
+        assert [p.pid for p in gpus[1].processes] == [os.getpid()]
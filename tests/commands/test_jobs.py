@@ -1,6 +1,10 @@
 """Tests for job commands."""
 
 import json
+import os
+import shutil
+import subprocess
+import sys
 
 import pytest
 
@@ -87,3 +91,308 @@ class TestShowLog:
         result = executor.show_log("abc123", follow=False)
 
         assert result == 1
+
+
+class TestShowLogQuoting:
+    """Job IDs are quoted before they reach the remote shell."""
+
+    def test_meta_path_quotes_job_id(self, mocker):
+        """A crafted ID stays inside the metadata file name."""
+        mock_ssh = _mock_ssh_with_meta(mocker, {"log": "/tmp/test.log"})
+
+        DirectExecutor(mock_ssh).show_log("x; touch pwned", follow=False)
+
+        assert mock_ssh.exec.call_args[0][0] == "cat ~/.rex/jobs/'x; touch pwned.json' 2>/dev/null"
+
+
+@pytest.mark.skipif(not shutil.which("bash"), reason="needs bash")
+class TestShowLastLog:
+    """Run show_last_log's remote script against a local ~/.rex."""
+
+    def _run(self, mocker, tmp_path, monkeypatch, follow=False):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        ssh = mocker.Mock()
+        ssh.exec_streaming.side_effect = lambda cmd, tty=False: subprocess.run(
+            ["bash", "-c", cmd]
+        ).returncode
+        code = DirectExecutor(ssh).show_last_log(follow=follow)
+        ssh.exec.assert_not_called()
+        return code
+
+    def test_prints_newest_log(self, mocker, tmp_path, monkeypatch, capfd):
+        """The newest metadata file picks the log, and ~ expands remotely."""
+        jobs = tmp_path / ".rex" / "jobs"
+        jobs.mkdir(parents=True)
+        (tmp_path / ".rex" / "rex-old.log").write_text("old\n")
+        (tmp_path / ".rex" / "rex-new.log").write_text("new\n")
+        (jobs / "old.json").write_text(json.dumps({"log": "~/.rex/rex-old.log"}))
+        os.utime(jobs / "old.json", (0, 0))
+        (jobs / "new.json").write_text(json.dumps({"log": "~/.rex/rex-new.log", "pid": 999999999}))
+
+        assert self._run(mocker, tmp_path, monkeypatch, follow=True) == 0
+        assert capfd.readouterr().out == "new\n"
+
+    def test_no_jobs(self, mocker, tmp_path, monkeypatch, capfd):
+        """Without metadata the script fails with a message."""
+        assert self._run(mocker, tmp_path, monkeypatch) == 1
+        assert "No jobs found" in capfd.readouterr().err
+
+
+class TestListAllJobs:
+    """Tests for list_all_jobs across connected hosts."""
+
+    def test_queries_hosts_concurrently(self, mocker, capsys):
+        """Every host is queried in parallel and output keeps host order."""
+        import threading
+
+        from rex.commands.jobs import list_all_jobs
+        from rex.config import GlobalConfig
+        from rex.execution.base import JobStatus
+
+        mocker.patch(
+            "rex.ssh.connection.SSHConnection.list_active",
+            return_value=[("u@a", "/s/a"), ("u@b", "/s/b")],
+        )
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(global_config, target, alias, since):
+            barrier.wait()  # deadlocks unless both hosts run at once
+            return [JobStatus(job_id=f"job-{alias}", status="running")]
+
+        mocker.patch("rex.commands.jobs._fetch_host_jobs", side_effect=fetch)
+        config = GlobalConfig(aliases={"alpha": "u@a"}, hosts={})
+
+        assert list_all_jobs(config, json_output=True) == 0
+
+        out = json.loads(capsys.readouterr().out)
+        assert list(out) == ["alpha", "u@b"]
+        assert out["alpha"][0]["job"] == "job-alpha"
+
+    def test_failing_host_is_skipped(self, mocker):
+        """A host that cannot be queried contributes no jobs."""
+        from rex.commands.jobs import _fetch_host_jobs
+        from rex.config import GlobalConfig
+
+        mocker.patch("rex.ssh.executor.SSHExecutor", side_effect=OSError("boom"))
+
+        assert _fetch_host_jobs(GlobalConfig(aliases={}, hosts={}), "u@a", "u@a", 0) == []
+
+    def test_executor_reused_per_host(self, mocker):
+        """Repeated lookups for a host share one SSH executor."""
+        from rex.commands.jobs import _fetch_host_jobs, _host_executor
+        from rex.config import GlobalConfig
+
+        _host_executor.cache_clear()
+        ssh_cls = mocker.patch("rex.ssh.executor.SSHExecutor")
+        ssh_cls.return_value.exec.return_value = (0, "", "")
+        config = GlobalConfig(aliases={}, hosts={})
+
+        _fetch_host_jobs(config, "u@reuse", "u@reuse", 0)
+        _fetch_host_jobs(config, "u@reuse", "u@reuse", 0)
+
+        ssh_cls.assert_called_once_with("u@reuse", verbose=False)
+
+    def test_plain_host_skips_slurm_backend(self):
+        """Listing a non-SLURM host does not import the SLURM executor."""
+        code = (
+            "import sys; from unittest import mock; "
+            "mock.patch('rex.ssh.executor.SSHExecutor').start(); "
+            "from rex.commands.jobs import _host_executor; "
+            "_host_executor('u@a', False); "
+            "print('rex.execution.slurm' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestWatchJobs:
+    """Tests for watch_jobs."""
+
+    def test_batches_status_queries(self, mocker):
+        """Several jobs share one status query per poll."""
+        from rex.commands.jobs import watch_jobs
+        from rex.execution.base import JobStatus
+
+        mocker.patch("rex.commands.jobs.time.sleep")
+        executor = mocker.Mock(poll_interval=5, min_poll=0.5)
+        executor.get_statuses.side_effect = [
+            {"a": JobStatus("a", "running"), "b": JobStatus("b", "completed")},
+            {"a": JobStatus("a", "failed")},
+        ]
+
+        assert watch_jobs(executor, ["a", "b"]) == 1
+
+        assert executor.get_statuses.call_args_list == [
+            mocker.call(["a", "b"]), mocker.call(["a"]),
+        ]
+        executor.watch_job.assert_not_called()
+
+    def test_gives_up_on_lost_job(self, mocker, capsys):
+        """A job that stays unknown is reported after three attempts."""
+        from rex.commands.jobs import watch_jobs
+        from rex.execution.base import JobStatus
+
+        mocker.patch("rex.commands.jobs.time.sleep")
+        executor = mocker.Mock(poll_interval=5, min_poll=0.5)
+        executor.get_statuses.side_effect = lambda ids: {
+            job_id: JobStatus(job_id, "unknown" if job_id == "a" else "completed")
+            for job_id in ids
+        }
+
+        assert watch_jobs(executor, ["a", "b"], json_output=True) == 1
+
+        assert executor.get_statuses.call_count == 3
+        out = json.loads(capsys.readouterr().out)
+        assert [r["status"] for r in out] == ["unknown", "completed"]
+
+    def test_polling_backs_off_until_a_change(self, mocker):
+        """Idle ticks stretch the gap up to poll_interval; a transition resets it."""
+        from rex.commands.jobs import _watch_many
+        from rex.execution.base import JobStatus
+
+        sleep = mocker.patch("rex.commands.jobs.time.sleep")
+        mocker.patch("rex.commands.jobs.time.monotonic", return_value=0.0)
+        states = iter(["pending"] * 7 + ["running", "running", "completed"])
+        executor = mocker.Mock(poll_interval=2, min_poll=0.5)
+        executor.get_statuses.side_effect = lambda ids: {
+            "a": JobStatus("a", next(states)), "b": JobStatus("b", "completed"),
+        } if "b" in ids else {"a": JobStatus("a", next(states))}
+
+        _watch_many(executor, ["a", "b"])
+
+        gaps = [c[0][0] for c in sleep.call_args_list]
+        assert gaps[0] == 0.5  # b finished on the first tick
+        assert gaps[1:6] == [0.75, 1.125, 1.6875, 2, 2]
+        assert gaps[7] == 0.5  # pending -> running
+        assert max(gaps) == 2
+
+    def test_failed_checks_retry_after_poll_interval(self, mocker):
+        """An unknown status is retried on poll_interval, not the fast schedule."""
+        from rex.commands.jobs import _watch_many
+        from rex.execution.base import JobStatus
+
+        sleep = mocker.patch("rex.commands.jobs.time.sleep")
+        mocker.patch("rex.commands.jobs.time.monotonic", return_value=0.0)
+        states = iter(["unknown", "unknown", "running", "completed"])
+        executor = mocker.Mock(poll_interval=10, min_poll=0.5)
+        executor.get_statuses.side_effect = lambda ids: {"a": JobStatus("a", next(states))}
+
+        results = _watch_many(executor, ["a"])
+
+        assert results[0].status == "completed"
+        gaps = [c[0][0] for c in sleep.call_args_list]
+        assert gaps[:2] == [10, 10]
+        assert gaps[2] < 10  # back to fast polling once the check succeeds
+
+    def test_slurm_polls_no_faster_than_min_poll(self, mocker):
+        """SLURM's squeue/sacct polls start at its min_poll, not sub-second."""
+        from rex.commands.jobs import _watch_many
+        from rex.execution.base import JobStatus
+        from rex.execution.slurm import SlurmExecutor
+
+        sleep = mocker.patch("rex.commands.jobs.time.sleep")
+        mocker.patch("rex.commands.jobs.time.monotonic", return_value=0.0)
+        states = iter(["pending"] * 4 + ["completed"])
+        executor = SlurmExecutor(mocker.MagicMock())
+        mocker.patch.object(
+            executor, "get_statuses",
+            side_effect=lambda ids: {"a": JobStatus("a", next(states))},
+        )
+
+        _watch_many(executor, ["a"])
+
+        gaps = [c[0][0] for c in sleep.call_args_list]
+        assert gaps == [7.5, 10, 10, 10]  # never under min_poll, capped at 10s
+
+    def test_single_job_waits_remotely(self, mocker):
+        """One job keeps the executor's remote wait loop."""
+        from rex.commands.jobs import watch_jobs
+        from rex.execution.base import JobResult
+
+        executor = mocker.Mock()
+        executor.watch_job.return_value = JobResult("a", "completed", 0)
+
+        assert watch_jobs(executor, ["a"]) == 0
+        executor.get_statuses.assert_not_called()
+
+    def test_follow_passed_to_single_watch(self, mocker):
+        """--follow streams the one watched job's log."""
+        from rex.commands.jobs import watch_jobs
+        from rex.execution.base import JobResult
+
+        executor = mocker.Mock()
+        executor.watch_job.return_value = JobResult("a", "completed", 0)
+
+        watch_jobs(executor, ["a"], follow=True)
+        executor.watch_job.assert_called_once_with("a", follow_log=True)
+
+
+class TestListJobsOutput:
+    """Tests for list_jobs rendering."""
+
+    def test_rows_are_aligned(self, mocker, capsys):
+        """Columns are padded to the widest entry."""
+        from rex.commands.jobs import list_jobs
+        from rex.execution.base import JobStatus
+
+        executor = mocker.Mock()
+        executor.list_jobs.return_value = [
+            JobStatus("a", "running", pid=7),
+            JobStatus("job-b", "completed", description="train"),
+        ]
+
+        assert list_jobs(executor) == 0
+
+        assert capsys.readouterr().out.splitlines() == [
+            "a      running    PID 7",
+            "job-b  completed         train",
+        ]
+
+    def test_json_is_compact_when_piped(self, mocker, capsys):
+        """Non-terminal JSON output has no indentation."""
+        from rex.commands.jobs import list_jobs
+        from rex.execution.base import JobStatus
+
+        executor = mocker.Mock()
+        executor.list_jobs.return_value = [JobStatus("a", "running", pid=7)]
+
+        list_jobs(executor, json_output=True)
+
+        assert capsys.readouterr().out == '[{"job":"a","status":"running","pid":7}]\n'
+
+    def test_status_colored_once_per_value(self, mocker, capsys):
+        """Repeated statuses reuse one colorized string."""
+        from rex.commands.jobs import list_jobs
+        from rex.execution.base import JobStatus
+
+        colorize = mocker.patch("rex.commands.jobs.colorize_status", side_effect=str.upper)
+        executor = mocker.Mock()
+        executor.list_jobs.return_value = [JobStatus(f"j{i}", "completed") for i in range(5)]
+
+        list_jobs(executor)
+
+        colorize.assert_called_once_with("completed")
+        assert capsys.readouterr().out.count("COMPLETED") == 5
+
+
+def test_job_dict_omits_unset_fields():
+    """Only populated JobStatus fields appear in the JSON form."""
+    from rex.commands.jobs import _job_to_dict
+    from rex.execution.base import JobStatus
+
+    assert _job_to_dict(JobStatus("a", "pending", slurm_id=12, hostname="h")) == {
+        "job": "a", "status": "pending", "slurm_id": 12, "hostname": "h",
+    }
+
+
+def test_job_row_fields():
+    """Rows expose named columns; a live PID marks the job running."""
+    from rex.commands.jobs import _job_to_row
+    from rex.execution.base import JobStatus
+
+    row = _job_to_row(JobStatus("a", "unknown", pid=3, hostname="h"))
+
+    assert (row.job_id, row.status, row.info, row.host) == ("a", "running", "PID 3", "h")
+    assert not hasattr(JobStatus("a", "x"), "__dict__")
@@ -0,0 +1,28 @@
+"""Tests for the read command."""
+
+import pytest
+
+from rex.commands.read import read_remote
+
+
+@pytest.mark.parametrize("kind, expected", [("dir", "ls -la '/p'"), ("file", "cat '/p'")])
+def test_one_probe_then_stream(mocker, kind, expected):
+    """A single probe picks between listing and reading."""
+    ssh = mocker.Mock()
+    ssh.exec.return_value = (0, f"{kind}\n", "")
+    ssh.exec_streaming.return_value = 0
+
+    assert read_remote(ssh, "/p") == 0
+
+    ssh.exec.assert_called_once()
+    ssh.exec_streaming.assert_called_once_with(expected)
+
+
+@pytest.mark.parametrize("result", [(0, "missing\n", ""), (255, "", "lost")])
+def test_missing_path(mocker, result):
+    """A missing path or failed probe reports not found."""
+    ssh = mocker.Mock()
+    ssh.exec.return_value = result
+
+    assert read_remote(ssh, "/p") == 1
+    ssh.exec_streaming.assert_not_called()
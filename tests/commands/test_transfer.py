@@ -122,3 +122,29 @@ class TestSyncWithResolvedConfig:
         result = sync(mock_transfer, config, local_path=tmp_path)
 
         assert result == 1
+
+
+class TestPushPull:
+    """Tests for push and pull command error handling."""
+
+    @pytest.mark.parametrize("name", ["push", "pull"])
+    def test_returns_zero_on_success(self, mocker, name):
+        """A successful transfer returns 0."""
+        from rex.commands import transfer
+
+        mock_transfer = mocker.Mock()
+
+        assert getattr(transfer, name)(mock_transfer, "a", "b") == 0
+        getattr(mock_transfer, name).assert_called_once()
+
+    @pytest.mark.parametrize("name", ["push", "pull"])
+    def test_reports_transfer_error(self, mocker, capsys, name):
+        """A TransferError is printed and its exit code returned."""
+        from rex.commands import transfer
+        from rex.exceptions import TransferError
+
+        mock_transfer = mocker.Mock()
+        getattr(mock_transfer, name).side_effect = TransferError("rsync broke", 23)
+
+        assert getattr(transfer, name)(mock_transfer, "a", "b") == 23
+        assert "rsync broke" in capsys.readouterr().err
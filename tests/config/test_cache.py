@@ -0,0 +1,162 @@
+"""Tests for the on-disk config cache."""
+
+import os
+import subprocess
+import sys
+
+from rex.config import cache
+from rex.config.global_config import GlobalConfig, _load_cache as global_load_cache
+from rex.config.project import ProjectConfig, _load_cache as project_load_cache
+from rex.utils import toml_parser
+
+
+class TestConfigCache:
+    """Tests for cache.load/store."""
+
+    def test_roundtrip(self, tmp_path):
+        """Stored values are returned for the same key."""
+        path = tmp_path / "config.toml"
+        cache.store(path, (1, 2), {"a": 1})
+        assert cache.load(path, (1, 2)) == {"a": 1}
+
+    def test_key_mismatch_misses(self, tmp_path):
+        """A different key is a cache miss."""
+        path = tmp_path / "config.toml"
+        cache.store(path, (1, 2), {"a": 1})
+        assert cache.load(path, (1, 3)) is None
+
+    def test_missing_entry_misses(self, tmp_path):
+        """No entry is a cache miss."""
+        assert cache.load(tmp_path / "config.toml", (1, 2)) is None
+
+    def test_corrupt_entry_misses(self, tmp_path, isolated_cache_dir):
+        """An unreadable entry is ignored."""
+        path = tmp_path / "config.toml"
+        cache.store(path, (1, 2), {"a": 1})
+        for entry in isolated_cache_dir.iterdir():
+            entry.write_bytes(b"not a pickle")
+        assert cache.load(path, (1, 2)) is None
+
+    def test_uses_xdg_cache_home(self, tmp_path, isolated_cache_dir):
+        """Entries are written under $XDG_CACHE_HOME/rex."""
+        cache.store(tmp_path / "config.toml", (1, 2), "x")
+        assert len(list(isolated_cache_dir.glob("config-*.pkl"))) == 1
+
+    def test_digest_lookup(self, tmp_path):
+        """Entries can be found by the digest of the bytes they were built from."""
+        path = tmp_path / "config.toml"
+        cache.store(path, (1, 2), {"a": 1}, cache.digest(b"a = 1"))
+        assert cache.load_by_digest(path, cache.digest(b"a = 1")) == {"a": 1}
+        assert cache.load_by_digest(path, cache.digest(b"a = 2")) is None
+
+    def test_schema_change_misses(self, tmp_path, isolated_cache_dir, monkeypatch):
+        """Entries written for a different dataclass layout are never loaded."""
+        path = tmp_path / "config.toml"
+        cache.store(path, (1, 2), {"a": 1}, cache.digest(b"a = 1"))
+        old_entry = cache._entry_path(path)
+        monkeypatch.setattr(cache, "_schema_tag", "changed")
+
+        assert cache._entry_path(path) != old_entry
+        assert cache.load(path, (1, 2)) is None
+        assert cache.load_by_digest(path, cache.digest(b"a = 1")) is None
+
+        # Even an entry found under the new name must carry the new schema
+        cache._entry_path(path).write_bytes(old_entry.read_bytes())
+        assert cache.load(path, (1, 2)) is None
+
+    def test_env_var_disables(self, tmp_path, isolated_cache_dir, monkeypatch):
+        """REX_NO_CONFIG_CACHE skips both reads and writes."""
+        path = tmp_path / "config.toml"
+        cache.store(path, (1, 2), {"a": 1})
+        monkeypatch.setenv("REX_NO_CONFIG_CACHE", "1")
+
+        assert cache.load(path, (1, 2)) is None
+        cache.store(tmp_path / "other.toml", (1, 2), "x")
+        assert len(list(isolated_cache_dir.glob("config-*.pkl"))) == 1
+
+
+class TestLoaderUsesCache:
+    """Config loaders reuse cached results across processes."""
+
+    def test_global_config_from_disk_cache(self, tmp_path, mocker):
+        """A fresh process reuses the on-disk entry without parsing TOML."""
+        config = tmp_path / "config.toml"
+        config.write_text('[aliases]\ngpu = "user@gpu"\n')
+        GlobalConfig.load(config)
+        global_load_cache.clear()  # simulate a new process
+
+        parse = mocker.patch.object(toml_parser(), "loads")
+        result = GlobalConfig.load(config)
+
+        parse.assert_not_called()
+        assert result.aliases == {"gpu": "user@gpu"}
+
+    def test_project_config_from_disk_cache(self, tmp_path, mocker):
+        """A fresh process reuses the on-disk .rex.toml entry."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "proj"')
+        ProjectConfig._load(config)
+        project_load_cache.clear()
+
+        parse = mocker.patch.object(toml_parser(), "loads")
+        result = ProjectConfig._load(config)
+
+        parse.assert_not_called()
+        assert result.name == "proj"
+
+    def test_cache_hit_skips_toml_import(self, tmp_path):
+        """A process served from the disk cache never imports a TOML parser."""
+        config = tmp_path / "config.toml"
+        config.write_text('[aliases]\ngpu = "user@gpu"\n')
+        code = (
+            "import sys; from pathlib import Path; "
+            "from rex.config.global_config import GlobalConfig; "
+            f"GlobalConfig.load(Path({str(config)!r})); "
+            f"print({toml_parser().__name__!r} in sys.modules)"
+        )
+        runs = [
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True, text=True, check=True, env=os.environ.copy(),
+            ).stdout.strip()
+            for _ in range(2)
+        ]
+        assert runs == ["True", "False"]
+
+    def test_config_with_warnings_not_cached(self, tmp_path, capsys):
+        """Configs with unknown fields keep warning on every load."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "proj"\nbogus = 1\n')
+        ProjectConfig._load(config)
+        project_load_cache.clear()
+        capsys.readouterr()
+
+        ProjectConfig._load(config)
+
+        assert "bogus" in capsys.readouterr().err
+
+    def test_touch_reuses_entry(self, tmp_path, mocker):
+        """A new mtime with unchanged content is served without parsing."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "proj"')
+        ProjectConfig._load(config)
+        project_load_cache.clear()
+        st = config.stat()
+        os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+        parse = mocker.patch.object(toml_parser(), "loads")
+        assert ProjectConfig._load(config).name == "proj"
+        parse.assert_not_called()
+
+    def test_edit_invalidates(self, tmp_path):
+        """Editing the file bypasses the stale entry."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "old"')
+        ProjectConfig._load(config)
+        project_load_cache.clear()
+
+        config.write_text('name = "new-name"')
+        st = config.stat()
+        os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+        assert ProjectConfig._load(config).name == "new-name"
@@ -15,6 +15,30 @@ class TestGlobalConfigLoad:
         assert result.aliases == {}
         assert result.hosts == {}
 
+    def test_default_path_follows_home(self, mock_home_dir):
+        """The default path is resolved from the home directory at load time."""
+        config = mock_home_dir / ".config" / "rex" / "config.toml"
+        config.parent.mkdir(parents=True)
+        config.write_text('[aliases]\ngpu = "user@gpu"\n')
+
+        assert GlobalConfig.load().aliases == {"gpu": "user@gpu"}
+
+    def test_repeated_load_is_memoized(self, tmp_path):
+        """Loading the same unchanged file twice reuses the parsed config."""
+        config = tmp_path / "config.toml"
+        config.write_text('[aliases]\ngpu = "user@gpu"\n')
+        assert GlobalConfig.load(config) is GlobalConfig.load(config)
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Changing the file invalidates the memoized config."""
+        config = tmp_path / "config.toml"
+        config.write_text('[aliases]\ngpu = "user@gpu"\n')
+        GlobalConfig.load(config)
+
+        config.write_text('[aliases]\ngpu = "user@gpu2.cluster"\n')
+
+        assert GlobalConfig.load(config).aliases == {"gpu": "user@gpu2.cluster"}
+
     def test_load_empty_file(self, tmp_path):
         """Returns empty config for empty file."""
         config = tmp_path / "config.toml"
@@ -65,7 +89,7 @@ prefer = "GPU_SKU:H100_SXM5"
         hc = result.hosts["sherlock"]
         assert hc.code_dir == "/home/groups/rhiju/hmblair"
         assert hc.run_dir == "/scratch/users/hmblair"
-        assert hc.modules == ["python/3.12", "cuda/12.4.0"]
+        assert hc.modules == ("python/3.12", "cuda/12.4.0")
         assert hc.cpu_partition == "biochem"
         assert hc.gpu_partition == "rhiju"
         assert hc.gres == "gpu:1"
@@ -218,6 +242,14 @@ cluster = "user@host2.example.com"
         assert "Duplicate key" in str(exc.value)
         assert str(config) in str(exc.value)
 
+    def test_unreadable_file_raises_config_error(self, tmp_path):
+        """Read errors surface as ConfigError."""
+        config = tmp_path / "config.toml"
+        config.mkdir()
+
+        with pytest.raises(ConfigError, match="Cannot read"):
+            GlobalConfig.load(config)
+
 
 class TestExpandAlias:
     """Tests for GlobalConfig.expand_alias method."""
@@ -314,7 +346,7 @@ class TestHostConfigDefaults:
 
         assert hc.code_dir is None
         assert hc.run_dir is None
-        assert hc.modules == []
+        assert hc.modules == ()
         assert hc.cpu_partition is None
         assert hc.gpu_partition is None
         assert hc.gres is None
@@ -327,6 +359,13 @@ class TestHostConfigDefaults:
         assert hc.slurm is False
         assert hc.env == {}
 
+    def test_read_only(self):
+        """Loaded host configs cannot be modified."""
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            HostConfig().code_dir = "/x"
+
 
 class TestKnownHostFields:
     """Tests for KNOWN_HOST_FIELDS constant."""
@@ -226,6 +226,26 @@ class TestMergeConfigs:
         assert gres is None
         assert use_gpu is False
 
+    def test_host_constraint_prefer_only_on_gpu(self, tmp_path):
+        """Host constraint/prefer are GPU-only; project values always apply."""
+        args = make_args()
+        project = make_project(tmp_path, prefer="fast")
+        host_config = HostConfig(
+            cpu_partition="cpu",
+            gpu_partition="gpu",
+            constraint="GPU_SKU:H100",
+            prefer="GPU_SKU:A100",
+            time="1:00:00",
+        )
+
+        _, _, time, _, _, constraint, prefer, _, _, _ = merge_configs(
+            args, project, host_config
+        )
+
+        assert constraint is None
+        assert prefer == "fast"
+        assert time == "1:00:00"
+
     def test_env_merged(self, tmp_path):
         """Environment variables are merged (host < project)."""
         args = make_args()
@@ -170,6 +170,77 @@ class TestProjectConfigFindAndLoad:
 
         assert result is not None
 
+    def test_repeated_load_is_memoized(self, tmp_path):
+        """Repeated lookups reuse the parsed config."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "my-project"')
+
+        first = ProjectConfig.find_and_load(tmp_path)
+        second = ProjectConfig.find_and_load(tmp_path)
+
+        assert first is second
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Changing the file invalidates the memoized config."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "old"')
+        ProjectConfig.find_and_load(tmp_path)
+
+        config.write_text('name = "renamed"')
+
+        result = ProjectConfig.find_and_load(tmp_path)
+        assert result is not None
+        assert result.name == "renamed"
+
+    def test_lookup_skips_exists_checks(self, tmp_path, mocker):
+        """Candidate files are stat'ed once by the loader, not probed first."""
+        (tmp_path / ".rex.toml").write_text('name = "my-project"')
+        subdir = tmp_path / "a" / "b"
+        subdir.mkdir(parents=True)
+        exists = mocker.patch.object(Path, "exists")
+
+        assert ProjectConfig.find_and_load(subdir).name == "my-project"
+        assert ProjectConfig.find_and_load(subdir).name == "my-project"
+        exists.assert_not_called()
+
+    def test_stops_at_git_root(self, tmp_path):
+        """A .rex.toml above the enclosing git repository is not used."""
+        (tmp_path / ".rex.toml").write_text('name = "outer"')
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        subdir = repo / "src"
+        subdir.mkdir()
+
+        assert ProjectConfig.find_and_load(subdir) is None
+
+    def test_stops_at_worktree_or_submodule_root(self, tmp_path):
+        """A .git file (worktree, submodule) also marks the project root."""
+        (tmp_path / ".rex.toml").write_text('name = "outer"')
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / ".git").write_text("gitdir: ../.git/modules/sub\n")
+
+        assert ProjectConfig.find_and_load(sub) is None
+
+    def test_config_at_git_root_is_found(self, tmp_path):
+        """The git root itself is still checked for .rex.toml."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".rex.toml").write_text('name = "my-project"')
+        subdir = tmp_path / "src"
+        subdir.mkdir()
+
+        assert ProjectConfig.find_and_load(subdir).name == "my-project"
+
+    def test_removed_file_is_not_returned(self, tmp_path):
+        """A memoized config whose file was deleted is not returned."""
+        config = tmp_path / ".rex.toml"
+        config.write_text('name = "my-project"')
+        ProjectConfig.find_and_load(tmp_path)
+
+        config.unlink()
+
+        assert ProjectConfig.find_and_load(tmp_path) is None
+
 
 class TestKnownFields:
     """Tests for KNOWN_FIELDS constant."""
@@ -7,6 +7,14 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the on-disk rex cache out of the real home directory."""
+    cache = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    return cache / "rex"
+
+
 @pytest.fixture
 def mock_subprocess(mocker):
     """Mock subprocess.run for SSH/rsync commands."""
@@ -1,6 +1,10 @@
 """Tests for direct (non-SLURM) execution."""
 
 import json
+import os
+import shutil
+import subprocess
+import time
 
 import pytest
 from unittest.mock import MagicMock, patch, call
@@ -45,16 +49,33 @@ class TestDirectExecutorExecForeground:
         assert result == 42
 
     def test_exec_foreground_writes_metadata(self, mock_ssh):
-        """exec_foreground writes job metadata after completion."""
+        """exec_foreground writes job metadata in the streamed call."""
         executor = DirectExecutor(mock_ssh)
         ctx = ExecutionContext()
 
-        with patch("rex.execution.direct.write_job_meta") as mock_meta:
-            executor.exec_foreground(ctx, "echo hello")
+        executor.exec_foreground(ctx, "echo hello")
 
-        mock_meta.assert_called_once()
-        args = mock_meta.call_args[0]
-        assert args[0] is mock_ssh
+        mock_ssh.exec.assert_not_called()
+        assert "~/.rex/jobs/" in mock_ssh.exec_streaming.call_args[0][0]
+
+    @pytest.mark.skipif(not shutil.which("bash"), reason="needs bash")
+    def test_one_call_writes_runs_and_records(self, tmp_path, monkeypatch):
+        """Script, log and metadata all come from the single streamed call."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        def run(cmd):
+            return subprocess.run(["bash", "-c", cmd], capture_output=True).returncode
+
+        ssh = MagicMock()
+        ssh.exec_streaming.side_effect = run
+
+        code = DirectExecutor(ssh).exec_foreground(ExecutionContext(), "echo hi; exit 3")
+
+        assert code == 3
+        (meta,) = (tmp_path / ".rex" / "jobs").iterdir()
+        log = json.loads(meta.read_text())["log"]
+        assert (tmp_path / log.removeprefix("~/")).read_text() == "hi\n"
+        assert not list((tmp_path / ".rex").glob("*.sh"))
 
 
 class TestDirectExecutorExecDetached:
@@ -170,6 +191,90 @@ class TestDirectExecutorExecDetached:
         assert "~/.rex/rex-test-job.sh" in nohup_cmd
 
 
+@pytest.mark.skipif(not shutil.which("bash"), reason="needs bash")
+class TestDirectExecDetachedShell:
+    """Run exec_detached's remote commands with a local bash."""
+
+    def test_writes_and_launches_in_one_call(self, tmp_path, monkeypatch):
+        """The script write, nohup launch and metadata share one SSH call."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        def run(cmd):
+            proc = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True)
+            return proc.returncode, proc.stdout, proc.stderr
+
+        ssh = MagicMock()
+        ssh.exec.side_effect = run
+        info = DirectExecutor(ssh).exec_detached(ExecutionContext(), "echo hi", "t1")
+
+        ssh.exec.assert_called_once()
+        assert info.pid
+        meta = json.loads((tmp_path / ".rex" / "jobs" / "t1.json").read_text())
+        assert meta["pid"] == info.pid
+        log = tmp_path / ".rex" / "rex-t1.log"
+        for _ in range(50):
+            if "hi" in log.read_text():
+                break
+            time.sleep(0.1)
+        assert "hi" in log.read_text()
+
+    def test_foreground_job_reported_running(self, tmp_path, monkeypatch):
+        """While a foreground job runs, list_jobs and get_statuses see it running."""
+        import threading
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        def run(cmd):
+            proc = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True)
+            return proc.returncode, proc.stdout, proc.stderr
+
+        ssh = MagicMock()
+        ssh.exec.side_effect = run
+        ssh.exec_streaming.side_effect = lambda cmd: subprocess.run(
+            ["bash", "-c", cmd], capture_output=True
+        ).returncode
+        executor = DirectExecutor(ssh)
+        job = threading.Thread(
+            target=executor.exec_foreground, args=(ExecutionContext(), "sleep 2")
+        )
+        job.start()
+        try:
+            jobs_dir = tmp_path / ".rex" / "jobs"
+            for _ in range(50):
+                if any(p.stat().st_size for p in jobs_dir.glob("*.json")):
+                    break
+                time.sleep(0.05)
+            job_id = next(jobs_dir.glob("*.json")).stem
+
+            assert [j.status for j in executor.list_jobs()] == ["running"]
+            assert executor.get_statuses([job_id])[job_id].status == "running"
+        finally:
+            job.join()
+        assert executor.get_statuses([job_id])[job_id].status == "completed"
+
+    def test_meta_cmd_expands_shell_pid(self, tmp_path, monkeypatch):
+        """A shell-variable pid lands in the metadata as a JSON number."""
+        from rex.execution.base import job_meta_cmd
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        cmd = job_meta_cmd("t1", "~/l.log", pid="$pid", slurm_id=7)
+        subprocess.run(["bash", "-c", f"pid=4242; {cmd}"], check=True)
+
+        meta = json.loads((tmp_path / ".rex" / "jobs" / "t1.json").read_text())
+        assert meta == {"log": "~/l.log", "slurm_id": 7, "pid": 4242}
+
+    def test_failed_write_launches_nothing(self):
+        """A failed script write raises before anything runs."""
+        from rex.exceptions import ExecutionError
+
+        ssh = MagicMock()
+        ssh.exec.return_value = (1, "", "read-only file system")
+
+        with pytest.raises(ExecutionError, match="read-only"):
+            DirectExecutor(ssh).exec_detached(ExecutionContext(), "echo hi", "t1")
+        ssh.exec.assert_called_once()
+
+
 class TestDirectWriteScript:
     """Tests for DirectExecutor._write_script."""
 
@@ -190,6 +295,15 @@ class TestDirectWriteScript:
         assert "chmod +x" in write_call
         assert "#!/bin/bash" in write_call
 
+    def test_creates_directory_in_same_call(self, mock_ssh):
+        """The parent directory is created by the write itself."""
+        executor = DirectExecutor(mock_ssh)
+        executor.exec_foreground(ExecutionContext(), "echo hi")
+
+        cmd = mock_ssh.exec_streaming.call_args[0][0]
+        assert cmd.startswith("mkdir -p ~/.rex && cat > ~/.rex/rex-")
+        mock_ssh.exec.assert_not_called()
+
     def test_raises_on_failure(self, mock_ssh):
         """_write_script raises ExecutionError when ssh.exec fails."""
         from rex.exceptions import ExecutionError
@@ -210,37 +324,51 @@ class TestDirectListJobs:
         ssh.exec.return_value = (0, "", "")
         return ssh
 
-    def test_reads_metadata_and_checks_pid(self, mock_ssh):
-        """list_jobs reads metadata files and checks PID status."""
-        with patch("rex.execution.direct.list_job_meta_names", return_value=["job-1", "job-2"]), \
-             patch("rex.execution.direct.read_job_meta") as mock_read:
-            mock_read.side_effect = [
-                {"pid": 100, "log": "/tmp/1.log"},
-                {"pid": 200, "log": "/tmp/2.log"},
-            ]
-            # job-1 running, job-2 completed
-            mock_ssh.exec.side_effect = [
-                (0, "", ""),   # kill -0 100: alive
-                (1, "", ""),   # kill -0 200: dead
-            ]
-            executor = DirectExecutor(mock_ssh)
-            jobs = executor.list_jobs()
-
-        assert len(jobs) == 2
-        assert jobs[0].status == "running"
-        assert jobs[0].pid == 100
-        assert jobs[1].status == "completed"
-        assert jobs[1].pid is None
-
-    def test_no_pid_means_completed(self, mock_ssh):
-        """Jobs without a PID are treated as completed."""
-        with patch("rex.execution.direct.list_job_meta_names", return_value=["job-1"]), \
-             patch("rex.execution.direct.read_job_meta", return_value={"log": "/tmp/1.log"}):
-            executor = DirectExecutor(mock_ssh)
-            jobs = executor.list_jobs()
+    def test_one_call_for_all_jobs(self, mock_ssh):
+        """list_jobs parses one remote listing of every job."""
+        mock_ssh.exec.return_value = (0, "job-1 running 100\njob-2 completed\n", "")
+        jobs = DirectExecutor(mock_ssh).list_jobs()
+
+        mock_ssh.exec.assert_called_once()
+        assert "sed" not in mock_ssh.exec.call_args[0][0]  # no per-file fork
+        assert [(j.job_id, j.status, j.pid) for j in jobs] == [
+            ("job-1", "running", 100), ("job-2", "completed", None),
+        ]
+        assert jobs[0].hostname == "user@host"
+
+    @pytest.mark.skipif(not shutil.which("bash"), reason="needs bash")
+    @pytest.mark.parametrize("since, expected", [
+        (0, ["live", "recent", "no-pid", "old"]),
+        (60, ["live", "recent", "no-pid"]),
+    ])
+    def test_remote_listing(self, tmp_path, monkeypatch, since, expected):
+        """Running jobs always show; finished ones are filtered by age remotely."""
+        jobs_dir = tmp_path / ".rex" / "jobs"
+        jobs_dir.mkdir(parents=True)
+        metas = {
+            "old": {"log": "/o.log", "pid": 999999999},
+            "no-pid": {"log": "/n.log"},
+            "recent": {"log": "/r.log", "pid": 999999998},
+            "live": {"log": "/l.log", "pid": os.getpid()},
+        }
+        for i, (name, meta) in enumerate(metas.items()):
+            path = jobs_dir / f"{name}.json"
+            path.write_text(json.dumps(meta))
+            os.utime(path, (time.time() + i, time.time() + i))
+        os.utime(jobs_dir / "old.json", (0, 0))
+        os.utime(jobs_dir / "live.json", (0, 0))
+        (jobs_dir / "empty.json").write_text("")
+        monkeypatch.setenv("HOME", str(tmp_path))
 
-        assert len(jobs) == 1
-        assert jobs[0].status == "completed"
+        ssh = MagicMock()
+        ssh.exec.side_effect = lambda cmd: (
+            lambda p: (p.returncode, p.stdout, p.stderr)
+        )(subprocess.run(["bash", "-c", cmd], capture_output=True, text=True))
+
+        jobs = DirectExecutor(ssh).list_jobs(since_minutes=since)
+
+        assert sorted(j.job_id for j in jobs) == sorted(expected)
+        assert {j.job_id: j.status for j in jobs}["live"] == "running"
 
 
 class TestDirectGetStatus:
@@ -255,7 +383,7 @@ class TestDirectGetStatus:
     def test_running(self, mock_ssh):
         """get_status returns running when PID is alive."""
         mock_ssh.exec.return_value = (0, "", "")
-        with patch("rex.execution.direct.read_job_meta", return_value={"pid": 42}):
+        with patch("rex.execution.base.read_job_meta", return_value={"pid": 42}):
             executor = DirectExecutor(mock_ssh)
             status = executor.get_status("job-1")
 
@@ -265,7 +393,7 @@ class TestDirectGetStatus:
     def test_completed(self, mock_ssh):
         """get_status returns completed when PID is dead."""
         mock_ssh.exec.return_value = (1, "", "")
-        with patch("rex.execution.direct.read_job_meta", return_value={"pid": 42}):
+        with patch("rex.execution.base.read_job_meta", return_value={"pid": 42}):
             executor = DirectExecutor(mock_ssh)
             status = executor.get_status("job-1")
 
@@ -274,12 +402,103 @@ class TestDirectGetStatus:
 
     def test_no_metadata(self, mock_ssh):
         """get_status returns unknown when metadata is missing."""
-        with patch("rex.execution.direct.read_job_meta", return_value=None):
+        with patch("rex.execution.base.read_job_meta", return_value=None):
             executor = DirectExecutor(mock_ssh)
             status = executor.get_status("job-1")
 
         assert status.status == "unknown"
 
+    def test_recent_answer_is_reused(self, mock_ssh):
+        """A second lookup within STATUS_TTL skips SSH unless forced."""
+        mock_ssh.exec.return_value = (0, "", "")
+        with patch("rex.execution.base.read_job_meta", return_value={"pid": 42}) as meta:
+            executor = DirectExecutor(mock_ssh)
+            executor.get_status("job-1")
+            executor.get_status("job-1")
+            assert mock_ssh.exec.call_count == 1
+
+            executor.get_status("job-1", force=True)
+            assert mock_ssh.exec.call_count == 2
+            assert meta.call_count == 1  # metadata is read once
+
+    def test_metadata_read_once(self, mock_ssh):
+        """Log path and kill reuse the metadata read for the status check."""
+        mock_ssh.exec.return_value = (0, "", "")
+        with patch(
+            "rex.execution.base.read_job_meta", return_value={"pid": 42, "log": "/l.log"}
+        ) as meta:
+            executor = DirectExecutor(mock_ssh)
+            executor.get_status("job-1")
+            assert executor.get_log_path("job-1") == "/l.log"
+            executor.kill_job("job-1")
+
+        meta.assert_called_once()
+
+    def test_missing_metadata_not_cached(self, mock_ssh):
+        """A job whose metadata is not there yet is looked up again."""
+        with patch("rex.execution.base.read_job_meta", return_value=None) as meta:
+            executor = DirectExecutor(mock_ssh)
+            executor.get_log_path("job-1")
+            executor.get_log_path("job-1")
+
+        assert meta.call_count == 2
+
+    def test_watch_reuses_preceding_status(self, mock_ssh):
+        """watch_job right after get_status does not query the finished job again."""
+        mock_ssh.exec.return_value = (1, "", "")
+        with patch("rex.execution.base.read_job_meta", return_value={"pid": 42}):
+            executor = DirectExecutor(mock_ssh)
+            executor.get_status("job-1")
+            result = executor.watch_job("job-1", poll_interval=0)
+
+        assert result.status == "completed"
+        mock_ssh.exec.assert_called_once()
+
+
+class TestDirectGetStatuses:
+    """Tests for DirectExecutor.get_statuses."""
+
+    def test_one_call_for_all_jobs(self):
+        """All jobs are checked in a single remote loop."""
+        ssh = MagicMock()
+        ssh.exec.return_value = (0, "a running 42\nb completed\nc unknown\n", "")
+        statuses = DirectExecutor(ssh).get_statuses(["a", "b", "c"])
+
+        ssh.exec.assert_called_once()
+        assert statuses["a"].status == "running"
+        assert statuses["a"].pid == 42
+        assert statuses["b"].status == "completed"
+        assert statuses["c"].status == "unknown"
+
+    def test_failed_call_is_unknown(self):
+        """A failed SSH call leaves every job unknown."""
+        ssh = MagicMock()
+        ssh.exec.return_value = (255, "", "")
+        statuses = DirectExecutor(ssh).get_statuses(["a", "b"])
+
+        assert [s.status for s in statuses.values()] == ["unknown", "unknown"]
+
+    @pytest.mark.skipif(not shutil.which("bash"), reason="needs bash")
+    def test_remote_loop_reads_meta(self, tmp_path, monkeypatch):
+        """The remote loop parses pids from metadata and probes them."""
+        jobs = tmp_path / ".rex" / "jobs"
+        jobs.mkdir(parents=True)
+        (jobs / "live.json").write_text(json.dumps({"log": "/x.log", "pid": os.getpid()}))
+        (jobs / "dead.json").write_text(json.dumps({"log": "/y.log", "pid": 999999999}))
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        def run(cmd):
+            proc = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True)
+            return proc.returncode, proc.stdout, proc.stderr
+
+        ssh = MagicMock()
+        ssh.exec.side_effect = run
+        statuses = DirectExecutor(ssh).get_statuses(["live", "dead", "gone"])
+
+        assert statuses["live"].pid == os.getpid()
+        assert statuses["dead"].status == "completed"
+        assert statuses["gone"].status == "unknown"
+
 
 class TestDirectKillJob:
     """Tests for DirectExecutor.kill_job."""
@@ -293,7 +512,7 @@ class TestDirectKillJob:
     def test_sends_kill(self, mock_ssh):
         """kill_job sends kill signal to PID."""
         mock_ssh.exec.return_value = (0, "", "")
-        with patch("rex.execution.direct.read_job_meta", return_value={"pid": 42}):
+        with patch("rex.execution.base.read_job_meta", return_value={"pid": 42}):
             executor = DirectExecutor(mock_ssh)
             result = executor.kill_job("job-1")
 
@@ -302,7 +521,7 @@ class TestDirectKillJob:
 
     def test_missing_job(self, mock_ssh):
         """kill_job returns False when job not found."""
-        with patch("rex.execution.direct.read_job_meta", return_value=None):
+        with patch("rex.execution.base.read_job_meta", return_value=None):
             executor = DirectExecutor(mock_ssh)
             result = executor.kill_job("nonexistent")
 
@@ -311,7 +530,7 @@ class TestDirectKillJob:
     def test_kill_failure(self, mock_ssh):
         """kill_job returns False when kill fails."""
         mock_ssh.exec.return_value = (1, "", "")
-        with patch("rex.execution.direct.read_job_meta", return_value={"pid": 42}):
+        with patch("rex.execution.base.read_job_meta", return_value={"pid": 42}):
             executor = DirectExecutor(mock_ssh)
             result = executor.kill_job("job-1")
 
@@ -341,6 +560,60 @@ class TestDirectWatchJob:
         assert result.status == "completed"
         assert result.exit_code == 0
 
+    def test_waits_remotely_on_pid(self, mock_ssh):
+        """While running, watch_job blocks in a remote kill -0 loop."""
+        with patch.object(DirectExecutor, "get_status") as mock_status:
+            from rex.execution.base import JobStatus
+            mock_status.side_effect = [
+                JobStatus(job_id="job-1", status="running", pid=42),
+                JobStatus(job_id="job-1", status="completed"),
+            ]
+            executor = DirectExecutor(mock_ssh)
+            executor.watch_job("job-1", poll_interval=5)
+
+        mock_ssh.exec.assert_called_once()
+        wait_cmd = mock_ssh.exec.call_args[0][0]
+        assert "kill -0 42" in wait_cmd
+        assert "sleep 5" in wait_cmd
+
+    def test_follow_log_streams_while_waiting(self, mock_ssh):
+        """follow_log tails the log in the same session as the kill -0 loop."""
+        with patch.object(DirectExecutor, "get_status") as mock_status, \
+             patch.object(DirectExecutor, "get_log_path", return_value="~/.rex/j.log"):
+            from rex.execution.base import JobStatus
+            mock_status.side_effect = [
+                JobStatus(job_id="job-1", status="running", pid=42),
+                JobStatus(job_id="job-1", status="running", pid=42),
+                JobStatus(job_id="job-1", status="completed"),
+            ]
+            executor = DirectExecutor(mock_ssh)
+            result = executor.watch_job("job-1", poll_interval=5, follow_log=True)
+
+        assert result.status == "completed"
+        mock_ssh.exec.assert_not_called()
+        first, second = (c[0][0] for c in mock_ssh.exec_streaming.call_args_list)
+        assert "tail -n +1 -F ~/.rex/j.log" in first
+        assert "kill -0 42" in first
+        assert "tail -n 0 -F" in second  # no repeated output after a reconnect
+
+    @pytest.mark.skipif(not shutil.which("bash"), reason="needs bash")
+    def test_follow_while_runs_in_bash(self, tmp_path, capfd):
+        """The remote follow script prints the log and stops when the check fails."""
+        from rex.execution.base import follow_while
+
+        log = tmp_path / "job.log"
+        log.write_text("line one\n")
+        flag = tmp_path / "running"
+        flag.touch()
+        ssh = MagicMock()
+        ssh.exec_streaming.side_effect = lambda cmd, tty: subprocess.run(
+            ["bash", "-c", f"(sleep 0.5; rm {flag}) & {cmd}"]
+        ).returncode
+
+        follow_while(ssh, f"[ -e {flag} ]", str(log), 1)
+
+        assert "line one" in capfd.readouterr().out
+
     def test_connection_failures(self, mock_ssh):
         """watch_job gives up after 3 consecutive failures."""
         with patch.object(DirectExecutor, "get_status") as mock_status:
@@ -9,7 +9,7 @@ from __future__ import annotations
 import pytest
 from unittest.mock import MagicMock, patch, call
 
-from rex.execution.base import ExecutionContext, JobInfo
+from rex.execution.base import ExecutionContext, JobInfo, job_meta_dir
 from rex.execution.direct import DirectExecutor
 from rex.execution.slurm import SlurmExecutor, SlurmOptions
 
@@ -78,25 +78,17 @@ class TestExecForegroundContract:
         assert "Submitted:" not in captured.out
 
     def test_writes_metadata(self, executor, mock_ssh):
-        """exec_foreground writes job metadata after completion."""
+        """exec_foreground writes job metadata in the streamed command."""
         ctx = ExecutionContext()
-        with patch("rex.execution.direct.write_job_meta") as dm, \
-             patch("rex.execution.slurm.write_job_meta") as sm:
-            executor.exec_foreground(ctx, "echo hello")
-            meta_mock = dm if isinstance(executor, DirectExecutor) else sm
-            meta_mock.assert_called_once()
+        executor.exec_foreground(ctx, "echo hello")
+        assert job_meta_dir() in mock_ssh.exec_streaming.call_args[0][0]
+        mock_ssh.exec.assert_not_called()
 
     def test_metadata_uses_fixed_location(self, executor, mock_ssh):
-        """Job metadata always written via write_job_meta (-> ~/.rex/jobs/)."""
+        """Job metadata always goes to ~/.rex/jobs/, whatever the run_dir."""
         ctx = ExecutionContext(run_dir="/some/project")
-        with patch("rex.execution.direct.write_job_meta") as dm, \
-             patch("rex.execution.slurm.write_job_meta") as sm:
-            executor.exec_foreground(ctx, "echo hello")
-            meta_mock = dm if isinstance(executor, DirectExecutor) else sm
-            # write_job_meta always writes to ~/.rex/jobs/ internally
-            meta_mock.assert_called_once()
-            args = meta_mock.call_args[0]
-            assert args[0] is mock_ssh  # first arg is ssh
+        executor.exec_foreground(ctx, "echo hello")
+        assert f"> {job_meta_dir()}/" in mock_ssh.exec_streaming.call_args[0][0]
 
 
 class TestExecDetachedContract:
@@ -130,11 +122,15 @@ class TestExecDetachedContract:
         else:
             mock_ssh.exec.return_value = (0, "99999", "")
         ctx = ExecutionContext()
-        with patch("rex.execution.direct.write_job_meta") as dm, \
+        with patch("rex.execution.base.write_job_meta") as dm, \
              patch("rex.execution.slurm.write_job_meta") as sm:
             executor.exec_detached(ctx, "echo hello", "test-job")
-            meta_mock = dm if isinstance(executor, DirectExecutor) else sm
-            meta_mock.assert_called_once()
+            if isinstance(executor, DirectExecutor):
+                # Folded into the launch command
+                dm.assert_not_called()
+                assert job_meta_dir() in mock_ssh.exec.call_args[0][0]
+            else:
+                sm.assert_called_once()
 
 
 class TestContextContract:
@@ -170,3 +166,14 @@ class TestContextContract:
 
         streaming_cmd = mock_ssh.exec_streaming.call_args[0][0]
         assert "/projects/myexp/.rex/" in streaming_cmd
+
+
+def test_base_executor_requires_query_status(mock_ssh):
+    """A backend without _query_status fails at construction, not first poll."""
+    from rex.execution.base import BaseExecutor
+
+    class Incomplete(BaseExecutor):
+        pass
+
+    with pytest.raises(TypeError, match="_query_status"):
+        Incomplete(mock_ssh)
@@ -60,13 +60,18 @@ class TestSlurmExecForeground:
         result = executor.exec_foreground(ctx, "exit 7")
         assert result == 7
 
-    def test_heredoc_collision_returns_error(self, mock_ssh):
-        """exec_foreground returns 1 when command contains REXCMD delimiter."""
+    def test_command_with_delimiter_name_runs(self, mock_ssh):
+        """A REXWRITE line in the command does not end the heredoc early."""
         executor = SlurmExecutor(mock_ssh)
         ctx = ExecutionContext()
-        result = executor.exec_foreground(ctx, "echo before\nREXCMD\necho after")
-        assert result == 1
-        mock_ssh.exec_streaming.assert_not_called()
+        executor.exec_foreground(ctx, "echo before\nREXWRITE\necho after")
+
+        lines = mock_ssh.exec_streaming.call_args[0][0].splitlines()
+        start = next(i for i, line in enumerate(lines) if ".cmd << " in line)
+        eof = lines[start].split("'")[1]
+        assert eof.startswith("REXWRITE_")
+        assert lines[start + 1:start + 4] == ["echo before", "REXWRITE", "echo after"]
+        assert lines[start + 4] == eof
 
     def test_writes_separate_cmd_file(self, mock_ssh):
         """exec_foreground writes command to a .cmd file via heredoc."""
@@ -74,14 +79,17 @@ class TestSlurmExecForeground:
         ctx = ExecutionContext()
         executor.exec_foreground(ctx, "python train.py --lr 0.01")
 
-        # Find the heredoc write call for the command file
-        cmd_write = None
-        for args, _ in mock_ssh.exec.call_args_list:
-            if "REXCMD" in args[0]:
-                cmd_write = args[0]
-                break
-        assert cmd_write is not None
-        assert "python train.py --lr 0.01" in cmd_write
+        streaming_cmd = mock_ssh.exec_streaming.call_args[0][0]
+        assert ".cmd << 'REXWRITE_" in streaming_cmd
+        assert "python train.py --lr 0.01" in streaming_cmd
+
+    def test_single_ssh_call(self, mock_ssh):
+        """Writing both files, metadata and srun share one SSH call."""
+        executor = SlurmExecutor(mock_ssh)
+        executor.exec_foreground(ExecutionContext(), "echo hello")
+
+        mock_ssh.exec.assert_not_called()
+        mock_ssh.exec_streaming.assert_called_once()
 
     def test_cleans_up_scripts(self, mock_ssh):
         """exec_foreground cleans up script files after execution."""
@@ -103,13 +111,19 @@ class TestSlurmExecDetached:
         ctx = ExecutionContext()
         executor.exec_detached(ctx, "echo hello", "test-job")
 
-        sbatch_call = None
-        for args, _ in mock_ssh.exec.call_args_list:
-            if args[0].startswith("sbatch"):
-                sbatch_call = args[0]
-                break
-        assert sbatch_call is not None
-        assert "--parsable" in sbatch_call
+        sbatch_call = _find_exec_call(mock_ssh, "sbatch")
+        assert "sbatch --parsable" in sbatch_call
+
+    def test_writes_and_submits_in_one_call(self, mock_ssh):
+        """The script upload and sbatch submission share one SSH call."""
+        mock_ssh.exec.return_value = (0, "12345", "")
+        executor = SlurmExecutor(mock_ssh)
+        executor.exec_detached(ExecutionContext(), "echo hello", "test-job")
+
+        cmd = _find_exec_call(mock_ssh, "REXWRITE")
+        assert cmd.startswith("mkdir -p ")
+        assert "sbatch --parsable" in cmd.splitlines()[0]
+        assert "#SBATCH --job-name=rex-test-job" in cmd
 
     def test_returns_job_info_with_slurm_id(self, mock_ssh):
         """exec_detached parses SLURM ID from sbatch output."""
@@ -163,7 +177,7 @@ class TestSlurmExecDetached:
     def test_handles_sbatch_failure(self, mock_ssh):
         """exec_detached returns JobInfo with no slurm_id on failure."""
         def side_effect(cmd):
-            if cmd.startswith("sbatch"):
+            if "sbatch --parsable" in cmd:
                 return (1, "", "sbatch: error: invalid partition")
             return (0, "", "")
 
@@ -182,8 +196,8 @@ class TestSlurmListJobs:
     def test_parses_squeue_output(self, mock_ssh):
         """list_jobs correctly parses squeue output."""
         squeue_output = (
-            "     12345 rex-train-001          RUNNING       5:00\n"
-            "     12346 rex-eval-002           PENDING       0:00\n"
+            "12345|rex-train-001|RUNNING\n"
+            "12346|rex-eval-002|PENDING\n"
         )
         mock_ssh.exec.return_value = (0, squeue_output, "")
         executor = SlurmExecutor(mock_ssh)
@@ -214,7 +228,7 @@ class TestSlurmListJobs:
     def test_deduplicates_by_slurm_id(self, mock_ssh):
         """list_jobs deduplicates jobs appearing in both squeue and sacct."""
         mock_ssh.exec.side_effect = [
-            (0, "     12345 rex-job-001          RUNNING       5:00\n", ""),
+            (0, "12345|rex-job-001|RUNNING\n", ""),
             (0, "12345|rex-job-001|RUNNING\n", ""),
         ]
         executor = SlurmExecutor(mock_ssh)
@@ -222,6 +236,17 @@ class TestSlurmListJobs:
 
         assert len(jobs) == 1
 
+    def test_long_names_and_cancelled_by(self, mock_ssh):
+        """Names are not truncated and "CANCELLED by UID" reads as cancelled."""
+        name = "a-very-long-experiment-name-well-past-thirty-chars"
+        mock_ssh.exec.side_effect = [
+            (0, f"12345|rex-{name}|RUNNING\n", ""),
+            (0, "12340|rex-old|CANCELLED by 1000\n12341.batch|batch|COMPLETED\n", ""),
+        ]
+        jobs = SlurmExecutor(mock_ssh).list_jobs(since_minutes=30)
+
+        assert [(j.job_id, j.status) for j in jobs] == [(name, "running"), ("old", "cancelled")]
+
 
 class TestSlurmGetStatus:
     """Tests for SlurmExecutor.get_status."""
@@ -273,6 +298,33 @@ class TestSlurmGetStatus:
         assert status.status == "unknown"
 
 
+class TestSlurmGetStatuses:
+    """Tests for SlurmExecutor.get_statuses."""
+
+    def test_one_call_for_all_jobs(self, mock_ssh):
+        """squeue and sacct answers for every job come from one SSH call."""
+        mock_ssh.exec.return_value = (
+            0,
+            "rex-a RUNNING\nother PENDING\n---\n"
+            "rex-b FAILED\nrex-b COMPLETED\nrex-c CANCELLED by 1000\n",
+            "",
+        )
+        statuses = SlurmExecutor(mock_ssh).get_statuses(["a", "b", "c", "d"])
+
+        mock_ssh.exec.assert_called_once()
+        assert "--name='rex-a,rex-b,rex-c,rex-d'" in mock_ssh.exec.call_args[0][0]
+        assert {k: s.status for k, s in statuses.items()} == {
+            "a": "running", "b": "failed", "c": "cancelled", "d": "completed",
+        }
+
+    def test_squeue_failure_is_unknown(self, mock_ssh):
+        """A failed squeue leaves every job unknown."""
+        mock_ssh.exec.return_value = (1, "", "")
+        statuses = SlurmExecutor(mock_ssh).get_statuses(["a", "b"])
+
+        assert [s.status for s in statuses.values()] == ["unknown", "unknown"]
+
+
 class TestSlurmKillJob:
     """Tests for SlurmExecutor.kill_job."""
 
@@ -294,6 +346,16 @@ class TestSlurmKillJob:
         assert result is False
 
 
+class TestSlurmJobNameQuoting:
+    """Job IDs from the command line are quoted in SLURM commands."""
+
+    def test_kill_quotes_job_id(self, mock_ssh):
+        """A crafted ID cannot inject shell into scancel."""
+        SlurmExecutor(mock_ssh).kill_job("x; rm -rf ~")
+
+        assert mock_ssh.exec.call_args[0][0] == "scancel -n 'rex-x; rm -rf ~'"
+
+
 class TestSlurmWatchJob:
     """Tests for SlurmExecutor.watch_job."""
 
@@ -301,6 +363,7 @@ class TestSlurmWatchJob:
         """watch_job polls until job completes."""
         mock_ssh.exec.side_effect = [
             (0, "RUNNING", ""),
+            (0, "", ""),  # remote wait loop returns
             (0, "", ""), (0, "COMPLETED", ""),  # squeue empty, sacct completed
         ]
         executor = SlurmExecutor(mock_ssh)
@@ -309,6 +372,21 @@ class TestSlurmWatchJob:
         assert result.status == "completed"
         assert result.exit_code == 0
 
+    def test_waits_remotely_while_active(self, mock_ssh):
+        """While the job is active, polling happens in one remote loop."""
+        mock_ssh.exec.side_effect = [
+            (0, "PENDING", ""),
+            (0, "", ""),
+            (0, "", ""), (0, "COMPLETED", ""),
+        ]
+        executor = SlurmExecutor(mock_ssh)
+        executor.watch_job("test-job", poll_interval=10)
+
+        wait_cmd = mock_ssh.exec.call_args_list[1][0][0]
+        assert wait_cmd.startswith("for _ in $(seq 30); do squeue")
+        assert "rex-test-job" in wait_cmd
+        assert "sleep 10" in wait_cmd
+
     def test_returns_failure_status(self, mock_ssh):
         """watch_job returns failure status for failed jobs."""
         mock_ssh.exec.side_effect = [
@@ -1,5 +1,6 @@
 """Integration tests for CLI."""
 
+import importlib
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +17,77 @@ class TestBuildParser:
         assert parser is not None
         assert parser.prog == "rex"
 
+    def test_parser_is_cached(self):
+        """Repeated calls return the same parser instance."""
+        assert build_parser() is build_parser()
+
+    def test_cached_parser_is_reusable(self):
+        """A cached parser does not leak state between parses."""
+        parser = build_parser()
+        first = parser.parse_args(["user@host", "-m", "a", "--jobs"])
+        second = parser.parse_args(["user@host"])
+        assert first.modules == ["a"]
+        assert second.modules == []
+        assert second.jobs is False
+
+    def test_handler_table_resolves(self):
+        """Every dispatch table entry names an existing function."""
+        from rex.cli import _HANDLERS, _handler
+
+        for name in _HANDLERS:
+            assert callable(_handler(name))
+
+    def test_runner_table_covers_commands(self):
+        """Every command flag except --connection has a runner."""
+        from rex.cli import _CMD_FLAGS, _RUNNERS
+
+        assert set(_RUNNERS) == {attr for attr, _ in _CMD_FLAGS} - {"connection"}
+
+    @pytest.mark.parametrize("argv,command", [
+        (["user@host"], None),
+        (["user@host", "--status", "abc"], "status"),
+        (["user@host", "--watch"], "watch"),
+        (["user@host", "--read"], "read_path"),
+        (["user@host", "--exec", ""], None),
+    ])
+    def test_selected_command(self, argv, command):
+        """Validation returns the one selected command attribute."""
+        from rex.cli import _validate_flag_conflicts
+
+        args = build_parser().parse_intermixed_args(argv)
+        assert _validate_flag_conflicts(args) == command
+
+    @pytest.mark.parametrize("argv", [
+        ["user@host", "--stat", "abc"],
+        ["--exec", "ls", "user@host", "-m", "a"],
+        ["user@host", "--push", "a", "b", "-d"],
+        ["-d", "--", "user@host"],
+    ])
+    def test_argparse_matches_intermixed(self, argv):
+        """The argparse fallback agrees with parse_intermixed_args."""
+        from rex.cli import _argparse
+
+        expected = build_parser().parse_intermixed_args(argv)
+        assert vars(_argparse(argv)) == vars(expected)
+
+    def test_argparse_single_pass(self, mocker):
+        """A fully consumed argv is parsed without the intermixed pass."""
+        from rex.cli import _argparse
+
+        spy = mocker.spy(build_parser(), "parse_intermixed_args")
+        _argparse(["user@host", "--stat", "abc"])
+        spy.assert_not_called()
+
+    def test_handler_modules_imported_once(self, mocker):
+        """Handler modules are imported once and reused."""
+        from rex.cli import _handler, _handler_module
+
+        _handler_module.cache_clear()
+        spy = mocker.spy(importlib, "import_module")
+        _handler("get_status")
+        _handler("kill_job")
+        assert spy.call_count == 1
+
     def test_version_flag(self, capsys):
         """--version flag works."""
         parser = build_parser()
@@ -88,6 +160,77 @@ class TestBuildParser:
         args = parser.parse_args(["user@host", "--info"])
         assert args.info is True
 
+class TestVersionFastPath:
+    """Tests for the --version short-circuit."""
+
+    @pytest.mark.parametrize("argv", [["--version"], ["-V"], ["user@host", "-V"]])
+    def test_prints_version(self, argv, capsys):
+        """--version prints the same text as argparse and returns 0."""
+        from rex import __version__
+
+        assert main(argv) == 0
+        assert capsys.readouterr().out == f"rex {__version__}\n"
+
+    def test_after_double_dash_not_version(self):
+        """-V after -- is a positional, not --version."""
+        from rex.cli import _wants_version
+
+        assert not _wants_version(["--", "-V"])
+
+
+class TestMainSlurmValidation:
+    """Tests for SLURM option validation in _main."""
+
+    def test_reports_all_invalid_options(self, mocker, capsys):
+        """Every invalid SLURM option is reported in one error."""
+        from rex.config.global_config import GlobalConfig, HostConfig
+        mocker.patch.object(
+            GlobalConfig, "load",
+            return_value=GlobalConfig(
+                aliases={"hpc": "user@hpc"}, hosts={"hpc": HostConfig(slurm=True)}
+            ),
+        )
+        mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
+
+        result = main(["hpc", "--time", "bad", "--mem", "0G", "--exec", "ls"])
+
+        assert result == 1
+        err = capsys.readouterr().err
+        assert "Invalid time format" in err
+        assert "Invalid memory format" in err
+
+
+class TestMainLogging:
+    """Tests for when logging is configured."""
+
+    def _mock_configs(self, mocker):
+        from rex.config.global_config import GlobalConfig
+        mocker.patch.object(GlobalConfig, "load", return_value=GlobalConfig(aliases={}, hosts={}))
+        mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
+
+    def test_no_logging_setup_on_validation_error(self, mocker):
+        """Invalid invocations never build a log handler."""
+        self._mock_configs(mocker)
+        mock_setup = mocker.patch("rex.output.setup_logging")
+
+        result = main(["user@host", "--debug", "--gpu", "--exec", "ls"])
+
+        assert result == 1
+        mock_setup.assert_not_called()
+
+    def test_logging_setup_only_with_debug(self, mocker):
+        """The log handler is installed only for --debug."""
+        self._mock_configs(mocker)
+        mocker.patch("rex.commands.connection.connect", return_value=0)
+        mock_setup = mocker.patch("rex.output.setup_logging")
+
+        main(["user@host", "--connect"])
+        mock_setup.assert_not_called()
+
+        main(["user@host", "--connect", "--debug"])
+        mock_setup.assert_called_once_with(debug=True)
+
+
 class TestMainExceptionHandling:
     """Tests for main() exception handling."""
 
@@ -152,6 +295,23 @@ class TestMainNoTarget:
         mock_status.assert_called_once_with(None)
         assert result == 0
 
+    def test_connection_with_alias_skips_executor(self, mocker):
+        """--connection expands the alias and never builds an SSH executor."""
+        from rex.config.global_config import GlobalConfig
+        mocker.patch.object(
+            GlobalConfig, "load",
+            return_value=GlobalConfig(aliases={"gpu": "user@gpu.cluster"}, hosts={}),
+        )
+        mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
+        mock_ssh_cls = mocker.patch("rex.ssh.SSHExecutor")
+        mock_status = mocker.patch("rex.commands.connection.connection_status", return_value=0)
+
+        result = main(["gpu", "--connection"])
+
+        assert result == 0
+        mock_status.assert_called_once_with("user@gpu.cluster")
+        mock_ssh_cls.assert_not_called()
+
 
 class TestMainJobNameValidation:
     """Tests for job name validation in main()."""
@@ -174,7 +334,7 @@ class TestMainJobNameValidation:
         mocker.patch.object(GlobalConfig, "load", return_value=GlobalConfig(aliases={}, hosts={}))
         mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
         mock_ssh = mocker.MagicMock()
-        mocker.patch("rex.cli.SSHExecutor", return_value=mock_ssh)
+        mocker.patch("rex.ssh.SSHExecutor", return_value=mock_ssh)
         mock_exec = mocker.patch("rex.commands.exec.exec_command", return_value=0)
 
         result = main(["user@host", "-n", "valid-name_123", "--exec", "echo hi"])
@@ -183,6 +343,33 @@ class TestMainJobNameValidation:
         mock_ssh.check_connection.assert_called_once()
         mock_exec.assert_called_once()
 
+    def test_foreground_exec_invalidates_last_job(self, mocker):
+        """A foreground run creates a job, so the cached --last is dropped."""
+        from rex.config.global_config import GlobalConfig
+        mocker.patch.object(GlobalConfig, "load", return_value=GlobalConfig(aliases={}, hosts={}))
+        mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
+        mocker.patch("rex.ssh.SSHExecutor", return_value=mocker.MagicMock())
+        mocker.patch("rex.commands.exec.exec_command", return_value=3)
+        invalidate = mocker.patch("rex.jobcache.invalidate")
+
+        assert main(["user@host", "--exec", "echo hi"]) == 3
+        invalidate.assert_called_once_with("user@host")
+
+    def test_name_ignored_without_exec(self, mocker):
+        """-n is only validated when --exec will use it."""
+        from rex.config.global_config import GlobalConfig
+        mocker.patch.object(GlobalConfig, "load", return_value=GlobalConfig(aliases={}, hosts={}))
+        mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
+        mocker.patch("rex.ssh.SSHExecutor", return_value=mocker.MagicMock())
+        mock_validate = mocker.patch("rex.utils.validate_job_name")
+        mock_jobs = mocker.patch("rex.commands.jobs.list_jobs", return_value=0)
+
+        result = main(["user@host", "-n", "whatever", "--jobs"])
+
+        assert result == 0
+        mock_validate.assert_not_called()
+        mock_jobs.assert_called_once()
+
 
 class TestFlagConflictValidation:
     """Tests for conflicting flag validation."""
@@ -219,13 +406,25 @@ class TestFlagConflictValidation:
         captured = capsys.readouterr()
         assert "--follow requires --log" in captured.err
 
+    def test_follow_requires_message_two_commands(self, capsys):
+        """Two required commands are joined without a serial comma."""
+        main(["user@host", "--follow", "--jobs"])
+        assert "--follow requires --log or --watch" in capsys.readouterr().err
+
+    def test_empty_exec_is_not_a_command(self, capsys):
+        """--exec "" neither conflicts with another command nor enables modifiers."""
+        assert main(["user@host", "--exec", "", "--login-node"]) == 1
+        err = capsys.readouterr().err
+        assert "--login-node requires --exec" in err
+        assert "Conflicting" not in err
+
     def test_follow_with_log_allowed(self, mocker):
         """--follow with --log is allowed."""
         from rex.config.global_config import GlobalConfig
         mocker.patch.object(GlobalConfig, "load", return_value=GlobalConfig(aliases={}, hosts={}))
         mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
         mock_ssh = mocker.MagicMock()
-        mocker.patch("rex.cli.SSHExecutor", return_value=mock_ssh)
+        mocker.patch("rex.ssh.SSHExecutor", return_value=mock_ssh)
         mocker.patch("rex.execution.base.BaseExecutor.show_log", return_value=0)
 
         # Should not raise conflict error (may fail later due to missing job)
@@ -233,6 +432,21 @@ class TestFlagConflictValidation:
         # Connection check happens, so we get past validation
         mock_ssh.check_connection.assert_called_once()
 
+    @pytest.mark.parametrize("argv", [["--log"], ["--log", "--last"]])
+    def test_log_last_is_one_remote_call(self, mocker, argv):
+        """--log without a job ID streams the newest log without resolving the ID first."""
+        from rex.config.global_config import GlobalConfig
+        mocker.patch.object(GlobalConfig, "load", return_value=GlobalConfig(aliases={}, hosts={}))
+        mocker.patch("rex.config.project.ProjectConfig.find_and_load", return_value=None)
+        mocker.patch("rex.ssh.SSHExecutor", return_value=mocker.MagicMock())
+        last_log = mocker.patch("rex.execution.base.BaseExecutor.show_last_log", return_value=0)
+        last_id = mocker.patch("rex.jobcache.last_job_id")
+
+        assert main(["user@host", *argv, "-f"]) == 0
+
+        last_log.assert_called_once_with(True)
+        last_id.assert_not_called()
+
     def test_clean_requires_build(self, capsys):
         """--clean requires --build."""
         result = main(["user@host", "--clean"])
@@ -247,6 +461,12 @@ class TestFlagConflictValidation:
         captured = capsys.readouterr()
         assert "--last requires" in captured.err
 
+    def test_last_requires_message_lists_commands(self, capsys):
+        """--last error names every job command."""
+        main(["user@host", "--last", "--info"])
+        captured = capsys.readouterr()
+        assert "--last requires --status, --log, --kill, or --watch" in captured.err
+
     def test_since_requires_jobs(self, capsys):
         """--since requires --jobs."""
         result = main(["user@host", "--since", "30"])
@@ -254,6 +474,14 @@ class TestFlagConflictValidation:
         captured = capsys.readouterr()
         assert "--since requires --jobs" in captured.err
 
+    @pytest.mark.parametrize("flag", ["--login-node", "--code-dir"])
+    def test_exec_modifiers_require_exec(self, flag, capsys):
+        """--login-node and --code-dir require --exec."""
+        result = main(["user@host", flag, "--info"])
+        assert result == 1
+        captured = capsys.readouterr()
+        assert f"{flag} requires --exec" in captured.err
+
     def test_single_command_allowed(self, mocker):
         """Single command flag is allowed."""
         mock_status = mocker.patch("rex.commands.connection.connection_status", return_value=0)
@@ -151,3 +151,95 @@ class TestCliSubprocessValidation:
         result = run_rex("testhost", "-n", "invalid name", "--exec", "echo")
         assert result.returncode != 0
         assert "invalid" in result.stderr.lower() or "name" in result.stderr.lower()
+
+
+class TestCliSubprocessStartup:
+    """Test that CLI startup avoids loading command machinery."""
+
+    def test_import_skips_heavy_modules(self):
+        """Importing rex.cli does not load SSH, execution, or config modules."""
+        code = (
+            "import sys, rex.cli; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith(('rex.ssh', 'rex.execution', 'rex.config', 'rex.commands'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_fast_parse_skips_argparse(self):
+        """Common invocations are parsed without importing argparse."""
+        code = (
+            "import sys, rex.cli; rex.cli.fastargs.parse(['host', '--exec', 'ls']); "
+            "print('argparse' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_config_load_skips_logging(self):
+        """Output helpers and config loading do not import logging."""
+        code = (
+            "import sys; from rex.config import GlobalConfig; from rex.output import debug; "
+            "GlobalConfig.load(); debug('x'); print('logging' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_global_config_skips_execution_layer(self):
+        """Loading GlobalConfig does not import the execution or SSH packages."""
+        code = (
+            "import sys; from rex.config import GlobalConfig; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith(('rex.ssh', 'rex.execution', 'rex.config.resolved'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_job_command_skips_transfer_and_slurm(self, tmp_path):
+        """A job command on a plain host loads neither transfers nor SLURM."""
+        code = (
+            "import sys; from unittest import mock; import rex.cli; "
+            "mock.patch('rex.ssh.SSHExecutor').start(); "
+            "mock.patch('rex.commands.jobs.list_jobs', return_value=0).start(); "
+            "rex.cli.main(['user@host', '--jobs']); "
+            "print(sorted(m for m in sys.modules "
+            "if m in ('rex.ssh.transfer', 'rex.execution.slurm')))"
+        )
+        env = {**os.environ, "HOME": str(tmp_path), "XDG_CACHE_HOME": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=tmp_path, env=env,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_import_skips_version_lookup(self):
+        """The version is only resolved when it is printed."""
+        code = (
+            "import sys, rex.cli; print('rex._version' in sys.modules); "
+            "rex.cli.main(['--version'])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        loaded, version = result.stdout.splitlines()
+        assert loaded == "False"
+        assert version.startswith("rex ")
+
+    def test_version_skips_argparse(self):
+        """--version is answered without building the argument parser."""
+        code = (
+            "import sys, rex.cli; rex.cli.main(['--version']); "
+            "print(rex.cli.build_parser.cache_info().currsize, file=sys.stderr)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.startswith("rex ")
+        assert result.stderr.strip() == "0"
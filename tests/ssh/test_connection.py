@@ -179,8 +179,8 @@ class TestSSHConnectionListActive:
         socket.touch()
         mocker.patch.object(Path, "is_socket", return_value=True)
 
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_popen = mocker.patch("subprocess.Popen")
+        mock_popen.return_value.wait.return_value = 0
 
         result = SSHConnection.list_active()
 
@@ -196,10 +196,31 @@ class TestSSHConnectionListActive:
         socket.touch()
         mocker.patch.object(Path, "is_socket", return_value=True)
 
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=1)  # SSH check fails
+        mock_popen = mocker.patch("subprocess.Popen")
+        mock_popen.return_value.wait.return_value = 1  # SSH check fails
 
         result = SSHConnection.list_active()
 
         assert result == []
         assert not socket.exists()  # Stale socket removed
+
+    def test_list_active_checks_concurrently(self, mocker, tmp_path):
+        """All socket checks start before any result is awaited."""
+        mocker.patch("rex.ssh.connection.SOCKET_DIR", tmp_path)
+        (tmp_path / "a--host1").touch()
+        (tmp_path / "b--host2").touch()
+        mocker.patch.object(Path, "is_socket", return_value=True)
+
+        events: list[str] = []
+        proc = MagicMock()
+        proc.wait.side_effect = lambda: events.append("wait") or 0
+        mock_popen = mocker.patch(
+            "subprocess.Popen",
+            side_effect=lambda *a, **kw: events.append("start") or proc,
+        )
+
+        result = SSHConnection.list_active()
+
+        assert sorted(t for t, _ in result) == ["a@host1", "b@host2"]
+        assert events == ["start", "start", "wait", "wait"]
+        assert mock_popen.call_count == 2
@@ -5,7 +5,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from rex.exceptions import SSHError
-from rex.ssh.executor import SSHExecutor, SOCKET_DIR
+from rex.ssh.executor import CONTROL_PERSIST, SSHExecutor, SOCKET_DIR, pool_dir
 from rex.utils import shell_quote
 
 
@@ -143,6 +143,68 @@ class TestSSHExecutorInit:
         assert "ServerAliveInterval=60" in opts_str
 
 
+class TestSSHExecutorPool:
+    """Tests for the implicit ControlMaster pool."""
+
+    def test_pool_socket_without_explicit_connection(self, mocker, tmp_path):
+        """Without a --connect socket, a pooled persistent master is used."""
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        executor = SSHExecutor("user@host")
+        socket = pool_dir() / "user--host"
+        assert f"ControlPath={socket}" in executor._opts
+        assert f"ControlPersist={CONTROL_PERSIST}" in executor._opts
+        assert socket.parent.is_dir()
+
+    def test_explicit_socket_preferred(self, mocker, tmp_path):
+        """An existing --connect socket is reused without ControlPersist."""
+        socket_dir = tmp_path / "controlmasters"
+        socket_dir.mkdir()
+        (socket_dir / "user--host").touch()
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", socket_dir)
+
+        executor = SSHExecutor("user@host")
+        assert f"ControlPath={socket_dir / 'user--host'}" in executor._opts
+        assert not any(o.startswith("ControlPersist") for o in executor._opts)
+
+    def test_verbose_skips_pool(self, mocker, tmp_path):
+        """With -v no pooled master is started, so captured calls don't hang."""
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        executor = SSHExecutor("user@host", verbose=True)
+        assert "-v" in executor._opts
+        assert not any(o.startswith(("ControlPersist", "ControlPath")) for o in executor._opts)
+
+    def test_check_connection_reuses_pooled_master(self, mocker, tmp_path):
+        """A live pooled master satisfies check_connection."""
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        executor = SSHExecutor("user@host")
+        executor._pool_socket_path().touch()
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        executor.check_connection()
+
+        assert mock_run.call_count == 1
+        args = mock_run.call_args[0][0]
+        assert args[:3] == ["ssh", "-O", "check"]
+
+    def test_check_connection_removes_stale_pooled_master(self, mocker, tmp_path):
+        """A stale pooled socket is removed before connecting."""
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        executor = SSHExecutor("user@host")
+        pooled = executor._pool_socket_path()
+        pooled.touch()
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = [
+            MagicMock(returncode=1),
+            MagicMock(returncode=0, stderr=""),
+        ]
+
+        executor.check_connection()
+
+        assert not pooled.exists()
+        assert mock_run.call_count == 2
+
+
 class TestSSHExecutorExec:
     """Tests for SSHExecutor.exec method."""
 
@@ -447,6 +509,43 @@ class TestSSHExecutorExecScriptStreaming:
         mock_popen.communicate.assert_called_once()
 
 
+class TestSSHExecutorClose:
+    """Tests for SSHExecutor.close and context manager use."""
+
+    def test_close_exits_pooled_master(self, mocker, tmp_path):
+        """close() asks the pooled master to exit."""
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        mock_run = mocker.patch("subprocess.run")
+
+        with SSHExecutor("user@host") as executor:
+            executor._pool_socket_path().touch()
+
+        args = mock_run.call_args[0][0]
+        assert args[:3] == ["ssh", "-O", "exit"]
+        assert f"ControlPath={pool_dir() / 'user--host'}" in args
+
+    def test_close_without_master_is_noop(self, mocker, tmp_path):
+        """close() runs nothing when no pooled master exists."""
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        mock_run = mocker.patch("subprocess.run")
+
+        SSHExecutor("user@host").close()
+
+        mock_run.assert_not_called()
+
+    def test_close_leaves_connect_master(self, mocker, tmp_path):
+        """A --connect master is never shut down by close()."""
+        socket_dir = tmp_path / "controlmasters"
+        socket_dir.mkdir()
+        (socket_dir / "user--host").touch()
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", socket_dir)
+        mock_run = mocker.patch("subprocess.run")
+
+        SSHExecutor("user@host").close()
+
+        mock_run.assert_not_called()
+
+
 class TestSSHExecutorCheckConnection:
     """Tests for SSHExecutor.check_connection method."""
 
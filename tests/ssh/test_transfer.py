@@ -1,11 +1,14 @@
 """Tests for file transfer operations."""
 
+import os
+import subprocess
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock
 
 from rex.exceptions import TransferError
-from rex.ssh.transfer import FileTransfer, PYTHON_EXCLUDES
+from rex.ssh.transfer import FileTransfer, PYTHON_EXCLUDES, sync_jobs
 
 
 class TestFileTransferPush:
@@ -20,11 +23,12 @@ class TestFileTransferPush:
             transfer.push(nonexistent)
         assert "Path not found" in exc_info.value.message
 
-    def test_push_remote_home_failure(self, mock_ssh_executor, tmp_path):
+    def test_push_remote_home_failure(self, mock_ssh_executor, tmp_path, mocker):
         """Push raises TransferError if remote home lookup fails."""
         transfer = FileTransfer("user@host", mock_ssh_executor)
         test_file = tmp_path / "test.txt"
         test_file.write_text("content")
+        mocker.patch("rex.ssh.transfer.home_relative", return_value="test.txt")
 
         mock_ssh_executor.exec.return_value = (1, "", "error")
 
@@ -38,11 +42,7 @@ class TestFileTransferPush:
         test_file = tmp_path / "test.txt"
         test_file.write_text("content")
 
-        # First call succeeds (echo $HOME), second fails (mkdir)
-        mock_ssh_executor.exec.side_effect = [
-            (0, "/home/user\n", ""),
-            (1, "", "mkdir error"),
-        ]
+        mock_ssh_executor.exec.return_value = (1, "", "mkdir error")
 
         with pytest.raises(TransferError) as exc_info:
             transfer.push(test_file)
@@ -97,6 +97,21 @@ class TestFileTransferPush:
         args = mock_run.call_args[0][0]
         assert "user@host:/custom/path" in args[-1]
 
+    def test_push_accepts_str_path(self, mock_ssh_executor, tmp_path, mocker):
+        """Push accepts a plain string path."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("content")
+
+        mock_ssh_executor.exec.return_value = (0, "", "")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        transfer.push(str(test_file), remote="/custom/path")
+
+        args = mock_run.call_args[0][0]
+        assert args[-2] == str(test_file.resolve())
+
     def test_push_directory(self, mock_ssh_executor, tmp_path, mocker):
         """Push handles directories with trailing slash."""
         transfer = FileTransfer("user@host", mock_ssh_executor)
@@ -218,11 +233,12 @@ class TestFileTransferSync:
             transfer.sync(test_file)
         assert "Directory not found" in exc_info.value.message
 
-    def test_sync_remote_home_failure(self, mock_ssh_executor, tmp_path):
+    def test_sync_remote_home_failure(self, mock_ssh_executor, tmp_path, mocker):
         """Sync raises TransferError if remote home lookup fails."""
         transfer = FileTransfer("user@host", mock_ssh_executor)
         test_dir = tmp_path / "project"
         test_dir.mkdir()
+        mocker.patch("rex.ssh.transfer.home_relative", return_value="project")
 
         mock_ssh_executor.exec.return_value = (1, "", "error")
 
@@ -280,6 +296,260 @@ class TestFileTransferSync:
         # Default excludes should NOT be present
         assert "__pycache__" not in args
 
+    def test_sync_parallel_shards(self, mock_ssh_executor, tmp_path, mocker):
+        """With jobs > 1, top-level entries are split across concurrent rsyncs."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "project"
+        test_dir.mkdir()
+        for name in ("a", "b", "c"):
+            (test_dir / name).write_text("")
+        mock_ssh_executor.exec.return_value = (0, "", "")
+        mock_popen = mocker.patch("subprocess.Popen")
+        mock_popen.return_value.wait.return_value = 0
+
+        transfer.sync(test_dir, remote="/data/project", jobs=2)
+
+        shards = [call[0][0] for call in mock_popen.call_args_list]
+        assert len(shards) == 2
+        assert all(args[0] == "rsync" and args[-1] == "user@host:/data/project/" for args in shards)
+        sources = sorted(a for args in shards for a in args if a.startswith(str(test_dir)))
+        assert sources == [str(test_dir / n) for n in ("a", "b", "c")]
+
+    def test_sync_parallel_failure(self, mock_ssh_executor, tmp_path, mocker):
+        """A failing shard fails the sync."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "project"
+        test_dir.mkdir()
+        (test_dir / "a").write_text("")
+        (test_dir / "b").write_text("")
+        mock_ssh_executor.exec.return_value = (0, "", "")
+        mock_popen = mocker.patch("subprocess.Popen")
+        mock_popen.return_value.wait.side_effect = [0, 23]
+
+        with pytest.raises(TransferError) as exc_info:
+            transfer.sync(test_dir, remote="/data/project", jobs=2)
+        assert "rsync exit 23" in exc_info.value.message
+
+    def test_sync_delete_stays_serial(self, mock_ssh_executor, tmp_path, mocker):
+        """--delete needs the whole tree in one rsync."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "project"
+        test_dir.mkdir()
+        (test_dir / "a").write_text("")
+        (test_dir / "b").write_text("")
+        mock_ssh_executor.exec.return_value = (0, "", "")
+        mock_popen = mocker.patch("subprocess.Popen")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        transfer.sync(test_dir, remote="/data/project", delete=True, jobs=4)
+
+        mock_popen.assert_not_called()
+        assert mock_run.call_args[0][0][-2] == f"{test_dir}/"
+
+    @pytest.mark.parametrize("value,expected", [(None, 1), ("4", 4), ("0", 1), ("x", 1)])
+    def test_sync_jobs_env(self, monkeypatch, value, expected):
+        """REX_SYNC_JOBS sets the default concurrency."""
+        if value is None:
+            monkeypatch.delenv("REX_SYNC_JOBS", raising=False)
+        else:
+            monkeypatch.setenv("REX_SYNC_JOBS", value)
+        assert sync_jobs() == expected
+
+
+class TestFileTransferBulk:
+    """Tests for tar-pipe transfers into fresh destinations."""
+
+    def test_push_dir_to_new_remote_uses_tar(self, mock_ssh_executor, tmp_path, mocker):
+        """A directory push to a missing remote path streams one tar archive."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "mydir"
+        test_dir.mkdir()
+        mock_ssh_executor.exec.return_value = (0, "rex-new-dest\n", "")
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe", return_value=0)
+        mock_run = mocker.patch("subprocess.run")
+
+        transfer.push(test_dir, remote="/data/mydir")
+
+        mock_run.assert_not_called()
+        reader, writer = mock_pipe.call_args[0]
+        assert reader[:2] == ["tar", "-czf"]
+        assert str(test_dir) in reader
+        assert writer[0] == "ssh"
+        assert "tar -xzf - -C '/data/mydir'" in writer[-1]
+
+    def test_push_dir_to_existing_remote_uses_rsync(self, mock_ssh_executor, tmp_path, mocker):
+        """An existing destination keeps rsync's incremental transfer."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "mydir"
+        test_dir.mkdir()
+        mock_ssh_executor.exec.return_value = (0, "", "")
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        transfer.push(test_dir, remote="/data/mydir")
+
+        mock_pipe.assert_not_called()
+        assert mock_run.call_args[0][0][0] == "rsync"
+        assert "test -e '/data/mydir'" in mock_ssh_executor.exec.call_args[0][0]
+
+    def test_push_tar_failure(self, mock_ssh_executor, tmp_path, mocker):
+        """A failing tar pipe raises TransferError."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "mydir"
+        test_dir.mkdir()
+        mock_ssh_executor.exec.return_value = (0, "rex-new-dest\n", "")
+        mocker.patch.object(FileTransfer, "_pipe", return_value=2)
+
+        with pytest.raises(TransferError) as exc_info:
+            transfer.push(test_dir, remote="/data/mydir")
+        assert "tar exit 2" in exc_info.value.message
+
+    def test_sync_to_new_remote_uses_tar(self, mock_ssh_executor, tmp_path, mocker):
+        """A first sync streams one tar archive, honouring the excludes."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "project"
+        test_dir.mkdir()
+        mock_ssh_executor.exec.return_value = (0, "rex-new-dest\n", "")
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe", return_value=0)
+        mock_run = mocker.patch("subprocess.run")
+
+        transfer.sync(test_dir, remote="/data/project", excludes=["*.tmp"])
+
+        mock_run.assert_not_called()
+        reader, writer = mock_pipe.call_args[0]
+        assert "--exclude=*.tmp" in reader
+        assert "tar -xzf - -C '/data/project'" in writer[-1]
+
+    def test_bulk_push_excludes(self, mock_ssh_executor, tmp_path, mocker):
+        """Excluded files are left out of the archive."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        src = tmp_path / "src"
+        (src / "__pycache__").mkdir(parents=True)
+        (src / "__pycache__" / "m.pyc").write_text("")
+        (src / "keep.py").write_text("")
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe", return_value=0)
+
+        transfer.bulk_push(src, "/data/src", excludes=["__pycache__"])
+
+        reader = mock_pipe.call_args[0][0]
+        archive = subprocess.run(reader, capture_output=True, check=True).stdout
+        members = subprocess.run(
+            ["tar", "-tzf", "-"], input=archive, capture_output=True, check=True,
+        ).stdout.decode().split()
+        assert "./keep.py" in members
+        assert not any("__pycache__" in m for m in members)
+
+    def test_bulk_push_rsync_style_excludes(self, mock_ssh_executor, tmp_path, mocker):
+        """Directory ("dir/") and anchored ("/dir") patterns are honoured."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        src = tmp_path / "src"
+        for rel in ("data/x", "outputs/y", "sub/outputs/z", "keep.py"):
+            (src / rel).parent.mkdir(parents=True, exist_ok=True)
+            (src / rel).write_text("")
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe", return_value=0)
+
+        transfer.bulk_push(src, "/data/src", excludes=["data/", "/outputs"])
+
+        reader = mock_pipe.call_args[0][0]
+        archive = subprocess.run(reader, capture_output=True, check=True).stdout
+        members = subprocess.run(
+            ["tar", "-tzf", "-"], input=archive, capture_output=True, check=True,
+        ).stdout.decode().split()
+        assert "./keep.py" in members
+        assert "./sub/outputs/z" in members  # "/outputs" is anchored at the root
+        assert not any(m.startswith(("./data", "./outputs")) for m in members)
+
+    def test_pull_dir_to_new_local_uses_tar(self, mock_ssh_executor, tmp_path, mocker):
+        """Pulling into a new local path streams tar with rsync's layout."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        mock_ssh_executor.exec.return_value = (0, "", "")  # remote is dir
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe", return_value=0)
+
+        new_dir = tmp_path / "new"
+        transfer.pull("/data/results", new_dir)
+
+        # Like rsync host:/data/results new/ -> new/results/...
+        assert (new_dir / "results").is_dir()
+        reader, writer = mock_pipe.call_args[0]
+        assert "tar -czf - -C '/data/results' ." in reader[-1]
+        assert writer == ["tar", "-xzf", "-", "-C", str(new_dir / "results")]
+
+    def test_pull_dir_contents_to_new_local_uses_tar(self, mock_ssh_executor, tmp_path, mocker):
+        """A trailing slash pulls the directory's contents, as with rsync."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        mock_ssh_executor.exec.return_value = (0, "", "")  # remote is dir
+        mock_pipe = mocker.patch.object(FileTransfer, "_pipe", return_value=0)
+
+        new_dir = tmp_path / "new"
+        transfer.pull("/data/results/", new_dir)
+
+        reader, writer = mock_pipe.call_args[0]
+        assert writer == ["tar", "-xzf", "-", "-C", str(new_dir)]
+
+    def test_pipe_returns_first_failure(self):
+        """_pipe reports the reader's failure before the writer's status."""
+        assert FileTransfer._pipe(["echo", "hi"], ["cat"]) == 0
+        assert FileTransfer._pipe(["false"], ["cat"]) == 1
+
+    def test_mirrored_dest_in_one_call(self, mock_ssh_executor, tmp_path, mocker):
+        """Remote home lookup and mkdir share one SSH call."""
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+        test_dir = tmp_path / "project"
+        test_dir.mkdir()
+        mocker.patch("rex.ssh.transfer.home_relative", return_value="code/project")
+        mock_ssh_executor.exec.return_value = (0, "/home/user\n", "")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        transfer.sync(test_dir)
+
+        mock_ssh_executor.exec.assert_called_once()
+        assert mock_run.call_args[0][0][-1] == "user@host:/home/user/code/project/"
+
+    def test_mirrored_dest_script(self, mock_ssh_executor, tmp_path, mocker):
+        """The remote script creates the parent under $HOME and reports new dests."""
+        home = tmp_path / "home"
+        home.mkdir()
+        test_dir = tmp_path / "my project"
+        test_dir.mkdir()
+        mocker.patch("rex.ssh.transfer.home_relative", return_value="code/my project")
+
+        def run_locally(cmd):
+            result = subprocess.run(
+                ["bash", "--norc", "--noprofile", "-c", cmd],
+                capture_output=True, text=True, env={**os.environ, "HOME": str(home)},
+            )
+            return result.returncode, result.stdout, result.stderr
+
+        mock_ssh_executor.exec.side_effect = run_locally
+        transfer = FileTransfer("user@host", mock_ssh_executor)
+
+        remote, is_new = transfer._prepare_dest(test_dir, None, check_new=True)
+
+        assert remote == f"{home}/code/my project"
+        assert is_new
+        assert (home / "code").is_dir()
+
+
+class TestFileTransferSSHOptions:
+    """Tests for rsync's ssh command."""
+
+    def test_rsync_reuses_executor_control_socket(self, mocker, tmp_path):
+        """rsync runs ssh with the executor's own options, sharing its master."""
+        from rex.ssh.executor import SSHExecutor
+
+        mocker.patch("rex.ssh.executor.SOCKET_DIR", tmp_path / "controlmasters")
+        executor = SSHExecutor("user@host")
+        build_opts = mocker.spy(executor, "_build_opts")
+        transfer = FileTransfer("user@host", executor)
+
+        flag, ssh_cmd = transfer._rsync_ssh_arg()
+
+        assert flag == "-e"
+        assert f"ControlPath={executor._pool_socket_path()}" in ssh_cmd
+        build_opts.assert_not_called()
 
 
 class TestPythonExcludes:
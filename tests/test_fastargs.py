@@ -0,0 +1,94 @@
+"""Tests for the fast argv parser."""
+
+import pytest
+
+from rex.cli import build_parser
+from rex.fastargs import OPTIONS, parse
+
+
+class TestParseMatchesArgparse:
+    """Fast parser results must be identical to argparse."""
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["user@host"],
+        ["host", "--exec", "python train.py"],
+        ["host", "-d", "-n", "exp1", "--exec", "echo hi"],
+        ["--exec", "ls", "host"],
+        ["host", "-m", "python/3.11", "-m", "cuda/12", "--exec", "ls"],
+        ["host", "--partition", "gpu", "--gres", "gpu:1", "--time", "1:00:00",
+         "--cpus", "4", "--mem", "16G", "--constraint", "a100", "--prefer", "fast",
+         "--exec", "ls"],
+        ["host", "--gpu", "--exec", "ls"],
+        ["host", "--jobs", "--since", "30", "--json"],
+        ["--jobs"],
+        ["host", "--status"],
+        ["host", "--status", "job1"],
+        ["host", "--log", "--last", "-f"],
+        ["host", "--log", "job1", "--follow"],
+        ["host", "--kill", "job1"],
+        ["host", "--watch"],
+        ["host", "--watch", "a", "b", "c"],
+        ["host", "--watch", "--last"],
+        ["host", "--info"],
+        ["host", "--push", "./data"],
+        ["host", "--push", "./data", "~/data"],
+        ["host", "--pull", "~/results", "./"],
+        ["host", "--sync"],
+        ["host", "--sync", "../proj"],
+        ["host", "--build", "--clean"],
+        ["host", "--exec", "ls", "--login-node", "--code-dir"],
+        ["host", "--read"],
+        ["host", "--read", "~/data"],
+        ["host", "--connect"],
+        ["host", "--disconnect"],
+        ["--connection"],
+        ["host", "--manual"],
+        ["host", "--debug", "--exec", "ls"],
+        ["host", "--exec=echo hi"],
+        ["host", "--status=job1"],
+        ["host", "--exec", ""],
+    ])
+    def test_same_namespace(self, argv):
+        """Fast parse produces the same namespace as argparse."""
+        expected = build_parser().parse_intermixed_args(argv)
+        assert vars(parse(argv)) == vars(expected)
+
+
+class TestParseFallback:
+    """Inputs the fast parser defers to argparse."""
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["-h"],
+        ["--version"],
+        ["-V"],
+        ["host", "--jo"],  # abbreviation
+        ["host", "-df"],  # combined short flags
+        ["host", "--", "--exec"],
+        ["host", "--exec"],  # missing value
+        ["host", "--exec", "-x"],  # value looks like a flag
+        ["host", "--cpus", "four"],
+        ["host", "--push"],
+        ["host", "--jobs=1"],
+        ["host", "extra"],
+        ["-"],
+    ])
+    def test_returns_none(self, argv):
+        """Unhandled input returns None."""
+        assert parse(argv) is None
+
+
+class TestOptionTable:
+    """The option table mirrors build_parser."""
+
+    def test_all_parser_options_known(self):
+        """Every argparse option string is in the fast table (except help/version)."""
+        parser = build_parser()
+        flags = {
+            opt
+            for action in parser._actions
+            for opt in action.option_strings
+        }
+        assert flags - set(OPTIONS) == {"-h", "--help", "-V", "--version"}
+        assert set(OPTIONS) <= flags
@@ -0,0 +1,62 @@
+"""Tests for the last-job cache."""
+
+import time
+from unittest.mock import MagicMock
+
+from rex import jobcache
+
+
+def _executor(job_id):
+    executor = MagicMock()
+    executor.last_job_id.return_value = job_id
+    return executor
+
+
+class TestLastJobCache:
+    """Tests for jobcache.last_job_id/invalidate."""
+
+    def test_miss_queries_executor(self):
+        """First lookup goes to the executor."""
+        executor = _executor("job-1")
+        assert jobcache.last_job_id(executor, "user@host") == "job-1"
+        executor.last_job_id.assert_called_once()
+
+    def test_hit_skips_executor(self):
+        """A fresh entry is reused without querying the remote."""
+        jobcache.last_job_id(_executor("job-1"), "user@host")
+        executor = _executor("job-2")
+        assert jobcache.last_job_id(executor, "user@host") == "job-1"
+        executor.last_job_id.assert_not_called()
+
+    def test_entries_are_per_target(self):
+        """Targets do not share entries."""
+        jobcache.last_job_id(_executor("job-1"), "user@a")
+        assert jobcache.last_job_id(_executor("job-2"), "user@b") == "job-2"
+
+    def test_expired_entry_misses(self, mocker):
+        """Entries older than the TTL are ignored."""
+        jobcache.last_job_id(_executor("job-1"), "user@host")
+        mocker.patch("time.time", return_value=time.time() + jobcache.LAST_JOB_TTL + 1)
+        assert jobcache.last_job_id(_executor("job-2"), "user@host") == "job-2"
+
+    def test_no_job_not_cached(self):
+        """An empty answer is not cached."""
+        assert jobcache.last_job_id(_executor(None), "user@host") is None
+        assert jobcache.last_job_id(_executor("job-1"), "user@host") == "job-1"
+
+    def test_invalidate(self):
+        """invalidate drops the entry."""
+        jobcache.last_job_id(_executor("job-1"), "user@host")
+        jobcache.invalidate("user@host")
+        assert jobcache.last_job_id(_executor("job-2"), "user@host") == "job-2"
+
+    def test_invalidate_missing_entry(self):
+        """invalidate tolerates a missing entry."""
+        jobcache.invalidate("user@host")
+
+    def test_corrupt_entry_misses(self, isolated_cache_dir):
+        """An unreadable entry is ignored."""
+        jobcache.last_job_id(_executor("job-1"), "user@host")
+        for entry in (isolated_cache_dir / "lastjob").iterdir():
+            entry.write_text("{not json")
+        assert jobcache.last_job_id(_executor("job-2"), "user@host") == "job-2"
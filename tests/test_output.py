@@ -11,6 +11,7 @@ from rex.output import (
     error,
     warn,
     info,
+    print_json,
     success,
     debug,
     setup_logging,
@@ -205,3 +206,18 @@ class TestGetLogger:
         """get_logger returns the 'rex' logger."""
         logger = get_logger()
         assert logger.name == "rex"
+
+
+class TestPrintJson:
+    """Tests for print_json function."""
+
+    def test_compact_when_piped(self, capsys):
+        """Piped output has no whitespace between tokens."""
+        print_json({"a": [1, 2]})
+        assert capsys.readouterr().out == '{"a":[1,2]}\n'
+
+    def test_indented_on_terminal(self, mocker, capsys):
+        """Terminal output is indented."""
+        mocker.patch.object(sys.stdout, "isatty", return_value=True)
+        print_json({"a": 1})
+        assert capsys.readouterr().out == '{\n  "a": 1\n}\n'
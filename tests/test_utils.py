@@ -2,6 +2,7 @@
 
 import pytest
 import re
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,10 +12,14 @@ from rex.utils import (
     validate_memory,
     validate_gres,
     validate_cpus,
+    validate_slurm_fields,
     map_to_remote,
     generate_job_name,
     generate_script_id,
+    heredoc_marker,
+    home_relative,
     shell_quote,
+    toml_parser,
 )
 
 
@@ -224,6 +229,28 @@ class TestValidateCpus:
             validate_cpus(-1)
 
 
+class TestValidateSlurmFields:
+    """Tests for validate_slurm_fields function."""
+
+    def test_valid_table(self):
+        """Valid SLURM options pass."""
+        validate_slurm_fields({"time": "1:00:00", "mem": "16G", "gres": "gpu:1", "cpus": 4})
+
+    def test_missing_and_empty_skipped(self):
+        """Absent fields and empty strings are not validated."""
+        validate_slurm_fields({"time": "", "mem": "", "name": "x"})
+
+    def test_invalid_field(self):
+        """The first invalid field raises."""
+        with pytest.raises(ValueError, match="memory"):
+            validate_slurm_fields({"time": "1:00:00", "mem": "lots"})
+
+    def test_zero_cpus_checked(self):
+        """cpus = 0 is validated rather than skipped."""
+        with pytest.raises(ValueError, match="at least 1"):
+            validate_slurm_fields({"cpus": 0})
+
+
 class TestMapToRemote:
     """Tests for map_to_remote function."""
 
@@ -272,6 +299,25 @@ class TestMapToRemote:
         assert result == "/remote/home/a/b/c/d"
 
 
+class TestHomeRelative:
+    """Tests for home_relative function."""
+
+    def test_under_home(self, mocker):
+        """Paths under the local home are returned relative to it."""
+        mocker.patch.object(Path, "resolve", return_value=Path("/home/user/a/b"))
+        assert home_relative(Path("/home/user/a/b")) == "a/b"
+
+    def test_home_itself(self, mocker):
+        """The home directory maps to an empty path."""
+        mocker.patch.object(Path, "resolve", return_value=Path("/Users/user"))
+        assert home_relative(Path("/Users/user")) == ""
+
+    def test_outside_home(self, mocker):
+        """Paths outside the home return None."""
+        mocker.patch.object(Path, "resolve", return_value=Path("/opt/app"))
+        assert home_relative(Path("/opt/app")) is None
+
+
 class TestGenerateJobName:
     """Tests for generate_job_name function."""
 
@@ -400,3 +446,33 @@ class TestShellQuote:
         cmd = '''for f in *.py; do echo "$f"; done'''
         result = shell_quote(cmd)
         assert result == "'" + cmd + "'"
+
+
+class TestHeredocMarker:
+    """Tests for heredoc_marker."""
+
+    def test_stable_per_content(self):
+        """The same content always gets the same marker."""
+        assert heredoc_marker("echo hi", "REXCMD") == heredoc_marker("echo hi", "REXCMD")
+        assert heredoc_marker("echo hi", "REXCMD").startswith("REXCMD_")
+
+    def test_differs_from_plain_base(self):
+        """Content holding the bare base name does not end the heredoc."""
+        content = "echo before\nREXCMD\necho after"
+        assert heredoc_marker(content, "REXCMD") not in content.splitlines()
+
+
+class TestTomlParser:
+    """Tests for toml_parser function."""
+
+    def test_prefers_stdlib(self):
+        """tomllib is used where the stdlib provides it."""
+        expected = "tomllib" if sys.version_info >= (3, 11) else "tomli"
+        assert toml_parser().__name__ == expected
+
+    def test_parses_and_raises(self):
+        """The parser exposes loads and TOMLDecodeError."""
+        parser = toml_parser()
+        assert parser.loads('a = 1') == {"a": 1}
+        with pytest.raises(parser.TOMLDecodeError):
+            parser.loads("a = ")